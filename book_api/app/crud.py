@@ -3,7 +3,6 @@ from sqlalchemy.orm import Session
 from book_api.app.models import Book, Genre
 import logging
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 def get_books(db: Session):
     return db.query(Book).all()
@@ -1,17 +1,48 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from book_api.app.database import engine, Base
 from book_api.app.router import router
+from book_api.config.logging import setup_logging_from_settings
+from book_api.config.settings import get_settings
+from book_api.infrastructure.database.schema import ensure_indexes
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Création des tables au démarrage du serveur, pas à l'import,
+    # et des index absents d'une base existante (ix_books_upc pour /books/stock/by_upc)
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes(engine, Base.metadata)
+    yield
+
+
+def create_app() -> FastAPI:
+    # Journalisation configurée ici plutôt qu'à l'import des modules (écriture par un thread dédié)
+    settings = get_settings()
+    setup_logging_from_settings(settings)
+
+    # Initialisation de l'application FastAPI
+    app = FastAPI(
+        title="BookScrape API",
+        prefix="/api",
+        description="API pour livres et genres",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+
+    # Journal des requêtes lentes et budget de requêtes (BOOK_API_QUERY_INSPECTION=1)
+    if settings.query_inspection:
+        from book_api.infrastructure.monitoring.query_inspector import QueryInspector
+        from book_api.interface.middleware.query_inspection import QueryInspectionMiddleware
+
+        inspector = QueryInspector.from_settings(settings)
+        inspector.install()
+        app.add_middleware(QueryInspectionMiddleware, inspector=inspector)
 
-# Création des tables
-Base.metadata.create_all(bind=engine)
+    # Inclusion des routes
+    app.include_router(router)
+    return app
 
-# Initialisation de l'application FastAPI
-app = FastAPI(
-    title="BookScrape API",
-    prefix="/api",
-    description="API pour livres et genres",
-    version="1.0.0"
-)
 
-# Inclusion des routes
-app.include_router(router)
+app = create_app()
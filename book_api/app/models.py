@@ -14,7 +14,7 @@ class Book(Base):
     note = Column(Integer)
     stock_number = Column(Integer)
     datetime = Column(String)
-    upc = Column(String)
+    upc = Column(String, index=True)
     product_type = Column(String)
     price_ht = Column(Float)
     price_taxed = Column(Float)
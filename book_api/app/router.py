@@ -4,12 +4,12 @@ from sqlalchemy.orm import Session
 from typing import List
 import logging
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 from book_api.app.models import Book, Genre
 from book_api.app.database import SessionLocal
 from book_api.app.schemas import BookSchema, GenreSchema
 from book_api.app.crud import get_books_by_keyword,get_books, get_genres, get_books_by_genre
+from book_api.domain.value_objects.upc import normalize_upc, prefix_upper_bound
 router = APIRouter()
 
 # Dependency pour la session DB
@@ -41,7 +41,7 @@ def average_price_all_books(db: Session = Depends(get_db)):
     books = db.query(Book).all()
     prices = [b.price_taxed for b in books if b.price_taxed is not None]
     avg = round(sum(prices) / len(prices), 2) if prices else 0.0
-    logger.info(f"Moyenne calculée sur {len(prices)} livres valides parmi {len(books)}")
+    logger.info("Moyenne calculée sur %s livres valides parmi %s", len(prices), len(books))
     return {
         "total_books": len(books),
         "books_with_price": len(prices),
@@ -64,7 +64,7 @@ def average_price_by_genre(genre_id: int, db: Session = Depends(get_db)):
     # Calcule la moyenne manuellement
     avg = round(sum(prices) / len(prices), 2) if prices else 0.0
 
-    logger.info(f"Genre {genre.genre} ({genre_id}) → {len(prices)} prix valides sur {len(books)} livres")
+    logger.info("Genre %s (%s) → %s prix valides sur %s livres", genre.genre, genre_id, len(prices), len(books))
 
     return {
         "genre_id": genre_id,
@@ -91,7 +91,7 @@ def average_stock_all_books(db: Session = Depends(get_db)):
     books = db.query(Book).all()
     stock_numbers = [b.stock_number for b in books if b.stock_number is not None]
     avg = round(sum(stock_numbers) / len(stock_numbers), 0) if stock_numbers else 0
-    logger.info(f"Moyenne calculée sur {len(stock_numbers)} livres valides parmi {len(books)}")
+    logger.info("Moyenne calculée sur %s livres valides parmi %s", len(stock_numbers), len(books))
     return {
         "total_books": len(books),
         "books_with_stock": len(stock_numbers),
@@ -114,7 +114,9 @@ def average_stock_by_genre(genre_id: int, db: Session = Depends(get_db)):
     # Calcule la moyenne manuellement
     avg = round(sum(stock_numbers) / len(stock_numbers), 0) if stock_numbers else 0
 
-    logger.info(f"Genre {genre.genre} ({genre_id}) → {len(stock_numbers)} stocks valides sur {len(books)} livres")
+    logger.info(
+        "Genre %s (%s) → %s stocks valides sur %s livres", genre.genre, genre_id, len(stock_numbers), len(books)
+    )
 
     return {
         "genre_id": genre_id,
@@ -130,7 +132,7 @@ def stock_by_title(title: str, db: Session = Depends(get_db)):
     books = db.query(Book).filter(Book.title.ilike(f"%{title}%")).all()
     stocks = [b.stock_number for b in books if b.stock_number is not None]
 
-    logger.info(f"Title '{title}' → {len(stocks)} stocks extraits sur {len(books)} livres")
+    logger.info("Title '%s' → %s stocks extraits sur %s livres", title, len(stocks), len(books))
 
     return {
         "title_query": title,
@@ -141,10 +143,17 @@ def stock_by_title(title: str, db: Session = Depends(get_db)):
 
 @router.get("/books/stock/by_upc/{upc}", tags=["Books"], summary="Get stock values by UPC")
 def stock_by_upc(upc: str, db: Session = Depends(get_db)):
-    books = db.query(Book).filter(Book.upc.ilike(f"%{upc}%")).all()
+    # Recherche exacte ou par préfixe sur l'index ix_books_upc (les UPC sont en hexadécimal minuscule)
+    # au lieu d'un ILIKE '%upc%' qui parcourait toute la table
+    prefix = normalize_upc(upc)
+    if not prefix:
+        raise HTTPException(status_code=400, detail="UPC vide")
+    books = db.query(Book).filter(
+        Book.upc >= prefix, Book.upc < prefix_upper_bound(prefix)
+    ).order_by(Book.upc).all()
     stocks = [b.stock_number for b in books if b.stock_number is not None]
 
-    logger.info(f"UPC '{upc}' → {len(stocks)} stocks extraits sur {len(books)} livres")
+    logger.info("UPC '%s' → %s stocks extraits sur %s livres", upc, len(stocks), len(books))
 
     return {
         "upc_query": upc,
@@ -161,7 +170,7 @@ def stock_by_id(book_id: int, db: Session = Depends(get_db)):
 
     stock = book.stock_number if book.stock_number is not None else 0
 
-    logger.info(f"Book ID {book_id} → stock = {stock}")
+    logger.info("Book ID %s → stock = %s", book_id, stock)
 
     return {
         "book_id": book_id,
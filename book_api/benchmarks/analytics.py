@@ -0,0 +1,130 @@
+"""
+Latency of the aggregate endpoints' service calls.
+
+Loads a synthetic catalog into an in-memory SQLite database, then times the
+average / histogram / percentile / group-by / count calls on BookService with the
+default backend (ORM rows aggregated in Python) and with the NumPy columnar snapshot.
+With --duckdb the catalog is written to a temporary file and the DuckDB backend is
+timed as well. Snapshot and DuckDB loads are reported separately: they are paid
+once per dataset version.
+
+Usage:
+    python -m book_api.benchmarks.analytics --rows 10000 --repeat 20
+    python -m book_api.benchmarks.analytics --rows 1000000 --repeat 5 --duckdb
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.infrastructure.analytics.catalog_snapshot import CatalogSnapshotProvider
+from book_api.infrastructure.analytics.numpy_catalog_analytics import NumpyCatalogAnalytics
+from book_api.infrastructure.database.connection import Base
+from book_api.infrastructure.database.models import BookModel, GenreModel
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+from book_api.use_cases.services.book_service import BookService
+
+GENRES = 50
+
+
+def make_session_factory(rows: int, path: Optional[str] = None):
+    if path is None:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add_all([GenreModel(id=i, genre=f"Genre {i}") for i in range(1, GENRES + 1)])
+        session.add_all([
+            BookModel(
+                id=i,
+                title=f"Book number {i}",
+                genre_id=i % GENRES + 1,
+                note=i % 5 + 1,
+                stock_number=i % 23,
+                price_ht=10 + (i * 7919) % 5000 / 100,
+                price_taxed=12 + (i * 7919) % 5000 / 100,
+                review_number=i % 11,
+            )
+            for i in range(1, rows + 1)
+        ])
+        session.commit()
+    return factory
+
+
+def time_call(call: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--duckdb", action="store_true", help="also time the DuckDB backend (needs duckdb)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # The service logs every call
+
+    workdir = tempfile.TemporaryDirectory()
+    path = os.path.join(workdir.name, "books.db") if args.duckdb else None
+    factory = make_session_factory(args.rows, path)
+    session = factory()
+    python_service = BookService(BookRepository(session), GenreRepository(session))
+    provider = CatalogSnapshotProvider(factory, lambda: "bench")
+    services = {
+        "python": python_service,
+        "numpy": BookService(BookRepository(session), GenreRepository(session), NumpyCatalogAnalytics(provider)),
+    }
+
+    loads = {"snapshot": time_call(lambda: CatalogSnapshotProvider(factory, lambda: "bench").current(), 3)}
+    provider.current()
+
+    if args.duckdb:
+        from book_api.infrastructure.analytics.duckdb_catalog import DuckDBCatalog
+        from book_api.infrastructure.analytics.duckdb_catalog_analytics import DuckDBCatalogAnalytics
+
+        loads["duckdb"] = time_call(lambda: DuckDBCatalog("sqlite", path, lambda: "bench").fetchall("SELECT 1"), 1)
+        catalog = DuckDBCatalog("sqlite", path, lambda: "bench")
+        services["duckdb"] = BookService(
+            BookRepository(session), GenreRepository(session), DuckDBCatalogAnalytics(catalog)
+        )
+
+    calls = {
+        "average price (all)": lambda service: service.calculate_average_price_all(),
+        "average stock (genre)": lambda service: service.calculate_average_stock_by_genre(7),
+        "histogram price_taxed": lambda service: service.calculate_histogram("price_taxed", 20),
+        "percentiles price": lambda service: service.calculate_percentiles("price_taxed", (50, 90, 99)),
+        "genre summary": lambda service: service.calculate_genre_summary(),
+        "count filtered": lambda service: service.count_books(
+            BookCriteria(min_price=20, max_price=40, min_rating=4, in_stock=True)
+        ),
+    }
+
+    print(f"rows: {args.rows}, best of {args.repeat}, " + ", ".join(
+        f"{name} load: {load / 1000:.1f} ms" for name, load in loads.items()
+    ))
+    print(f"{'call':<24}" + "".join(f"{name + ' us':>12}" for name in services) + f"{'best speedup':>14}")
+    for name, call in calls.items():
+        timings = [time_call(lambda: call(service), args.repeat) for service in services.values()]
+        print(f"{name:<24}" + "".join(f"{timing:>12.0f}" for timing in timings) +
+              f"{timings[0] / min(timings):>13.0f}x")
+
+    session.close()
+    workdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Per-request dependency injection overhead.
+
+Drives three tiny FastAPI apps straight through ASGI (no HTTP, no database work):
+  - baseline:  endpoint without dependencies
+  - per-request graph: the original chain (two session providers, two
+    repositories and a service built on every request)
+  - container: app-scoped services plus a lazily opened request session
+
+Usage:
+    python -m book_api.benchmarks.dependency_overhead --requests 20000
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from book_api.config.dependencies import get_book_service
+from book_api.infrastructure.database.connection import SessionLocal
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+from book_api.use_cases.services.book_service import BookService
+
+
+# Replica of the original per-request chain, for comparison
+def _legacy_session():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _legacy_book_repository(db: Session = Depends(_legacy_session)):
+    return BookRepository(db)
+
+
+def _legacy_genre_repository(db: Session = Depends(_legacy_session)):
+    return GenreRepository(db)
+
+
+def _legacy_book_service(
+    book_repo=Depends(_legacy_book_repository),
+    genre_repo=Depends(_legacy_genre_repository)
+):
+    return BookService(book_repo, genre_repo)
+
+
+def build_apps():
+    baseline, legacy, container = FastAPI(), FastAPI(), FastAPI()
+
+    @baseline.get("/")
+    def baseline_route():
+        return None
+
+    @legacy.get("/")
+    def legacy_route(service=Depends(_legacy_book_service)):
+        return None
+
+    @container.get("/")
+    def container_route(service=Depends(get_book_service)):
+        return None
+
+    return {"baseline": baseline, "per-request graph": legacy, "container": container}
+
+
+async def drive(app, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/", "raw_path": b"/", "root_path": "", "query_string": b"",
+        "headers": [], "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):  # warm up
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    results = {name: asyncio.run(drive(app, args.requests)) for name, app in build_apps().items()}
+    baseline = results["baseline"]
+
+    print(f"requests: {args.requests}")
+    print(f"{'app':<20}{'us/request':>12}{'DI overhead':>14}")
+    for name, value in results.items():
+        print(f"{name:<20}{value:>12.1f}{value - baseline:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Memory per entity and hydration throughput of the Book entity.
+
+Compares the original entity (plain dataclass with a per-instance __dict__,
+validators run on every construction, Decimal(str(float)) for each price)
+with the current one (slotted dataclass, `Book.from_trusted` and memoised
+price conversion, as used by BookRepository._convert_to_entity).
+
+Rows are simple stand-ins for BookModel instances, so the ORM cost is left out.
+
+Usage:
+    python -m book_api.benchmarks.entity_hydration --rows 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+
+from book_api.domain.entities.book import Book
+from book_api.infrastructure.repositories.book_repository import BookRepository
+
+
+# Replica of the original entity, for comparison
+@dataclass
+class DictBook:
+    id: int
+    title: str
+    genre_id: int
+    note: Optional[int] = None
+    stock_number: Optional[int] = None
+    datetime: Optional[str] = None
+    upc: Optional[str] = None
+    product_type: Optional[str] = None
+    price_ht: Optional[Decimal] = None
+    price_taxed: Optional[Decimal] = None
+    review_number: Optional[int] = None
+    description: Optional[str] = None
+
+    def __post_init__(self):
+        if self.note is not None and not (1 <= self.note <= 5):
+            raise ValueError("Note must be between 1 and 5")
+        if self.stock_number is not None and self.stock_number < 0:
+            raise ValueError("Stock number cannot be negative")
+        if self.price_ht is not None and self.price_ht < 0:
+            raise ValueError("Price HT cannot be negative")
+        if self.price_taxed is not None and self.price_taxed < 0:
+            raise ValueError("Price taxed cannot be negative")
+
+
+def legacy_convert(row) -> DictBook:
+    return DictBook(
+        id=row.id,
+        title=row.title,
+        genre_id=row.genre_id,
+        note=row.note,
+        stock_number=row.stock_number,
+        datetime=row.datetime,
+        upc=row.upc,
+        product_type=row.product_type,
+        price_ht=Decimal(str(row.price_ht)) if row.price_ht else None,
+        price_taxed=Decimal(str(row.price_taxed)) if row.price_taxed else None,
+        review_number=row.review_number,
+        description=row.description
+    )
+
+
+def validated_convert(row) -> Book:
+    """Slotted entity, still through the validating constructor."""
+    return Book(
+        id=row.id,
+        title=row.title,
+        genre_id=row.genre_id,
+        note=row.note,
+        stock_number=row.stock_number,
+        datetime=row.datetime,
+        upc=row.upc,
+        product_type=row.product_type,
+        price_ht=Decimal(str(row.price_ht)) if row.price_ht else None,
+        price_taxed=Decimal(str(row.price_taxed)) if row.price_taxed else None,
+        review_number=row.review_number,
+        description=row.description
+    )
+
+
+def make_rows(count: int) -> List[SimpleNamespace]:
+    description = "A reasonably long description of the book. " * 20  # Shared, like interned column values
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"Book number {i}",
+            genre_id=i % 50 + 1,
+            note=i % 5 + 1,
+            stock_number=i % 23,
+            datetime="2025-07-10T14:32:11.123456",
+            upc=f"{i:016x}",
+            product_type="Books",
+            price_ht=10 + (i * 7919) % 5000 / 100,
+            price_taxed=12 + (i * 7919) % 5000 / 100,
+            review_number=0,
+            description=description,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(convert: Callable, rows: List[SimpleNamespace]):
+    """Return (rows/sec, bytes allocated per entity, entities and their prices included)."""
+    gc.collect()
+    start = time.perf_counter()
+    books = [convert(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del books
+
+    gc.collect()
+    tracemalloc.start()
+    books = [convert(row) for row in rows]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del books
+    return len(rows) / elapsed, allocated / len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    paths = {
+        "dict dataclass + validate": legacy_convert,
+        "slots + validate": validated_convert,
+        "slots + from_trusted": BookRepository._convert_to_entity,
+    }
+
+    print(f"rows: {args.rows}")
+    print(f"{'entity path':<28}{'rows/sec':>12}{'bytes/entity':>14}{'MiB per 1M':>12}")
+    for name, convert in paths.items():
+        rate, per_entity = measure(convert, rows)
+        print(f"{name:<28}{rate:>12,.0f}{per_entity:>14.0f}{per_entity * 1_000_000 / 2**20:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
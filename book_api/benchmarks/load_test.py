@@ -0,0 +1,241 @@
+"""
+HTTP load test with latency percentiles per route.
+
+Drives every book and genre route with a weighted request mix from concurrent
+clients, either in-process through ASGI (default, no server needed) or against
+a running server with --url. Reports throughput and p50/p95/p99 latency per
+route; results can be saved as JSON and compared with a previous run.
+
+Keys (book IDs, UPCs, genre IDs) are sampled from the target before the run,
+so it works against any catalog, synthetic ones included.
+
+Usage:
+    python -m book_api.benchmarks.load_test --requests 5000 --concurrency 32 --output load.json
+    python -m book_api.benchmarks.load_test --url http://127.0.0.1:8010 --duration 30 --baseline load.json
+    python -m book_api.benchmarks.load_test --only "average|count" --concurrency 8
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+REGRESSION_RATIO = 1.25
+
+
+class Keys(NamedTuple):
+    """Existing keys of the target catalog, picked once before the run."""
+    book_ids: List[int]
+    upcs: List[str]
+    genre_ids: List[int]
+
+
+class Route(NamedTuple):
+    """One route of the mix: name is "METHOD path template", as declared in the routers."""
+    name: str
+    weight: int
+    build: Callable[[random.Random, Keys], Tuple[str, Optional[Dict[str, Any]]]]
+
+
+def _get(path: Callable[[random.Random, Keys], str]):
+    return lambda rng, keys: (path(rng, keys), None)
+
+
+MIX = [
+    Route("GET /books", 2, _get(lambda rng, k: "/books?sort=-rating&limit=50")),
+    Route("GET /books/{book_id:int}", 20, _get(lambda rng, k: f"/books/{rng.choice(k.book_ids)}")),
+    Route("GET /books/search/{keyword}", 10, _get(lambda rng, k: f"/books/search/{rng.choice(SEARCH_TERMS)}")),
+    Route("GET /books/by_genre/{genre_id}", 10,
+          _get(lambda rng, k: f"/books/by_genre/{rng.choice(k.genre_ids)}?sort=price&limit=20")),
+    Route("GET /books/by_upc/{upc}", 5, _get(lambda rng, k: f"/books/by_upc/{rng.choice(k.upcs)}")),
+    Route("GET /books/by_upc_prefix/{prefix}", 3,
+          _get(lambda rng, k: f"/books/by_upc_prefix/{rng.choice(k.upcs)[:3]}?limit=20")),
+    Route("GET /books/query", 10, _get(
+        lambda rng, k: f"/books/query?genre_id={rng.choice(k.genre_ids)}&min_rating={rng.randint(1, 5)}&in_stock=true")),
+    Route("POST /books/batch", 5, lambda rng, k: (
+        "/books/batch", {"ids": rng.sample(k.book_ids, min(20, len(k.book_ids))), "upcs": k.upcs[:5]})),
+    Route("GET /books/average_price/all", 5, _get(lambda rng, k: "/books/average_price/all")),
+    Route("GET /books/average_price/genre/{genre_id}", 5,
+          _get(lambda rng, k: f"/books/average_price/genre/{rng.choice(k.genre_ids)}")),
+    Route("GET /books/average_stock/all", 5, _get(lambda rng, k: "/books/average_stock/all")),
+    Route("GET /books/average_stock/genre/{genre_id}", 5,
+          _get(lambda rng, k: f"/books/average_stock/genre/{rng.choice(k.genre_ids)}")),
+    Route("GET /books/histogram/{column}", 3,
+          _get(lambda rng, k: f"/books/histogram/{rng.choice(['price_taxed', 'note', 'stock_number'])}")),
+    Route("GET /books/percentiles/{column}", 3,
+          _get(lambda rng, k: f"/books/percentiles/{rng.choice(['price_taxed', 'note', 'stock_number'])}")),
+    Route("GET /books/stats/genres", 3, _get(lambda rng, k: "/books/stats/genres")),
+    Route("GET /books/count", 5, _get(
+        lambda rng, k: f"/books/count?genre_id={rng.choice(k.genre_ids)}&min_price={rng.randint(10, 40)}")),
+    Route("GET /genres", 10, _get(lambda rng, k: "/genres")),
+    Route("GET /genres/{genre_id}", 10, _get(lambda rng, k: f"/genres/{rng.choice(k.genre_ids)}")),
+]
+
+SEARCH_TERMS = ["the", "love", "secret", "history", "a", "world"]
+
+
+def uncovered_routes() -> List[str]:
+    """Routes of book_router and genre_router missing from the mix."""
+    from book_api.interface.api.book_router import router as book_router
+    from book_api.interface.api.genre_router import router as genre_router
+
+    declared = {
+        f"{method} {route.path}"
+        for router in (book_router, genre_router)
+        for route in router.routes
+        for method in route.methods
+    }
+    return sorted(declared - {route.name for route in MIX})
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * fraction // 1))  # ceil without float drift on exact ranks
+    return ordered[int(rank) - 1]
+
+
+def summarize(latencies: Dict[str, List[float]], errors: Counter, elapsed: float) -> Dict[str, Any]:
+    """Per-route and overall throughput and latency percentiles, in milliseconds."""
+    routes = {}
+    for name, values in sorted(latencies.items()):
+        ordered = sorted(values)
+        routes[name] = {
+            "requests": len(ordered),
+            "errors": errors[name],
+            "throughput_rps": len(ordered) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(ordered, 0.50) * 1000,
+            "p95_ms": percentile(ordered, 0.95) * 1000,
+            "p99_ms": percentile(ordered, 0.99) * 1000,
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        }
+    total = sum(len(values) for values in latencies.values())
+    return {
+        "requests": total,
+        "errors": sum(errors.values()),
+        "elapsed_s": elapsed,
+        "throughput_rps": total / elapsed if elapsed else 0.0,
+        "routes": routes,
+    }
+
+
+async def sample_keys(client: httpx.AsyncClient) -> Keys:
+    books = (await client.get("/books", params={"limit": 1000})).raise_for_status().json()
+    genres = (await client.get("/genres")).raise_for_status().json()
+    if not books or not genres:
+        raise SystemExit("the target catalog is empty, generate one with book_api.benchmarks.synthetic_catalog")
+    return Keys(
+        [book["id"] for book in books],
+        [book["upc"] for book in books if book.get("upc")],
+        [genre["id"] for genre in genres],
+    )
+
+
+async def run(
+    client: httpx.AsyncClient,
+    mix: List[Route],
+    concurrency: int,
+    requests: int,
+    duration: Optional[float],
+    seed: int
+) -> Dict[str, Any]:
+    keys = await sample_keys(client)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Counter = Counter()
+    weights = [route.weight for route in mix]
+    remaining = requests
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    async def worker(index: int) -> None:
+        nonlocal remaining
+        rng = random.Random(seed * 1000 + index)
+        while (remaining > 0) if deadline is None else (time.perf_counter() < deadline):
+            remaining -= 1
+            route = rng.choices(mix, weights)[0]
+            path, body = route.build(rng, keys)
+            sent = time.perf_counter()
+            try:
+                response = await (client.post(path, json=body) if body is not None else client.get(path))
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[route.name].append(time.perf_counter() - sent)
+            if failed:
+                errors[route.name] += 1
+
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+def client_for(url: Optional[str], concurrency: int) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if url:
+        return httpx.AsyncClient(base_url=url, limits=limits, timeout=60)
+    from book_api.main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load-test", timeout=60)
+
+
+def print_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"{results['requests']} requests in {results['elapsed_s']:.1f} s, "
+          f"{results['throughput_rps']:,.0f} req/s, {results['errors']} errors")
+    header = f"{'route':<44}{'reqs':>7}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    print(header + (f"{'p95 vs base':>13}" if baseline is not None else ""))
+    for name, route in results["routes"].items():
+        line = (f"{name:<44}{route['requests']:>7}{route['errors']:>8}{route['throughput_rps']:>9.1f}"
+                f"{route['p50_ms']:>9.2f}{route['p95_ms']:>9.2f}{route['p99_ms']:>9.2f}")
+        previous = (baseline or {}).get("routes", {}).get(name)
+        if previous and previous["p95_ms"]:
+            ratio = route["p95_ms"] / previous["p95_ms"]
+            line += f"{ratio:>12.2f}x" + ("  REGRESSION" if ratio > REGRESSION_RATIO else "")
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server, in-process ASGI when omitted")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests, ignored with --duration")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds instead")
+    parser.add_argument("--only", help="Regex on route names")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="JSON from a previous run to compare against")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # The API logs every call
+
+    mix = [route for route in MIX if not args.only or re.search(args.only, route.name)]
+    if not mix:
+        raise SystemExit(f"no route matches {args.only!r}")
+    missing = uncovered_routes()
+    if missing:
+        print(f"not in the mix: {', '.join(missing)}")
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    async def session() -> Dict[str, Any]:
+        async with client_for(args.url, args.concurrency) as client:
+            return await run(client, mix, args.concurrency, args.requests, args.duration, args.seed)
+
+    results = asyncio.run(session())
+    results.update(target=args.url or "asgi", concurrency=args.concurrency)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"\nresults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
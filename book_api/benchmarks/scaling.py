@@ -0,0 +1,247 @@
+"""
+Repository and service scaling benchmark.
+
+Generates (or reuses) synthetic catalogs at several sizes, then times every
+BookRepository and BookService method against each one and reports median
+latency, rows/sec and peak Python memory. Each call gets a fresh session,
+as a request would. Results can be saved as JSON and compared with a
+previous run to spot regressions.
+
+Usage:
+    python -m book_api.benchmarks.scaling --scales 1000,10000,100000 --output bench.json
+    python -m book_api.benchmarks.scaling --scales 100000 --baseline bench.json
+    python -m book_api.benchmarks.scaling --scales 1000000 --only "count|average|top20"
+    python -m book_api.benchmarks.scaling --scales 1000000 --analytics duckdb --only "service"
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from book_api.benchmarks.synthetic_catalog import generate_catalog
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+from book_api.use_cases.interfaces.book_repository import IBookRepository
+from book_api.use_cases.interfaces.book_service import IBookService
+from book_api.use_cases.services.book_service import BookService
+
+REGRESSION_RATIO = 1.25
+CRITERIA = BookCriteria(genre_id=3, min_price=20, max_price=30, min_rating=4, in_stock=True)
+TOP = BookSort("price")
+
+
+class Sample(NamedTuple):
+    """Keys that exist in the catalog, picked once per scale."""
+    book_id: int
+    book_ids: List[int]
+    upcs: List[str]
+
+
+class Case(NamedTuple):
+    name: str
+    run: Callable[[BookRepository, BookService, Sample], Any]
+
+
+CASES = [
+    Case("repository.get_all", lambda repo, service, s: repo.get_all()),
+    Case("repository.get_all[top20]", lambda repo, service, s: repo.get_all(TOP, 20)),
+    Case("repository.get_by_id", lambda repo, service, s: repo.get_by_id(s.book_id)),
+    Case("repository.get_by_ids", lambda repo, service, s: repo.get_by_ids(s.book_ids)),
+    Case("repository.get_by_upcs", lambda repo, service, s: repo.get_by_upcs(s.upcs)),
+    Case("repository.get_by_upc", lambda repo, service, s: repo.get_by_upc(s.upcs[0])),
+    Case("repository.get_by_upc_prefix", lambda repo, service, s: repo.get_by_upc_prefix(s.upcs[0][:3])),
+    Case("repository.get_by_keyword", lambda repo, service, s: repo.get_by_keyword("secret")),
+    Case("repository.get_by_genre_id", lambda repo, service, s: repo.get_by_genre_id(3)),
+    Case("repository.get_by_genre_id[top20]", lambda repo, service, s: repo.get_by_genre_id(3, TOP, 20)),
+    Case("repository.get_by_criteria", lambda repo, service, s: repo.get_by_criteria(CRITERIA)),
+    Case("repository.get_books_with_valid_prices", lambda repo, service, s: repo.get_books_with_valid_prices()),
+    Case("repository.iter_all", lambda repo, service, s: repo.iter_all(1000)),
+    Case("service.get_all_books", lambda repo, service, s: service.get_all_books()),
+    Case("service.get_all_books[top20]", lambda repo, service, s: service.get_all_books(TOP, 20)),
+    Case("service.get_book", lambda repo, service, s: service.get_book(s.book_id)),
+    Case("service.iter_all_books", lambda repo, service, s: service.iter_all_books(1000)),
+    Case("service.get_books_batch", lambda repo, service, s: service.get_books_batch(s.book_ids, s.upcs)),
+    Case("service.get_book_by_upc", lambda repo, service, s: service.get_book_by_upc(s.upcs[0])),
+    Case("service.search_books_by_upc_prefix",
+         lambda repo, service, s: service.search_books_by_upc_prefix(s.upcs[0][:3], 20)),
+    Case("service.search_books", lambda repo, service, s: service.search_books("secret")),
+    Case("service.get_books_by_genre", lambda repo, service, s: service.get_books_by_genre(3)),
+    Case("service.query_books", lambda repo, service, s: service.query_books(CRITERIA)),
+    Case("service.calculate_average_price_all", lambda repo, service, s: service.calculate_average_price_all()),
+    Case("service.calculate_average_price_by_genre",
+         lambda repo, service, s: service.calculate_average_price_by_genre(3)),
+    Case("service.calculate_average_stock_all", lambda repo, service, s: service.calculate_average_stock_all()),
+    Case("service.calculate_average_stock_by_genre",
+         lambda repo, service, s: service.calculate_average_stock_by_genre(3)),
+    Case("service.calculate_histogram", lambda repo, service, s: service.calculate_histogram("price_taxed", 20)),
+    Case("service.calculate_percentiles",
+         lambda repo, service, s: service.calculate_percentiles("price_taxed", (50, 90, 99))),
+    Case("service.calculate_genre_summary", lambda repo, service, s: service.calculate_genre_summary()),
+    Case("service.count_books", lambda repo, service, s: service.count_books(BookCriteria(3, 20, 30, 4, True))),
+]
+
+
+def uncovered_methods() -> List[str]:
+    """Interface methods with no case, so new methods don't silently escape the suite."""
+    covered = {case.name.split("[")[0] for case in CASES}
+    interfaces = {"repository": IBookRepository, "service": IBookService}
+    return sorted(
+        f"{layer}.{method}"
+        for layer, interface in interfaces.items()
+        for method in interface.__abstractmethods__
+        if f"{layer}.{method}" not in covered
+    )
+
+
+def consume(result: Any) -> int:
+    """Materialise the result and return how many rows it holds."""
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple)):
+        return len(result)
+    if isinstance(result, dict):
+        return sum(len(value) for value in result.values() if isinstance(value, (list, dict))) or 1
+    if isinstance(result, int):
+        return 1
+    if hasattr(result, "__iter__"):
+        counter = deque(enumerate(result, start=1), maxlen=1)
+        return counter[0][0] if counter else 0
+    return 1
+
+
+class Bench:
+    def __init__(self, database_path: str, analytics: str):
+        self.engine = create_engine(f"sqlite:///file:{database_path}?mode=ro&uri=true")
+        self.session_factory = sessionmaker(bind=self.engine, autoflush=False)
+        self.analytics = None
+        self.duckdb_catalog = None
+        if analytics == "duckdb":
+            from book_api.infrastructure.analytics.duckdb_catalog import DuckDBCatalog
+            from book_api.infrastructure.analytics.duckdb_catalog_analytics import DuckDBCatalogAnalytics
+
+            # Lists are read from DuckDB too, lookups by ID / UPC stay on SQLite
+            self.duckdb_catalog = DuckDBCatalog("sqlite", database_path, lambda: "bench")
+            self.duckdb_catalog.fetchall("SELECT 1")  # Copied once per dataset version, outside the timings
+            self.analytics = DuckDBCatalogAnalytics(self.duckdb_catalog)
+        elif analytics == "numpy":
+            from book_api.infrastructure.analytics.catalog_snapshot import CatalogSnapshotProvider
+            from book_api.infrastructure.analytics.numpy_catalog_analytics import NumpyCatalogAnalytics
+
+            self.analytics = NumpyCatalogAnalytics(CatalogSnapshotProvider(self.session_factory, lambda: "bench"))
+            self.analytics.snapshots.current()  # Loaded once per dataset version, outside the timings
+
+        with self.session_factory() as session:
+            books = BookRepository(session).get_all(limit=100)
+        self.sample = Sample(books[len(books) // 2].id, [book.id for book in books], [book.upc for book in books])
+
+    def call(self, case: Case) -> int:
+        session = self.session_factory()
+        try:
+            repository = BookRepository(session)
+            if self.duckdb_catalog is not None:
+                from book_api.infrastructure.repositories.duckdb_book_repository import DuckDBBookRepository
+
+                repository = DuckDBBookRepository(self.duckdb_catalog, point_lookups=repository)
+            service = BookService(repository, GenreRepository(session), self.analytics)
+            return consume(case.run(repository, service, self.sample))
+        finally:
+            session.close()
+
+    def measure(self, case: Case, repeat: int) -> Dict[str, float]:
+        rows = self.call(case)  # Warm up the page cache and the statement cache
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            self.call(case)
+            durations.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        self.call(case)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        median = statistics.median(durations)
+        return {
+            "rows": rows,
+            "median_ms": median * 1000,
+            "best_ms": min(durations) * 1000,
+            "rows_per_sec": rows / median if median else 0.0,
+            "peak_mib": peak / 2**20,
+        }
+
+
+def database_for(scale: int, workdir: str, regenerate: bool) -> str:
+    path = os.path.join(workdir, f"catalog_{scale}.db")
+    if regenerate or not os.path.exists(path):
+        print(f"generating {scale} books -> {path}")
+        generate_catalog(path, scale)
+    return path
+
+
+def print_results(scale: int, results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"\nscale: {scale} books")
+    header = f"{'case':<46}{'rows':>9}{'median ms':>11}{'rows/sec':>13}{'peak MiB':>10}"
+    print(header + (f"{'vs base':>10}" if baseline is not None else ""))
+    for name, result in results.items():
+        line = (f"{name:<46}{result['rows']:>9}{result['median_ms']:>11.2f}"
+                f"{result['rows_per_sec']:>13,.0f}{result['peak_mib']:>10.1f}")
+        previous = (baseline or {}).get(str(scale), {}).get(name)
+        if previous:
+            ratio = result["median_ms"] / previous["median_ms"] if previous["median_ms"] else 1.0
+            flag = "  REGRESSION" if ratio > REGRESSION_RATIO else ""
+            line += f"{ratio:>9.2f}x{flag}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1000,10000,100000", help="Comma-separated catalog sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="Regex on case names")
+    parser.add_argument("--analytics", choices=("python", "numpy", "duckdb"), default="python")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "bookscrape_bench"))
+    parser.add_argument("--regenerate", action="store_true", help="Rebuild catalogs even if present")
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="JSON from a previous run to compare against")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # The service logs every call
+
+    os.makedirs(args.workdir, exist_ok=True)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    cases = [case for case in CASES if not args.only or re.search(args.only, case.name)]
+
+    missing = uncovered_methods()
+    if missing:
+        print(f"not benchmarked: {', '.join(missing)}")
+
+    all_results = {}
+    for scale in (int(value) for value in args.scales.split(",")):
+        bench = Bench(database_for(scale, args.workdir, args.regenerate), args.analytics)
+        results = {case.name: bench.measure(case, args.repeat) for case in cases}
+        bench.engine.dispose()
+        print_results(scale, results, baseline)
+        all_results[str(scale)] = results
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(all_results, output, indent=2)
+        print(f"\nresults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Per-row cost of encoding book lists.
+
+Compares the original response path (BookDto per row, then response_model
+validation and JSON encoding as FastAPI does it) with the fast path used by
+the list endpoints (dicts encoded straight to bytes).
+
+Usage:
+    python -m book_api.benchmarks.serialization --rows 10000 --repeat 5
+"""
+import argparse
+import json
+import time
+from decimal import Decimal
+from typing import Callable, List
+
+from pydantic import TypeAdapter
+
+from book_api.domain.entities.book import Book
+from book_api.interface.api import serialization
+from book_api.interface.dto.book_dto import BookDto
+
+_response_adapter = TypeAdapter(List[BookDto])
+
+
+def make_books(rows: int) -> List[Book]:
+    return [
+        Book(
+            id=i,
+            title=f"Book number {i}",
+            genre_id=i % 50 + 1,
+            note=i % 5 + 1,
+            stock_number=i % 23,
+            datetime="2025-07-10T14:32:11.123456",
+            upc=f"{i:016x}",
+            product_type="Books",
+            price_ht=Decimal("41.25"),
+            price_taxed=Decimal("49.50"),
+            review_number=0,
+            description="A reasonably long description of the book. " * 20,
+        )
+        for i in range(1, rows + 1)
+    ]
+
+
+def book_to_dto(book: Book) -> BookDto:
+    """The per-row conversion the list endpoints used before encode_books."""
+    return BookDto(
+        id=book.id,
+        title=book.title,
+        genre_id=book.genre_id,
+        note=book.note,
+        stock_number=book.stock_number,
+        datetime=book.datetime,
+        upc=book.upc,
+        product_type=book.product_type,
+        price_ht=float(book.price_ht) if book.price_ht is not None else None,
+        price_taxed=float(book.price_taxed) if book.price_taxed is not None else None,
+        review_number=book.review_number,
+        description=book.description
+    )
+
+
+def dto_path(books: List[Book]) -> bytes:
+    """What the list endpoints did before: DTOs, response_model validation, then JSON."""
+    dtos = [book_to_dto(book) for book in books]
+    validated = _response_adapter.validate_python(dtos, from_attributes=True)
+    content = _response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(books: List[Book]) -> bytes:
+    return serialization.encode_books(books)
+
+
+def time_per_row(encode: Callable[[List[Book]], bytes], books: List[Book], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode(books)
+        best = min(best, time.perf_counter() - start)
+    return best / len(books) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    books = make_books(args.rows)
+    assert json.loads(dto_path(books)) == json.loads(fast_path(books)), "paths must produce the same JSON"
+
+    before = time_per_row(dto_path, books, args.repeat)
+    after = time_per_row(fast_path, books, args.repeat)
+
+    encoder = "orjson" if serialization.orjson is not None else "json (stdlib)"
+    print(f"rows: {args.rows}, best of {args.repeat}, encoder: {encoder}")
+    print(f"{'path':<28}{'us/row':>10}")
+    print(f"{'BookDto + response_model':<28}{before:>10.2f}")
+    print(f"{'fast path':<28}{after:>10.2f}")
+    print(f"speedup: x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
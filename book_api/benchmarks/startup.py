@@ -0,0 +1,53 @@
+"""
+Cold start of the API.
+
+Starts fresh interpreters that import the app and run its lifespan (schema check,
+genre load), and reports the median of the timings the app records in
+`app.state.startup_timings`, plus the whole process wall time.
+
+Usage:
+    python -m book_api.benchmarks.startup --runs 10
+    BOOK_API_DATABASE_PATH=/tmp/catalog_1m.db python -m book_api.benchmarks.startup
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+_CHILD = """
+import json, logging
+logging.disable(logging.INFO)
+import book_api.main
+from fastapi.testclient import TestClient
+app = book_api.main.app
+with TestClient(app):
+    pass
+print(json.dumps(app.state.startup_timings))
+"""
+
+
+def run_once() -> dict:
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD], capture_output=True, text=True, check=True
+    ).stdout
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings["process_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    print(f"runs: {args.runs} (median)")
+    for key in ("import_ms", "create_app_ms", "schema_ms", "genres_ms", "startup_ms", "process_ms"):
+        print(f"{key:<16}{statistics.median(run[key] for run in runs):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
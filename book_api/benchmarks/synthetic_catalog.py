@@ -0,0 +1,146 @@
+"""
+Synthetic catalog generator.
+
+Writes a books database with the API's schema (tables and indexes) at any scale,
+with distributions modelled on the scraped catalog:
+  - genres: Zipf-like skew, a handful of genres hold most books
+  - prices: uniform between 10.00 and 59.99, tax-free as on the source site
+  - stock: 1 to 22 copies, with a share of books out of stock
+  - ratings: 1 to 5 stars, roughly uniform; reviews: mostly zero, long tail
+  - descriptions: log-normal lengths around 1.4 kB, capped like the real data
+
+Rows are generated and inserted in batches, so memory stays flat at any size.
+
+Usage:
+    python -m book_api.benchmarks.synthetic_catalog --books 100000 --output /tmp/catalog_100k.db
+"""
+import argparse
+import math
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Iterator, List, Tuple
+
+from sqlalchemy import create_engine
+
+from book_api.infrastructure.database.connection import Base
+from book_api.infrastructure.database import models  # noqa: F401 - registers tables
+from book_api.infrastructure.database.schema import ensure_indexes
+
+GENRE_SKEW = 0.9
+OUT_OF_STOCK_SHARE = 0.05
+DESCRIPTION_MEDIAN = 1100
+DESCRIPTION_SIGMA = 0.7
+DESCRIPTION_MAX = 8646
+
+_WORDS = (
+    "story novel life world love young family time war years history new journey city secret first "
+    "dark house heart people woman man friends book must way finds home death power truth past lost "
+    "discover mystery adventure classic bestselling author readers edition illustrated collection"
+).split()
+
+
+def genre_names(count: int) -> List[str]:
+    return [f"Genre {index:03d}" for index in range(1, count + 1)]
+
+
+def generate_rows(books: int, genres: int, seed: int = 0, start_id: int = 1) -> Iterator[Tuple]:
+    """Yield book rows in the column order of the books table."""
+    rng = random.Random(seed)
+    # Descriptions are windows of one long text: realistic sizes without generating every word
+    text = " ".join(rng.choices(_WORDS, k=2 * DESCRIPTION_MAX))
+    genre_ids = list(range(1, genres + 1))
+    genre_weights = list(accumulate(1 / rank ** GENRE_SKEW for rank in genre_ids))
+    scraped_at = datetime(2025, 9, 29, 13, 0, 0)
+
+    for book_id in range(start_id, start_id + books):
+        price = round(rng.uniform(10, 59.99), 2)
+        length = min(DESCRIPTION_MAX, max(30, int(rng.lognormvariate(math.log(DESCRIPTION_MEDIAN), DESCRIPTION_SIGMA))))
+        offset = rng.randrange(len(text) - length)
+        description = text[offset:offset + length]
+        yield (
+            book_id,
+            " ".join(rng.choices(_WORDS, k=rng.randint(1, 6))).title(),
+            rng.choices(genre_ids, cum_weights=genre_weights)[0],
+            rng.randint(1, 5),
+            0 if rng.random() < OUT_OF_STOCK_SHARE else rng.randint(1, 22),
+            (scraped_at + timedelta(milliseconds=book_id * 37)).isoformat(),
+            f"{rng.getrandbits(64):016x}",
+            "Books",
+            price,
+            price,
+            int(rng.expovariate(0.5)) if rng.random() < 0.3 else 0,
+            description,
+        )
+
+
+def generate_catalog(
+    path: str,
+    books: int,
+    genres: int = 50,
+    seed: int = 0,
+    batch_size: int = 10_000
+) -> None:
+    """Create a fresh database at `path` holding `books` synthetic books."""
+    if os.path.exists(path):
+        os.remove(path)
+
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)  # Same tables as the API
+
+    connection = sqlite3.connect(path)
+    try:
+        # Bulk load without index maintenance, indexes are built once at the end
+        for (index_name,) in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'books' AND sql IS NOT NULL"
+        ).fetchall():
+            connection.execute(f"DROP INDEX {index_name}")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=OFF")  # Throwaway file, rebuilt on failure
+        connection.executemany(
+            "INSERT INTO books_genres (id, genre) VALUES (?, ?)",
+            enumerate(genre_names(genres), start=1)
+        )
+
+        rows = generate_rows(books, genres, seed)
+        while True:
+            batch = [row for _, row in zip(range(batch_size), rows)]
+            if not batch:
+                break
+            connection.executemany("INSERT INTO books VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS dataset_version "
+            "(id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL, updated_at TEXT)"
+        )
+        connection.execute("INSERT OR REPLACE INTO dataset_version VALUES (1, 1, datetime('now'))")
+        connection.commit()
+    finally:
+        connection.close()
+
+    ensure_indexes(engine)
+    with engine.connect() as analyze:
+        analyze.exec_driver_sql("ANALYZE")
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--genres", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="Database file to (re)create")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generate_catalog(args.output, args.books, args.genres, args.seed)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(args.output) / 2**20
+    print(f"{args.books} books in {elapsed:.1f} s ({args.books / elapsed:,.0f} rows/sec), {size:.0f} MiB -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
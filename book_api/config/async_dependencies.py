@@ -0,0 +1,33 @@
+"""
+Dependency Injection for the async stack (BOOK_API_ASYNC_DATABASE=1).
+Kept apart from dependencies.py so the default deployment never imports
+SQLAlchemy's asyncio extension, aiosqlite or greenlet.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends
+
+from book_api.infrastructure.database.connection import get_async_database_session
+from book_api.infrastructure.monitoring.tracing import trace_layer
+from book_api.infrastructure.repositories.async_book_repository import AsyncBookRepository
+from book_api.infrastructure.repositories.async_genre_repository import AsyncGenreRepository
+from book_api.use_cases.services.async_book_service import AsyncBookService
+from book_api.use_cases.interfaces.async_book_repository import IAsyncBookRepository
+from book_api.use_cases.interfaces.async_genre_repository import IAsyncGenreRepository
+from book_api.use_cases.interfaces.async_book_service import IAsyncBookService
+
+
+# Providers are `async def` so FastAPI resolves them on the event loop, not in the threadpool
+
+async def get_async_book_repository(db: AsyncSession = Depends(get_async_database_session)) -> IAsyncBookRepository:
+    return trace_layer(AsyncBookRepository(db), "repository")
+
+
+async def get_async_genre_repository(db: AsyncSession = Depends(get_async_database_session)) -> IAsyncGenreRepository:
+    return trace_layer(AsyncGenreRepository(db), "repository")
+
+
+async def get_async_book_service(
+    book_repo: IAsyncBookRepository = Depends(get_async_book_repository),
+    genre_repo: IAsyncGenreRepository = Depends(get_async_genre_repository)
+) -> IAsyncBookService:
+    return trace_layer(AsyncBookService(book_repo, genre_repo), "service")
@@ -0,0 +1,126 @@
+"""
+Application container.
+Stateless objects (repositories, services, caches) are built once per process.
+The only per-request state is the database session, opened lazily on first use.
+"""
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from book_api.config.settings import Settings, get_settings
+from book_api.infrastructure.database.connection import SessionLocal, SQLITE_DATABASE_PATH
+from book_api.infrastructure.database.dataset_version import DatasetVersion
+from book_api.infrastructure.database.request_session import RequestSessionProxy
+from book_api.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from book_api.infrastructure.cache.cached_book_service import CachedBookService
+from book_api.infrastructure.cache.genre_registry import GenreRegistry
+from book_api.infrastructure.monitoring.metrics import MetricsRegistry
+from book_api.infrastructure.monitoring.query_inspector import QueryInspector
+from book_api.infrastructure.monitoring.tracing import trace_layer
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.use_cases.services.book_service import BookService
+from book_api.use_cases.interfaces.book_repository import IBookRepository
+from book_api.use_cases.interfaces.genre_repository import IGenreRepository
+from book_api.use_cases.interfaces.book_service import IBookService
+from book_api.use_cases.interfaces.catalog_analytics import ICatalogAnalytics
+
+ANALYTICS_BACKENDS = ("python", "numpy", "duckdb")
+BOOK_REPOSITORY_BACKENDS = ("sqlite", "duckdb")
+
+
+class Container:
+    """
+    Builds the object graph once.
+    Repositories hold a RequestSessionProxy instead of a real session, so they can be shared between requests.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        session_factory: Callable[[], Session] = SessionLocal,
+        database_path: str = SQLITE_DATABASE_PATH
+    ):
+        self.settings = settings
+        self.session_factory = session_factory
+        self.database_path = database_path
+        self.db = RequestSessionProxy()
+        self._duckdb_catalog = None
+
+        self.dataset_version = DatasetVersion(
+            database_path, check_interval=settings.dataset_version_check_interval
+        )
+        self.query_cache = LRUTTLCache(
+            max_entries=settings.cache_max_entries, ttl=settings.cache_ttl_seconds
+        )
+        self.metrics = MetricsRegistry()
+        self.query_inspector = QueryInspector.from_settings(settings)
+
+        # Each layer gets its own spans when tracing is configured, otherwise trace_layer is a no-op
+        self.book_repository: IBookRepository = trace_layer(self._build_book_repository(), "repository")
+        # Genres are served from memory; the registry reloads them when the dataset version changes
+        self.genre_repository: IGenreRepository = trace_layer(
+            GenreRegistry(session_factory, self.dataset_version.current), "repository"
+        )
+        self.analytics: Optional[ICatalogAnalytics] = self._build_analytics()
+        self.book_service: IBookService = trace_layer(CachedBookService(
+            trace_layer(BookService(self.book_repository, self.genre_repository, self.analytics), "service"),
+            self.query_cache,
+            self.dataset_version.current,
+            cache_lists=settings.cache_book_lists
+        ), "cache")
+
+    def _build_book_repository(self) -> IBookRepository:
+        """Book repository picked by settings; the DuckDB one still resolves IDs and UPCs on SQLite."""
+        backend = self.settings.book_repository_backend
+        if backend not in BOOK_REPOSITORY_BACKENDS:
+            raise ValueError(f"Unsupported book repository backend: {backend}")
+        if backend == "sqlite":
+            return BookRepository(self.db)
+
+        from book_api.infrastructure.repositories.duckdb_book_repository import DuckDBBookRepository
+
+        return DuckDBBookRepository(self.duckdb_catalog, point_lookups=BookRepository(self.db))
+
+    @property
+    def duckdb_catalog(self):
+        """DuckDB copy of the catalog shared by the DuckDB backends, built on first use."""
+        if self._duckdb_catalog is None:
+            # Imported here so duckdb stays optional
+            from book_api.infrastructure.analytics.duckdb_catalog import DuckDBCatalog
+
+            self._duckdb_catalog = DuckDBCatalog(
+                self.settings.duckdb_source, self.database_path, self.dataset_version.current
+            )
+        return self._duckdb_catalog
+
+    def _build_analytics(self) -> Optional[ICatalogAnalytics]:
+        """Analytics backend picked by settings; None means the service aggregates ORM rows itself."""
+        backend = self.settings.analytics_backend
+        if backend not in ANALYTICS_BACKENDS:
+            raise ValueError(f"Unsupported analytics backend: {backend}")
+        if backend == "python":
+            return None
+        if backend == "duckdb":
+            from book_api.infrastructure.analytics.duckdb_catalog_analytics import DuckDBCatalogAnalytics
+
+            return trace_layer(DuckDBCatalogAnalytics(self.duckdb_catalog), "analytics")
+
+        # Imported here so numpy stays optional
+        from book_api.infrastructure.analytics.catalog_snapshot import CatalogSnapshotProvider
+        from book_api.infrastructure.analytics.numpy_catalog_analytics import NumpyCatalogAnalytics
+
+        if self.settings.snapshot_dir:
+            from book_api.infrastructure.analytics.snapshot_store import MappedSnapshotProvider, SnapshotStore
+
+            snapshots = MappedSnapshotProvider(
+                SnapshotStore(self.settings.snapshot_dir), self.session_factory, self.dataset_version.current
+            )
+        else:
+            snapshots = CatalogSnapshotProvider(self.session_factory, self.dataset_version.current)
+        return trace_layer(NumpyCatalogAnalytics(snapshots), "analytics")
+
+
+@lru_cache(maxsize=None)
+def get_container() -> Container:
+    return Container(get_settings())
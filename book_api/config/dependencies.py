@@ -1,25 +1,53 @@
-from sqlalchemy.orm import Session
+"""
+Dependency Injection for FastAPI routes.
+Everything comes from the app-scoped container; `request_scope` is the only per-request work.
+"""
 from fastapi import Depends
 
-from book_api.infrastructure.database.connection import get_database_session
-from book_api.infrastructure.repositories.book_repository import BookRepository
-from book_api.infrastructure.repositories.genre_repository import GenreRepository
-from book_api.use_cases.services.book_service import BookService
+from book_api.config.container import get_container
+from book_api.infrastructure.database.dataset_version import DatasetVersion
+from book_api.infrastructure.database.request_session import begin_request_session
+from book_api.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from book_api.infrastructure.monitoring.metrics import MetricsRegistry
 from book_api.use_cases.interfaces.book_repository import IBookRepository
 from book_api.use_cases.interfaces.genre_repository import IGenreRepository
 from book_api.use_cases.interfaces.book_service import IBookService
 
 
-def get_book_repository(db: Session = Depends(get_database_session)) -> IBookRepository:
-    return BookRepository(db)
+def get_dataset_version() -> DatasetVersion:
+    return get_container().dataset_version
 
 
-def get_genre_repository(db: Session = Depends(get_database_session)) -> IGenreRepository:
-    return GenreRepository(db)
+def get_query_cache() -> LRUTTLCache:
+    return get_container().query_cache
 
 
-def get_book_service(
-    book_repo: IBookRepository = Depends(get_book_repository),
-    genre_repo: IGenreRepository = Depends(get_genre_repository)
-) -> IBookService:
-    return BookService(book_repo, genre_repo)
\ No newline at end of file
+def get_metrics() -> MetricsRegistry:
+    return get_container().metrics
+
+
+async def request_scope():
+    """
+    Give the request its own lazily opened session.
+    Nothing touches the database unless a repository actually runs a query.
+    """
+    holder = begin_request_session(get_container().session_factory)
+    try:
+        yield holder
+    finally:
+        holder.close()
+
+
+# Providers are `async def` so FastAPI resolves them on the event loop, not in the threadpool
+
+async def get_book_repository(_=Depends(request_scope)) -> IBookRepository:
+    return get_container().book_repository
+
+
+async def get_genre_repository() -> IGenreRepository:
+    # The genre registry answers from memory and loads with its own session, no request scope needed
+    return get_container().genre_repository
+
+
+async def get_book_service(_=Depends(request_scope)) -> IBookService:
+    return get_container().book_service
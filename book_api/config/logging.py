@@ -1,17 +1,158 @@
+"""
+Logging setup.
+
+Request threads only build a record and put it on a queue; a listener thread formats
+the message (%-style arguments are applied there, not by the caller) and writes it.
+Hot-path loggers can be sampled or rate limited: records below WARNING are dropped
+before they reach the queue, warnings and errors always go through.
+Callers pass arguments instead of f-strings: `logger.info("Getting book ID: %s", book_id)`.
+"""
+import atexit
 import logging
+import queue
 import sys
-from typing import Dict, Any
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Optional, Tuple
 
+from book_api.config.settings import Settings
 
-def setup_logging(level: str = "INFO") -> None:
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Records waiting for the listener; beyond this, new records are dropped rather than blocking requests
+QUEUE_CAPACITY = 10_000
+
+_handlers: List[logging.Handler] = []
+_listener: Optional[QueueListener] = None
+# Filters added to handlers setup_logging does not own, removed again by stop_logging
+_foreign_filters: List[Tuple[logging.Handler, logging.Filter]] = []
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never formats nor blocks in the calling thread.
+    The record is queued as is, so arguments must not be mutated after the logging call.
+    """
+
+    def __init__(self, capacity: int = QUEUE_CAPACITY):
+        # SimpleQueue is implemented in C and takes no Python-level lock; capacity is checked by hand
+        super().__init__(queue.SimpleQueue())
+        self.capacity = capacity
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same process: no need to pre-format for pickling, the listener does it
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.capacity:
+            self.dropped += 1
+        else:
+            self.queue.put_nowait(record)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one record in `every` below WARNING from the loggers under `name`."""
+
+    def __init__(self, name: str, every: int):
+        super().__init__(name)
+        self.every = max(1, every)
+        self.dropped = 0
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not super().filter(record):
+            return True
+        with self._lock:
+            keep = self._seen % self.every == 0
+            self._seen += 1
+            if keep:
+                return True
+            self.dropped += 1
+            return False
+
+
+class RateLimitFilter(logging.Filter):
+    """At most `per_second` records below WARNING from the loggers under `name` (token bucket, one second of burst)."""
+
+    def __init__(self, name: str, per_second: float, clock: Callable[[], float] = time.monotonic):
+        super().__init__(name)
+        self.per_second = per_second
+        self.dropped = 0
+        self._clock = clock
+        self._tokens = per_second
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not super().filter(record):
+            return True
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.per_second, self._tokens + (now - self._updated) * self.per_second)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.dropped += 1
+            return False
+
+
+def parse_logger_values(spec: str) -> Dict[str, float]:
+    """Parse "logger=value,other.logger=value" (as found in BOOK_API_LOG_SAMPLE / BOOK_API_LOG_RATE_LIMIT)."""
+    values = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, separator, value = item.partition("=")
+        if not separator:
+            raise ValueError(f"Expected logger=value, got: {item.strip()}")
+        values[name.strip()] = float(value)
+    return values
+
+
+def setup_logging(
+    level: str = "INFO",
+    use_queue: bool = True,
+    sample_rates: Optional[Dict[str, float]] = None,
+    rate_limits: Optional[Dict[str, float]] = None
+) -> None:
+    """
+    Send the root logger to stdout, through a queue and a listener thread unless use_queue is False.
+    sample_rates maps a logger name to the fraction of its records kept (0.01 = one in a hundred),
+    rate_limits to the records per second it may emit. Calling again replaces the previous setup.
+    As with logging.basicConfig, when the root logger already has handlers (a test runner, a host
+    application's log config) no handler is added; the sampling and rate-limit filters are then
+    added to those handlers, so the settings apply either way.
+    """
+    global _listener
+    stop_logging()
+    root = logging.getLogger()
+    filters = [
+        SamplingFilter(name, round(1 / rate) if rate > 0 else sys.maxsize)
+        for name, rate in (sample_rates or {}).items()
+    ] + [RateLimitFilter(name, per_second) for name, per_second in (rate_limits or {}).items()]
+
+    if root.handlers:
+        for handler in root.handlers:
+            for log_filter in filters:
+                handler.addFilter(log_filter)
+                _foreign_filters.append((handler, log_filter))
+    else:
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler = output
+        if use_queue:
+            handler = NonBlockingQueueHandler()
+            _listener = QueueListener(handler.queue, output, respect_handler_level=True)
+            _listener.start()
+        for log_filter in filters:
+            handler.addFilter(log_filter)
+        root.addHandler(handler)
+        root.setLevel(getattr(logging, level.upper()))
+        _handlers.append(handler)
 
     # Configure specific loggers
     loggers_config = {
@@ -25,5 +166,32 @@ def setup_logging(level: str = "INFO") -> None:
         logger.setLevel(getattr(logging, logger_level))
 
 
+def setup_logging_from_settings(settings: Settings) -> None:
+    """setup_logging with the BOOK_API_LOG_* settings."""
+    setup_logging(
+        level=settings.log_level,
+        use_queue=settings.log_queue,
+        sample_rates=parse_logger_values(settings.log_sample_rates),
+        rate_limits=parse_logger_values(settings.log_rate_limits)
+    )
+
+
+def stop_logging() -> None:
+    """Remove the handlers setup_logging installed, writing out what is still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    root = logging.getLogger()
+    while _handlers:
+        root.removeHandler(_handlers.pop())
+    while _foreign_filters:
+        handler, log_filter = _foreign_filters.pop()
+        handler.removeFilter(log_filter)
+
+
+atexit.register(stop_logging)
+
+
 def get_typed_logger(name: str) -> logging.Logger:
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
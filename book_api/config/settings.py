@@ -0,0 +1,134 @@
+"""
+Application settings.
+Values are read from environment variables so deployments can tune the API without code changes.
+"""
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return value.strip().lower() in ("1", "true", "yes", "on") if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.getenv(name) or default
+
+
+@dataclass(frozen=True)
+class Settings:
+    # SQLite database file shared by the API and the crawler
+    database_path: str = "./book_api/app/books.db"
+    # SQLite engine profile, applied with PRAGMAs on every new connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # bytes
+    sqlite_cache_size: int = -64 * 1024  # negative = KiB, so 64 MiB per connection
+    sqlite_busy_timeout_ms: int = 5000
+    # Readers open the file with mode=ro through their own pool
+    sqlite_read_only: bool = True
+    sqlite_read_pool_size: int = 8
+    sqlite_read_pool_overflow: int = 8
+    # Read-through cache around services and repositories
+    cache_max_entries: int = 512
+    cache_ttl_seconds: float = 300.0
+    # Also cache lists of books; off with several workers, where each would keep its own copy
+    cache_book_lists: bool = True
+    # How often the dataset version is probed (seconds)
+    dataset_version_check_interval: float = 1.0
+    # max-age sent with ETag'd read responses (0 = always revalidate)
+    http_cache_max_age: int = 0
+    # Serve routes from the async (aiosqlite) stack instead of the threadpool one
+    async_database: bool = False
+    # Where aggregates are computed: "python" (ORM rows), "numpy" (in-memory columnar snapshot) or "duckdb"
+    analytics_backend: str = "python"
+    # With the numpy backend: publish the snapshot here and memory-map it, so workers share one copy
+    snapshot_dir: str = ""
+    # Where book lists are read: "sqlite" or "duckdb" (scans only, lookups by ID / UPC stay on SQLite)
+    book_repository_backend: str = "sqlite"
+    # What the DuckDB backends read: "sqlite" (copy of the database, refreshed per dataset version)
+    # or a Parquet file / glob
+    duckdb_source: str = "sqlite"
+    # Per-route request and SQL metrics, exposed at /metrics
+    metrics_enabled: bool = True
+    # Slow-query log and per-request query budget / N+1 detection (instrumentation mode)
+    query_inspection: bool = False
+    slow_query_ms: float = 100.0
+    query_budget: int = 10
+    repeated_query_limit: int = 5
+    # Raise on budget violations instead of logging them, for test builds
+    query_inspection_strict: bool = False
+    # Requests sending this value in X-Profile-Token are profiled (empty = profiling disabled)
+    profiling_secret: str = ""
+    # Directory for the collapsed-stack profiles; empty = return the profile as the response body
+    profiling_output_dir: str = ""
+    profiling_interval_ms: float = 1.0
+    # OpenTelemetry spans per layer and per SQL statement: "console", "file" or empty (off)
+    tracing_exporter: str = ""
+    tracing_file: str = "traces.jsonl"
+    # Log records go through a queue to a writer thread; sampling and rate limits are
+    # "logger=value" lists, e.g. "book_api.use_cases=0.01" / "book_api.interface.api=50"
+    log_level: str = "INFO"
+    log_queue: bool = True
+    log_sample_rates: str = ""
+    log_rate_limits: str = ""
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from BOOK_API_* environment variables."""
+        return cls(
+            database_path=_env_str("BOOK_API_DATABASE_PATH", cls.database_path),
+            sqlite_journal_mode=_env_str("BOOK_API_SQLITE_JOURNAL_MODE", cls.sqlite_journal_mode),
+            sqlite_synchronous=_env_str("BOOK_API_SQLITE_SYNCHRONOUS", cls.sqlite_synchronous),
+            sqlite_mmap_size=_env_int("BOOK_API_SQLITE_MMAP_SIZE", cls.sqlite_mmap_size),
+            sqlite_cache_size=_env_int("BOOK_API_SQLITE_CACHE_SIZE", cls.sqlite_cache_size),
+            sqlite_busy_timeout_ms=_env_int("BOOK_API_SQLITE_BUSY_TIMEOUT_MS", cls.sqlite_busy_timeout_ms),
+            sqlite_read_only=_env_bool("BOOK_API_SQLITE_READ_ONLY", cls.sqlite_read_only),
+            sqlite_read_pool_size=_env_int("BOOK_API_SQLITE_READ_POOL_SIZE", cls.sqlite_read_pool_size),
+            sqlite_read_pool_overflow=_env_int("BOOK_API_SQLITE_READ_POOL_OVERFLOW", cls.sqlite_read_pool_overflow),
+            cache_max_entries=_env_int("BOOK_API_CACHE_MAX_ENTRIES", cls.cache_max_entries),
+            cache_ttl_seconds=_env_float("BOOK_API_CACHE_TTL_SECONDS", cls.cache_ttl_seconds),
+            cache_book_lists=_env_bool("BOOK_API_CACHE_BOOK_LISTS", cls.cache_book_lists),
+            dataset_version_check_interval=_env_float(
+                "BOOK_API_DATASET_VERSION_CHECK_INTERVAL", cls.dataset_version_check_interval
+            ),
+            http_cache_max_age=_env_int("BOOK_API_HTTP_CACHE_MAX_AGE", cls.http_cache_max_age),
+            async_database=_env_bool("BOOK_API_ASYNC_DATABASE", cls.async_database),
+            analytics_backend=_env_str("BOOK_API_ANALYTICS_BACKEND", cls.analytics_backend).lower(),
+            snapshot_dir=_env_str("BOOK_API_SNAPSHOT_DIR", cls.snapshot_dir),
+            book_repository_backend=_env_str(
+                "BOOK_API_BOOK_REPOSITORY_BACKEND", cls.book_repository_backend
+            ).lower(),
+            duckdb_source=_env_str("BOOK_API_DUCKDB_SOURCE", cls.duckdb_source),
+            metrics_enabled=_env_bool("BOOK_API_METRICS_ENABLED", cls.metrics_enabled),
+            query_inspection=_env_bool("BOOK_API_QUERY_INSPECTION", cls.query_inspection),
+            slow_query_ms=_env_float("BOOK_API_SLOW_QUERY_MS", cls.slow_query_ms),
+            query_budget=_env_int("BOOK_API_QUERY_BUDGET", cls.query_budget),
+            repeated_query_limit=_env_int("BOOK_API_REPEATED_QUERY_LIMIT", cls.repeated_query_limit),
+            query_inspection_strict=_env_bool("BOOK_API_QUERY_INSPECTION_STRICT", cls.query_inspection_strict),
+            profiling_secret=_env_str("BOOK_API_PROFILING_SECRET", cls.profiling_secret),
+            profiling_output_dir=_env_str("BOOK_API_PROFILING_OUTPUT_DIR", cls.profiling_output_dir),
+            profiling_interval_ms=_env_float("BOOK_API_PROFILING_INTERVAL_MS", cls.profiling_interval_ms),
+            tracing_exporter=_env_str("BOOK_API_TRACING_EXPORTER", cls.tracing_exporter).lower(),
+            tracing_file=_env_str("BOOK_API_TRACING_FILE", cls.tracing_file),
+            log_level=_env_str("BOOK_API_LOG_LEVEL", cls.log_level).upper(),
+            log_queue=_env_bool("BOOK_API_LOG_QUEUE", cls.log_queue),
+            log_sample_rates=_env_str("BOOK_API_LOG_SAMPLE", cls.log_sample_rates),
+            log_rate_limits=_env_str("BOOK_API_LOG_RATE_LIMIT", cls.log_rate_limits),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    return Settings.from_env()
@@ -3,8 +3,12 @@ from typing import Optional
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
+    """
+    Book entity. Slotted: no per-instance __dict__, which matters for list endpoints holding the whole catalog.
+    Build it with the constructor for external input (validated), or `from_trusted` for rows read back from our database.
+    """
     id: int
     title: str
     genre_id: int
@@ -18,6 +22,41 @@ class Book:
     review_number: Optional[int] = None
     description: Optional[str] = None
 
+    @classmethod
+    def from_trusted(
+        cls,
+        id: int,
+        title: str,
+        genre_id: int,
+        note: Optional[int] = None,
+        stock_number: Optional[int] = None,
+        datetime: Optional[str] = None,
+        upc: Optional[str] = None,
+        product_type: Optional[str] = None,
+        price_ht: Optional[Decimal] = None,
+        price_taxed: Optional[Decimal] = None,
+        review_number: Optional[int] = None,
+        description: Optional[str] = None
+    ) -> 'Book':
+        """
+        Create Book without running the validators.
+        Only for data that already satisfies the business rules, such as repository reads.
+        """
+        book = object.__new__(cls)
+        book.id = id
+        book.title = title
+        book.genre_id = genre_id
+        book.note = note
+        book.stock_number = stock_number
+        book.datetime = datetime
+        book.upc = upc
+        book.product_type = product_type
+        book.price_ht = price_ht
+        book.price_taxed = price_taxed
+        book.review_number = review_number
+        book.description = description
+        return book
+
     def __post_init__(self):
         """Validate business rules after initialization."""
         self._validate_note()
@@ -0,0 +1,11 @@
+"""
+Errors raised by the use cases that the routes turn into specific HTTP statuses.
+"""
+
+
+class GenreNotFoundError(ValueError):
+    """No genre with the requested ID; routes answer 404, other ValueErrors are invalid parameters."""
+
+    def __init__(self, genre_id: int):
+        super().__init__("Genre not found")
+        self.genre_id = genre_id
@@ -0,0 +1,36 @@
+"""
+Value object describing a multi-criteria book search.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class BookCriteria:
+    """
+    Optional filters combined with AND. A None field does not filter.
+    Price bounds are inclusive and apply to the taxed price.
+    """
+    genre_id: Optional[int] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_rating: Optional[int] = None
+    in_stock: Optional[bool] = None
+    min_reviews: Optional[int] = None
+
+    def __post_init__(self):
+        """Validate filter bounds."""
+        if self.min_price is not None and self.min_price < 0:
+            raise ValueError("Minimum price cannot be negative")
+        if self.max_price is not None and self.max_price < 0:
+            raise ValueError("Maximum price cannot be negative")
+        if self.min_price is not None and self.max_price is not None and self.min_price > self.max_price:
+            raise ValueError("Minimum price cannot be greater than maximum price")
+        if self.min_rating is not None and not (1 <= self.min_rating <= 5):
+            raise ValueError("Minimum rating must be between 1 and 5")
+        if self.min_reviews is not None and self.min_reviews < 0:
+            raise ValueError("Minimum reviews cannot be negative")
+
+    def is_empty(self) -> bool:
+        """True when no filter is set."""
+        return all(value is None for value in vars(self).values())
@@ -0,0 +1,42 @@
+"""
+Value object describing how a list of books is ordered.
+"""
+from dataclasses import dataclass
+
+# Public sort key -> Book attribute
+SORT_FIELDS = {
+    "price": "price_taxed",
+    "rating": "note",
+    "stock": "stock_number",
+    "reviews": "review_number",
+}
+
+
+@dataclass(frozen=True)
+class BookSort:
+    """
+    Order by one book field, ties broken by ID in the same direction.
+    Books without a value for the field are left out of sorted lists.
+    """
+    field: str
+    descending: bool = False
+
+    def __post_init__(self):
+        """Validate sort field."""
+        if self.field not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort by {self.field}, expected one of: {', '.join(SORT_FIELDS)}")
+
+    @classmethod
+    def parse(cls, value: str) -> 'BookSort':
+        """Create BookSort from 'field' (ascending) or '-field' (descending)."""
+        if value.startswith("-"):
+            return cls(value[1:], descending=True)
+        return cls(value)
+
+    @property
+    def attribute(self) -> str:
+        """Book attribute (and column) the sort applies to."""
+        return SORT_FIELDS[self.field]
+
+    def __str__(self) -> str:
+        return f"-{self.field}" if self.descending else self.field
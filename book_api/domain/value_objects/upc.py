@@ -0,0 +1,16 @@
+"""
+UPC helpers shared by the clean API and the legacy app.
+UPCs are stored as lowercase hex, so lookups normalise their input the same way.
+"""
+
+
+def normalize_upc(upc: str) -> str:
+    """The stored form of a UPC or UPC prefix typed by a client."""
+    return upc.strip().lower()
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix (text compares code point by code point)."""
+    if not prefix:
+        raise ValueError("UPC prefix must not be empty")
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
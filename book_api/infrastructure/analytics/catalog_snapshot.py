@@ -0,0 +1,168 @@
+"""
+Columnar snapshot of the catalog.
+The numeric book columns are held in contiguous NumPy arrays so analytics never go through the ORM.
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from book_api.infrastructure.database.models import BookModel
+
+logger = logging.getLogger(__name__)
+
+# Missing genre IDs are stored as -1, every other missing value as NaN
+MISSING_GENRE = -1
+
+Rows = Union[slice, np.ndarray]
+_NO_ROWS = np.empty(0, dtype=np.int64)
+
+COLUMNS = ("ids", "genre_id", "note", "stock_number", "price_ht", "price_taxed", "review_number")
+# Per-genre row lists are stored as one array in genre order plus the offset of each genre
+_GENRE_FILES = ("genre_keys", "genre_starts", "genre_order")
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    Immutable, read-only arrays for one dataset version, rows ordered by book ID.
+    A refresh builds a new snapshot; readers keep whichever one they started with.
+    """
+    version: str
+    ids: np.ndarray
+    genre_id: np.ndarray
+    note: np.ndarray
+    stock_number: np.ndarray
+    price_ht: np.ndarray
+    price_taxed: np.ndarray
+    review_number: np.ndarray
+    genre_rows: Dict[int, np.ndarray]
+
+    @classmethod
+    def load(cls, session: Session, version: str) -> "CatalogSnapshot":
+        """Read the numeric columns in one query and pack them into arrays."""
+        rows = session.query(
+            BookModel.id,
+            BookModel.genre_id,
+            BookModel.note,
+            BookModel.stock_number,
+            BookModel.price_ht,
+            BookModel.price_taxed,
+            BookModel.review_number
+        ).order_by(BookModel.id).all()
+        ids, genre_ids, notes, stocks, prices_ht, prices_taxed, reviews = zip(*rows) if rows else ((),) * 7
+
+        genre_id = np.array(
+            [MISSING_GENRE if value is None else value for value in genre_ids], dtype=np.int64
+        )
+        # None becomes NaN with a float dtype
+        columns = {
+            "ids": np.array(ids, dtype=np.int64),
+            "genre_id": genre_id,
+            "note": np.array(notes, dtype=np.float64),
+            "stock_number": np.array(stocks, dtype=np.float64),
+            "price_ht": np.array(prices_ht, dtype=np.float64),
+            "price_taxed": np.array(prices_taxed, dtype=np.float64),
+            "review_number": np.array(reviews, dtype=np.float64),
+        }
+        for array in columns.values():
+            array.flags.writeable = False
+
+        order = np.argsort(genre_id, kind="stable")  # Stable: rows stay in ID order within a genre
+        genres, starts = np.unique(genre_id[order], return_index=True)
+        for array in (order, genres, starts):
+            array.flags.writeable = False
+
+        return cls(version=version, genre_rows=_genre_rows(genres, starts, order), **columns)
+
+    def save(self, directory: str) -> None:
+        """Write every array to `directory` as one .npy file, the format `open` maps back."""
+        genres = sorted(self.genre_rows)
+        sizes = np.array([self.genre_rows[genre].size for genre in genres], dtype=np.int64)
+        arrays = {name: getattr(self, name) for name in COLUMNS}
+        arrays.update(
+            genre_keys=np.array(genres, dtype=np.int64),
+            genre_starts=np.cumsum(sizes) - sizes,
+            genre_order=np.concatenate([self.genre_rows[genre] for genre in genres] or [_NO_ROWS]),
+        )
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), array, allow_pickle=False)
+
+    @classmethod
+    def open(cls, directory: str, version: str) -> "CatalogSnapshot":
+        """
+        Map a saved snapshot read-only: nothing is copied, pages are read on demand and
+        shared with every other process mapping the same files.
+        """
+        def mapped(name: str) -> np.ndarray:
+            # asarray drops the memmap subclass, so results of operations are plain arrays
+            return np.asarray(np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r", allow_pickle=False))
+
+        genres, starts, order = (mapped(name) for name in _GENRE_FILES)
+        return cls(
+            version=version,
+            genre_rows=_genre_rows(genres, starts, order),
+            **{name: mapped(name) for name in COLUMNS}
+        )
+
+    def __len__(self) -> int:
+        return int(self.ids.size)
+
+    def rows(self, genre_id: Optional[int] = None) -> Rows:
+        """Row selector for the whole catalog or one genre."""
+        if genre_id is None:
+            return slice(None)
+        return self.genre_rows.get(genre_id, _NO_ROWS)
+
+    def column(self, name: str, genre_id: Optional[int] = None) -> np.ndarray:
+        """One column, for the whole catalog (a view) or one genre (a copy)."""
+        return getattr(self, name)[self.rows(genre_id)]
+
+
+def _genre_rows(genres: np.ndarray, starts: np.ndarray, order: np.ndarray) -> Dict[int, np.ndarray]:
+    """Genre ID -> row positions, as views into `order`."""
+    if not order.size:
+        return {}
+    return dict(zip(genres.tolist(), np.split(order, starts[1:])))
+
+
+class CatalogSnapshotProvider:
+    """
+    Hands out the snapshot matching the current dataset version.
+    When the version moves, one caller rebuilds it and swaps the reference; the others keep reading the old one.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], version: Callable[[], str]):
+        self._session_factory = session_factory
+        self._version = version
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    def current(self) -> CatalogSnapshot:
+        version = self._version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._load(version)
+            return self._snapshot
+
+    def _load(self, version: str) -> CatalogSnapshot:
+        start = time.perf_counter()
+        session = self._session_factory()
+        try:
+            snapshot = CatalogSnapshot.load(session, version)
+        finally:
+            session.close()
+        logger.info(
+            "Catalog snapshot %s loaded: %s books in %.1f ms",
+            version, len(snapshot), (time.perf_counter() - start) * 1000
+        )
+        return snapshot
@@ -0,0 +1,179 @@
+"""
+Embedded DuckDB copy of the catalog.
+
+Aggregates read whole columns, which SQLite's row storage serves one row at a time.
+DuckDB stores the books table column by column and scans it with vectorised,
+multi-threaded operators, so averages, group-bys and percentiles stay fast as the
+catalog grows. Point lookups do not benefit and stay on SQLite.
+
+Sources:
+  - "sqlite": the SQLite file, copied into DuckDB once per dataset version, through
+    DuckDB's sqlite extension when it can be loaded, otherwise in batches via sqlite3
+  - anything else is a Parquet file or glob, queried in place (already columnar)
+
+duckdb is optional and only imported when a DuckDB backend is selected.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SOURCE = "sqlite"
+
+# Every books column but the description, which only the detail route and the exports read (from SQLite)
+BOOK_COLUMNS = (
+    "id", "title", "genre_id", "note", "stock_number", "datetime",
+    "upc", "product_type", "price_ht", "price_taxed", "review_number",
+)
+_TEXT_COLUMNS = frozenset(("title", "datetime", "upc", "product_type"))
+_TABLE_SCHEMA = """
+    id BIGINT, title VARCHAR, genre_id BIGINT, note BIGINT, stock_number BIGINT, datetime VARCHAR,
+    upc VARCHAR, product_type VARCHAR, price_ht DOUBLE, price_taxed DOUBLE, review_number BIGINT
+"""
+
+
+class DuckDBCatalog:
+    """
+    One in-process DuckDB database holding a `books` table (or view) for the current dataset version.
+    A refresh builds the new table beside the old one and swaps them in one transaction:
+    queries already running finish on the old data.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        database_path: str,
+        version: Callable[[], str],
+        batch_size: int = 10_000
+    ):
+        if duckdb is None:
+            raise RuntimeError("The DuckDB backend needs duckdb: pip install duckdb")
+        self.source = source
+        self.database_path = database_path
+        self.batch_size = batch_size
+        self._version = version
+        # Never download extensions while serving: the sqlite extension is used only when already installed
+        self._connection = duckdb.connect(config={"autoinstall_known_extensions": False})
+        self._lock = threading.Lock()
+        self._loaded_version: Optional[str] = None
+        self._sqlite_extension: Optional[bool] = None
+
+    def fetchall(self, statement: str, parameters: Sequence[Any] = ()) -> List[Tuple]:
+        """Run statement against the current books table on a cursor of its own (thread-safe)."""
+        self._refresh()
+        cursor = self._connection.cursor()
+        try:
+            return cursor.execute(statement, list(parameters)).fetchall()
+        finally:
+            cursor.close()
+
+    def export_parquet(self, path: str) -> None:
+        """Write the current books table to a Parquet file, a source for other instances."""
+        self._refresh()
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(f"COPY (SELECT * FROM books ORDER BY id) TO {_literal(path)} (FORMAT parquet)")
+        finally:
+            cursor.close()
+
+    def _refresh(self) -> None:
+        # Parquet files are read in place, the view picks up new files of a glob on each query
+        version = self._version() if self.source == SQLITE_SOURCE else self.source
+        if version == self._loaded_version:
+            return
+        with self._lock:
+            if version != self._loaded_version:
+                self._load(version)
+                self._loaded_version = version
+
+    def _load(self, version: str) -> None:
+        start = time.perf_counter()
+        cursor = self._connection.cursor()
+        try:
+            if self.source != SQLITE_SOURCE:
+                cursor.execute(
+                    f"CREATE OR REPLACE VIEW books AS SELECT {', '.join(BOOK_COLUMNS)} "
+                    f"FROM read_parquet({_literal(self.source)})"
+                )
+                logger.info("DuckDB catalog reading Parquet from %s", self.source)
+                return
+
+            cursor.execute(f"CREATE OR REPLACE TABLE books_next ({_TABLE_SCHEMA})")
+            if not self._copy_with_extension(cursor):
+                self._copy_with_sqlite3(cursor)
+            cursor.execute("BEGIN TRANSACTION")
+            cursor.execute("DROP TABLE IF EXISTS books")
+            cursor.execute("ALTER TABLE books_next RENAME TO books")
+            cursor.execute("COMMIT")
+            rows = cursor.execute("SELECT count(*) FROM books").fetchone()[0]
+        finally:
+            cursor.close()
+        logger.info(
+            "DuckDB catalog %s loaded: %s books in %.1f ms", version, rows, (time.perf_counter() - start) * 1000
+        )
+
+    def _copy_with_extension(self, cursor) -> bool:
+        """
+        Bulk copy through sqlite_scan; False when the extension is not installed
+        (`python -c "import duckdb; duckdb.execute('INSTALL sqlite')"` installs it once per machine).
+        """
+        if self._sqlite_extension is None:
+            try:
+                cursor.execute("LOAD sqlite")
+                self._sqlite_extension = True
+            except duckdb.Error as e:
+                reason = str(e).splitlines()[0]
+                logger.warning("DuckDB sqlite extension unavailable, copying through sqlite3 instead: %s", reason)
+                self._sqlite_extension = False
+        if not self._sqlite_extension:
+            return False
+        cursor.execute(
+            f"INSERT INTO books_next SELECT {', '.join(BOOK_COLUMNS)} "
+            f"FROM sqlite_scan({_literal(self.database_path)}, 'books')"
+        )
+        return True
+
+    def _copy_with_sqlite3(self, cursor) -> None:
+        """
+        Copy batch_size rows at a time, each batch handed to DuckDB as typed NumPy columns.
+        Object arrays are far slower to scan, so numbers travel as float64 (NaN arrives as NULL)
+        and text as str arrays with a null mask.
+        """
+        import numpy as np
+
+        select = ", ".join(
+            f"CASE WHEN {name}_is_null THEN NULL ELSE {name} END" if name in _TEXT_COLUMNS else name
+            for name in BOOK_COLUMNS
+        )
+        source = sqlite3.connect(f"file:{self.database_path}?mode=ro", uri=True)
+        try:
+            rows = source.execute(f"SELECT {', '.join(BOOK_COLUMNS)} FROM books")
+            while True:
+                batch = rows.fetchmany(self.batch_size)
+                if not batch:
+                    break
+                columns = {}
+                for name, values in zip(BOOK_COLUMNS, zip(*batch)):
+                    if name in _TEXT_COLUMNS:
+                        columns[name] = np.array(["" if value is None else value for value in values], dtype=np.str_)
+                        columns[f"{name}_is_null"] = np.array([value is None for value in values])
+                    else:
+                        columns[name] = np.array(values, dtype=np.float64)  # None becomes NaN
+                cursor.register("books_batch", columns)
+                cursor.execute(f"INSERT INTO books_next SELECT {select} FROM books_batch")
+                cursor.unregister("books_batch")
+        finally:
+            source.close()
+
+
+def _literal(value: str) -> str:
+    """SQL string literal, for the statements that take no parameters (DDL, COPY)."""
+    return "'" + value.replace("'", "''") + "'"
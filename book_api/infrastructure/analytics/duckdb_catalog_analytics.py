@@ -0,0 +1,148 @@
+"""
+Catalog analytics in DuckDB.
+Each aggregate is one SQL statement over the columnar copy of the catalog.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.use_cases.interfaces.catalog_analytics import ICatalogAnalytics, ANALYTICS_COLUMNS
+from book_api.use_cases.services.book_statistics import SAMPLE_SIZE
+from book_api.infrastructure.analytics.duckdb_catalog import DuckDBCatalog
+
+
+class DuckDBCatalogAnalytics(ICatalogAnalytics):
+    """
+    ICatalogAnalytics over a DuckDBCatalog.
+    Results have the same shape, and rounding, as the Python and NumPy backends.
+    """
+
+    def __init__(self, catalog: DuckDBCatalog):
+        self.catalog = catalog
+
+    def price_summary(self, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        where, parameters = _genre_filter(genre_id)
+        total, with_price, average = self.catalog.fetchall(
+            f"SELECT count(*), count(*) FILTER (price_taxed > 0), avg(price_taxed) FILTER (price_taxed > 0) "
+            f"FROM books{where}",
+            parameters
+        )[0]
+        sample = self._sample("price_taxed", "price_taxed > 0", genre_id) if with_price else []
+        return {
+            "total_books": total,
+            "books_with_price": with_price,
+            "average_price": round(average, 2) if with_price else 0.0,
+            "sample_prices": sample,
+        }
+
+    def stock_summary(self, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        where, parameters = _genre_filter(genre_id)
+        total, with_stock, average = self.catalog.fetchall(
+            f"SELECT count(*), count(stock_number), avg(stock_number) FROM books{where}", parameters
+        )[0]
+        sample = self._sample("stock_number", "stock_number IS NOT NULL", genre_id) if with_stock else []
+        return {
+            "total_books": total,
+            "books_with_stock": with_stock,
+            "average_stock": int(round(average, 0)) if with_stock else 0,
+            "sample_stocks": sample,
+        }
+
+    def histogram(self, column: str, bins: int = 10, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        _check_column(column)
+        where, parameters = _genre_filter(genre_id, f"{column} IS NOT NULL")
+
+        low, high = self.catalog.fetchall(f"SELECT min({column}), max({column}) FROM books{where}", parameters)[0]
+        if low is None:
+            low, high = 0.0, 1.0
+        low, high = float(low), float(high)
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        width = (high - low) / bins
+
+        # Same binning as book_statistics.histogram: the last bin includes its right edge
+        rows = self.catalog.fetchall(
+            f"SELECT least(floor(({column} - ?) / ?)::BIGINT, ?) AS bin, count(*) FROM books{where} GROUP BY bin",
+            [low, width, bins - 1, *parameters]
+        )
+        counts = [0] * bins
+        for index, count in rows:
+            counts[index] = count
+        return {"edges": [low + i * width for i in range(bins)] + [high], "counts": counts}
+
+    def percentiles(self, column: str, percents: Sequence[float], genre_id: Optional[int] = None) -> Dict[str, Any]:
+        _check_column(column)
+        where, parameters = _genre_filter(genre_id, f"{column} IS NOT NULL")
+        count, values = self.catalog.fetchall(
+            f"SELECT count(*), quantile_cont({column}, ?) FROM books{where}",
+            [[percent / 100 for percent in percents], *parameters]
+        )[0]
+        if not count:
+            return {"count": 0, "values": [None] * len(percents)}
+        return {"count": count, "values": [float(value) for value in values]}
+
+    def genre_summary(self) -> List[Dict[str, Any]]:
+        rows = self.catalog.fetchall(
+            "SELECT genre_id, count(*), count(*) FILTER (price_taxed > 0), avg(price_taxed) FILTER (price_taxed > 0), "
+            "count(stock_number), avg(stock_number) "
+            "FROM books WHERE genre_id IS NOT NULL GROUP BY genre_id ORDER BY genre_id"
+        )
+        return [
+            {
+                "genre_id": genre_id,
+                "total_books": total,
+                "books_with_price": with_price,
+                "average_price": round(average_price, 2) if with_price else 0.0,
+                "books_with_stock": with_stock,
+                "average_stock": int(round(average_stock, 0)) if with_stock else 0,
+            }
+            for genre_id, total, with_price, average_price, with_stock, average_stock in rows
+        ]
+
+    def count(self, criteria: BookCriteria) -> int:
+        conditions, parameters = [], []
+        if criteria.genre_id is not None:
+            conditions.append("genre_id = ?")
+            parameters.append(criteria.genre_id)
+        if criteria.min_price is not None or criteria.max_price is not None:
+            conditions.append("price_taxed > 0")
+            if criteria.min_price is not None:
+                conditions.append("price_taxed >= ?")
+                parameters.append(criteria.min_price)
+            if criteria.max_price is not None:
+                conditions.append("price_taxed <= ?")
+                parameters.append(criteria.max_price)
+        if criteria.min_rating is not None:
+            conditions.append("note >= ?")
+            parameters.append(criteria.min_rating)
+        if criteria.in_stock is True:
+            conditions.append("stock_number > 0")
+        elif criteria.in_stock is False:
+            conditions.append("(stock_number IS NULL OR stock_number <= 0)")
+        if criteria.min_reviews is not None:
+            conditions.append("review_number >= ?")
+            parameters.append(criteria.min_reviews)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.catalog.fetchall(f"SELECT count(*) FROM books{where}", parameters)[0][0]
+
+    def _sample(self, column: str, condition: str, genre_id: Optional[int]) -> list:
+        where, parameters = _genre_filter(genre_id, condition)
+        rows = self.catalog.fetchall(
+            f"SELECT {column} FROM books{where} ORDER BY id LIMIT {SAMPLE_SIZE}", parameters
+        )
+        return [value for value, in rows]
+
+
+def _check_column(column: str) -> None:
+    # Column names are interpolated into SQL, so only the known numeric columns get through
+    if column not in ANALYTICS_COLUMNS:
+        raise ValueError(f"Unknown column: {column}")
+
+
+def _genre_filter(genre_id: Optional[int], condition: Optional[str] = None) -> Tuple[str, list]:
+    conditions = [condition] if condition else []
+    parameters = []
+    if genre_id is not None:
+        conditions.append("genre_id = ?")
+        parameters.append(genre_id)
+    return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), parameters
@@ -0,0 +1,119 @@
+"""
+Vectorised catalog analytics.
+Answers averages, histograms, percentiles, per-genre summaries and filtered counts from the in-memory columnar snapshot.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.use_cases.interfaces.catalog_analytics import ICatalogAnalytics, ANALYTICS_COLUMNS
+from book_api.use_cases.services.book_statistics import SAMPLE_SIZE
+from book_api.infrastructure.analytics.catalog_snapshot import MISSING_GENRE, CatalogSnapshotProvider
+
+
+class NumpyCatalogAnalytics(ICatalogAnalytics):
+    """
+    ICatalogAnalytics over a CatalogSnapshot.
+    Each call grabs one snapshot, so a concurrent refresh never mixes two versions in one answer.
+    """
+
+    def __init__(self, snapshots: CatalogSnapshotProvider):
+        self.snapshots = snapshots
+
+    def price_summary(self, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        prices = self.snapshots.current().column("price_taxed", genre_id)
+        valid = prices[prices > 0]  # NaN compares False, so missing prices drop out too
+
+        if not valid.size:
+            return {
+                "total_books": int(prices.size),
+                "books_with_price": 0,
+                "average_price": 0.0,
+                "sample_prices": [],
+            }
+
+        return {
+            "total_books": int(prices.size),
+            "books_with_price": int(valid.size),
+            "average_price": round(float(valid.sum()) / valid.size, 2),
+            "sample_prices": valid[:SAMPLE_SIZE].tolist(),
+        }
+
+    def stock_summary(self, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        stocks = self.snapshots.current().column("stock_number", genre_id)
+        valid = stocks[~np.isnan(stocks)]
+
+        if not valid.size:
+            return {
+                "total_books": int(stocks.size),
+                "books_with_stock": 0,
+                "average_stock": 0,
+                "sample_stocks": [],
+            }
+
+        return {
+            "total_books": int(stocks.size),
+            "books_with_stock": int(valid.size),
+            "average_stock": int(round(float(valid.sum()) / valid.size, 0)),
+            "sample_stocks": valid[:SAMPLE_SIZE].astype(np.int64).tolist(),
+        }
+
+    def histogram(self, column: str, bins: int = 10, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        if column not in ANALYTICS_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+
+        values = self.snapshots.current().column(column, genre_id)
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+        return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+    def percentiles(self, column: str, percents: Sequence[float], genre_id: Optional[int] = None) -> Dict[str, Any]:
+        if column not in ANALYTICS_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+
+        values = self.snapshots.current().column(column, genre_id)
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return {"count": 0, "values": [None] * len(percents)}
+        return {"count": int(values.size), "values": np.percentile(values, list(percents)).tolist()}
+
+    def genre_summary(self) -> List[Dict[str, Any]]:
+        snapshot = self.snapshots.current()
+        summaries = []
+        for genre_id in sorted(genre for genre in snapshot.genre_rows if genre != MISSING_GENRE):
+            rows = snapshot.genre_rows[genre_id]
+            prices = snapshot.price_taxed[rows]
+            prices = prices[prices > 0]
+            stocks = snapshot.stock_number[rows]
+            stocks = stocks[~np.isnan(stocks)]
+            summaries.append({
+                "genre_id": genre_id,
+                "total_books": int(rows.size),
+                "books_with_price": int(prices.size),
+                "average_price": round(float(prices.sum()) / prices.size, 2) if prices.size else 0.0,
+                "books_with_stock": int(stocks.size),
+                "average_stock": int(round(float(stocks.sum()) / stocks.size, 0)) if stocks.size else 0,
+            })
+        return summaries
+
+    def count(self, criteria: BookCriteria) -> int:
+        snapshot = self.snapshots.current()
+        rows = snapshot.rows(criteria.genre_id)
+        mask = np.ones(snapshot.ids[rows].size, dtype=bool)
+
+        # NaN (missing value) compares false, as NULL does in SQL
+        if criteria.min_price is not None or criteria.max_price is not None:
+            prices = snapshot.price_taxed[rows]
+            mask &= prices > 0
+            if criteria.min_price is not None:
+                mask &= prices >= criteria.min_price
+            if criteria.max_price is not None:
+                mask &= prices <= criteria.max_price
+        if criteria.min_rating is not None:
+            mask &= snapshot.note[rows] >= criteria.min_rating
+        if criteria.in_stock is not None:
+            mask &= (snapshot.stock_number[rows] > 0) == criteria.in_stock
+        if criteria.min_reviews is not None:
+            mask &= snapshot.review_number[rows] >= criteria.min_reviews
+
+        return int(np.count_nonzero(mask))
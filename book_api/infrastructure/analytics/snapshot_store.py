@@ -0,0 +1,145 @@
+"""
+On-disk catalog snapshots shared by the worker processes.
+
+Layout of the snapshot directory:
+  v12.1718000000000000000/   one directory per published snapshot, one .npy file per array
+  v13.1718000360000000000/
+  CURRENT                    name of the live snapshot
+  .lock                      held while a snapshot is built, so only one process builds it
+
+A snapshot is written under a temporary name and renamed into place, then CURRENT is
+swapped with os.replace: a reader sees the old snapshot or the new one, never half of one.
+Workers map the files read-only, so N workers share one copy of the catalog in the page cache.
+"""
+import logging
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from book_api.infrastructure.analytics.catalog_snapshot import CatalogSnapshot, CatalogSnapshotProvider
+
+try:
+    import fcntl
+except ImportError:  # Windows: no shared lock, a concurrent build only costs a duplicate publish
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+_LOCK_FILE = ".lock"
+_TMP_PREFIX = ".tmp-"
+
+
+class SnapshotStore:
+    """Publishes snapshots to a directory and maps the current one back."""
+
+    def __init__(self, directory: str, keep: int = 2):
+        self.directory = directory
+        # Older snapshots may still be mapped by a worker mid-request; POSIX keeps unlinked files alive anyway
+        self.keep = max(keep, 1)
+        os.makedirs(directory, exist_ok=True)
+        self._thread_lock = threading.Lock()
+
+    @staticmethod
+    def version_of(name: str) -> str:
+        """Dataset version a snapshot was built from, taken from its directory name."""
+        return name.rsplit(".", 1)[0]
+
+    def current_name(self) -> Optional[str]:
+        """Name of the live snapshot, None before the first publish."""
+        try:
+            with open(os.path.join(self.directory, CURRENT_FILE)) as current:
+                return current.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def open(self, name: str) -> CatalogSnapshot:
+        return CatalogSnapshot.open(os.path.join(self.directory, name), self.version_of(name))
+
+    def publish(self, snapshot: CatalogSnapshot) -> str:
+        """Write snapshot, make it current and return its name."""
+        name = f"{snapshot.version}.{time.time_ns()}"
+        staging = os.path.join(self.directory, f"{_TMP_PREFIX}{name}")
+        os.makedirs(staging)
+        snapshot.save(staging)
+        for file_name in os.listdir(staging):
+            _fsync(os.path.join(staging, file_name))
+        os.rename(staging, os.path.join(self.directory, name))
+
+        pointer = os.path.join(self.directory, f"{_TMP_PREFIX}{CURRENT_FILE}")
+        with open(pointer, "w") as current:
+            current.write(name)
+            current.flush()
+            os.fsync(current.fileno())
+        os.replace(pointer, os.path.join(self.directory, CURRENT_FILE))
+
+        self.prune()
+        return name
+
+    def snapshots(self) -> List[str]:
+        """Published snapshot names, oldest first."""
+        names = [
+            entry.name for entry in os.scandir(self.directory)
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+        return sorted(names, key=lambda name: int(name.rsplit(".", 1)[1]))
+
+    def prune(self) -> None:
+        """Delete all but the `keep` newest snapshots (never the current one)."""
+        current = self.current_name()
+        for name in self.snapshots()[:-self.keep]:
+            if name != current:
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Exclusive across threads and, where flock exists, across processes."""
+        with self._thread_lock, open(os.path.join(self.directory, _LOCK_FILE), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._remove_staging()  # Left behind by a builder that died; nobody else builds now
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _remove_staging(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.is_dir() and entry.name.startswith(_TMP_PREFIX):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+class MappedSnapshotProvider(CatalogSnapshotProvider):
+    """
+    CatalogSnapshotProvider for multi-worker deployments.
+    The first worker to see a new dataset version builds the snapshot and publishes it
+    to the store; every worker, that one included, serves the memory-mapped files.
+    """
+
+    def __init__(self, store: SnapshotStore, session_factory: Callable[[], Session], version: Callable[[], str]):
+        super().__init__(session_factory, version)
+        self.store = store
+
+    def _load(self, version: str) -> CatalogSnapshot:
+        name = self.store.current_name()
+        if name is None or self.store.version_of(name) != version:
+            with self.store.lock():
+                # Another worker may have published it while we waited
+                name = self.store.current_name()
+                if name is None or self.store.version_of(name) != version:
+                    name = self.store.publish(super()._load(version))
+                    logger.info("Catalog snapshot %s published to %s", name, self.store.directory)
+        snapshot = self.store.open(name)
+        logger.info("Catalog snapshot %s mapped: %s books", name, len(snapshot))
+        return snapshot
+
+
+def _fsync(path: str) -> None:
+    with open(path, "rb") as written:
+        os.fsync(written.fileno())
@@ -0,0 +1,135 @@
+"""
+Caching decorator for the book service.
+Same interface as BookService, but repeated reads are served from memory.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from book_api.use_cases.interfaces.book_service import IBookService
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.use_cases.services.ranking import rank_books
+from book_api.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+
+
+class CachedBookService(IBookService):
+    """
+    Read-through cache around another IBookService.
+    Results are keyed by method name and arguments and invalidated when the dataset version changes.
+    With cache_lists False, lists of books go straight to the service and only single books and
+    aggregates are cached: with several workers each one would otherwise hold its own copy of the catalog.
+    """
+
+    def __init__(
+        self,
+        service: IBookService,
+        cache: LRUTTLCache,
+        version: Callable[[], str],
+        cache_lists: bool = True
+    ):
+        self.service = service
+        self.cache = cache
+        self.version = version
+        self.cache_lists = cache_lists
+
+    def get_all_books(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        if not self.cache_lists:
+            return self.service.get_all_books(sort, limit)
+        if sort is None and limit is None:
+            return self._cached("get_all_books")
+        return self._ranked(sort, limit, "get_all_books")
+
+    def get_book(self, book_id: int) -> Optional[Book]:
+        return self._cached("get_book", book_id)
+
+    def iter_all_books(self, batch_size: int = 500) -> Iterator[Book]:
+        # Streams are meant for bulk exports, caching them would defeat bounded memory
+        return self.service.iter_all_books(batch_size)
+
+    def get_books_batch(self, book_ids: List[int], upcs: List[str]) -> Dict[str, Any]:
+        # Key sets rarely repeat, caching them would only churn the LRU
+        return self.service.get_books_batch(book_ids, upcs)
+
+    def get_book_by_upc(self, upc: str) -> Optional[Book]:
+        return self._cached("get_book_by_upc", upc)
+
+    def search_books_by_upc_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Book]:
+        if not self.cache_lists:
+            return self.service.search_books_by_upc_prefix(prefix, limit)
+        return self._cached("search_books_by_upc_prefix", prefix, limit)
+
+    def search_books(self, keyword: str) -> List[Book]:
+        if not self.cache_lists:
+            return self.service.search_books(keyword)
+        return self._cached("search_books", keyword)
+
+    def get_books_by_genre(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        if not self.cache_lists:
+            return self.service.get_books_by_genre(genre_id, sort, limit)
+        if sort is None and limit is None:
+            return self._cached("get_books_by_genre", genre_id)
+        return self._ranked(sort, limit, "get_books_by_genre", genre_id)
+
+    def query_books(
+        self,
+        criteria: BookCriteria,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        if not self.cache_lists:
+            return self.service.query_books(criteria, sort, limit)
+        if sort is None and limit is None:
+            return self._cached("query_books", criteria)
+        return self._ranked(sort, limit, "query_books", criteria)
+
+    def calculate_average_price_all(self) -> Dict[str, Any]:
+        return self._cached("calculate_average_price_all")
+
+    def calculate_average_price_by_genre(self, genre_id: int) -> Dict[str, Any]:
+        return self._cached("calculate_average_price_by_genre", genre_id)
+
+    def calculate_average_stock_all(self) -> Dict[str, Any]:
+        return self._cached("calculate_average_stock_all")
+
+    def calculate_average_stock_by_genre(self, genre_id: int) -> Dict[str, Any]:
+        return self._cached("calculate_average_stock_by_genre", genre_id)
+
+    def calculate_histogram(self, column: str, bins: int = 10, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        return self._cached("calculate_histogram", column, bins, genre_id)
+
+    def calculate_percentiles(
+        self,
+        column: str,
+        percents: Sequence[float],
+        genre_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        return self._cached("calculate_percentiles", column, tuple(percents), genre_id)
+
+    def calculate_genre_summary(self) -> List[Dict[str, Any]]:
+        return self._cached("calculate_genre_summary")
+
+    def count_books(self, criteria: BookCriteria) -> int:
+        return self._cached("count_books", criteria)
+
+    def _ranked(self, sort: Optional[BookSort], limit: Optional[int], method_name: str, *args: Any) -> List[Book]:
+        """
+        Sorted / top-k variant of a list method.
+        When the unsorted list is already cached it is ranked in memory, otherwise SQL does the ORDER BY ... LIMIT.
+        """
+        books = self.cache.peek(("book_service", method_name) + args, version=self.version())
+        if books is not None:
+            return rank_books(books, sort, limit)
+        return self._cached(method_name, *args, sort, limit)
+
+    def _cached(self, method_name: str, *args: Any) -> Any:
+        method = getattr(self.service, method_name)
+        return self.cache.get_or_load(
+            ("book_service", method_name) + args,
+            lambda: method(*args),
+            version=self.version()
+        )
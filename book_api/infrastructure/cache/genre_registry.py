@@ -0,0 +1,85 @@
+"""
+In-process genre registry.
+Genres are a small, nearly static set: they are loaded once and served from dictionaries.
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from book_api.use_cases.interfaces.genre_repository import IGenreRepository
+from book_api.domain.entities.genre import Genre
+from book_api.infrastructure.database.models import GenreModel
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _GenreTable:
+    """Every genre of one dataset version, with id and name lookups."""
+    version: str
+    genres: Tuple[Genre, ...]
+    by_id: Dict[int, Genre]
+    by_name: Dict[str, Genre]
+
+
+class GenreRegistry(IGenreRepository):
+    """
+    IGenreRepository answered from memory, with no I/O per lookup.
+
+    The table is read with its own session (no request scope needed) and rebuilt
+    when the dataset version moves; the new table replaces the old one in a single
+    assignment. Returned Genre objects are shared and must be treated as read-only.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], version: Callable[[], str]):
+        self._session_factory = session_factory
+        self._version = version
+        self._lock = threading.Lock()
+        self._table: Optional[_GenreTable] = None
+
+    def load(self) -> None:
+        """Load the genres now rather than on the first lookup."""
+        self._current()
+
+    def get_all(self) -> List[Genre]:
+        """Get all genres, ordered by ID."""
+        return list(self._current().genres)
+
+    def get_by_id(self, genre_id: int) -> Optional[Genre]:
+        """Get one genre by its ID."""
+        return self._current().by_id.get(genre_id)
+
+    def get_by_name(self, name: str) -> Optional[Genre]:
+        """Find genre by exact name, as stored in the database."""
+        return self._current().by_name.get(name)
+
+    def _current(self) -> _GenreTable:
+        version = self._version()
+        table = self._table
+        if table is not None and table.version == version:
+            return table
+
+        with self._lock:
+            if self._table is None or self._table.version != version:
+                self._table = self._load(version)
+            return self._table
+
+    def _load(self, version: str) -> _GenreTable:
+        session = self._session_factory()
+        try:
+            db_genres = session.query(GenreModel).order_by(GenreModel.id).all()
+            rows = [(db_genre.genre, GenreRepository._convert_to_entity(db_genre)) for db_genre in db_genres]
+        finally:
+            session.close()
+
+        logger.info("Genre registry %s loaded: %s genres", version, len(rows))
+        return _GenreTable(
+            version=version,
+            genres=tuple(genre for _, genre in rows),
+            by_id={genre.id: genre for _, genre in rows},
+            by_name={stored_name: genre for stored_name, genre in rows}
+        )
@@ -0,0 +1,116 @@
+"""
+In-process LRU cache with TTL eviction.
+Entries belong to one dataset version and are dropped as soon as the version moves.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUTTLCache:
+    """
+    Thread-safe least-recently-used cache whose entries also expire after `ttl` seconds.
+
+    Values are shared between callers, so cached objects must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._version: Optional[str] = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], version: Optional[str] = None) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss.
+        A version different from the one seen last clears the whole cache first.
+        """
+        with self._lock:
+            self._sync_version(version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        # Load outside the lock so slow queries don't block other readers
+        value = loader()
+
+        with self._lock:
+            # Don't store a value computed against a version that is already gone
+            if version == self._version:
+                self._entries[key] = (self._clock() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def peek(self, key: Hashable, version: Optional[str] = None) -> Optional[Any]:
+        """
+        Return the cached value for key if there is a fresh one for this version, else None.
+        Never loads; a hit counts as one, an absent key is not counted as a miss.
+        """
+        with self._lock:
+            if version != self._version:
+                return None
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self._version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sync_version(self, version: Optional[str]) -> None:
+        if version == self._version:
+            return
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+        self._version = version
@@ -1,21 +1,100 @@
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-
-SQLITE_DATABASE_URL = "sqlite:///./book_api/app/books.db"
+from sqlalchemy.orm import Session, sessionmaker
 
-engine = create_engine(
-    SQLITE_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+from book_api.config.settings import Settings, get_settings
+from book_api.infrastructure.database.sqlite_profile import (
+    apply_pragmas_on_connect,
+    reader_pragmas,
+    writer_pragmas
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+settings = get_settings()
+
+SQLITE_DATABASE_PATH = settings.database_path
+SQLITE_DATABASE_URL = f"sqlite:///{SQLITE_DATABASE_PATH}"
+SQLITE_READ_ONLY_URL = f"sqlite:///file:{SQLITE_DATABASE_PATH}?mode=ro&uri=true"
+ASYNC_SQLITE_DATABASE_URL = f"sqlite+aiosqlite:///file:{SQLITE_DATABASE_PATH}?mode=ro&uri=true"
+
+
+def create_writer_engine(url: str, settings: Settings) -> Engine:
+    """
+    Engine for schema work and writes.
+    A single pooled connection, so writers are serialised inside the process.
+    """
+    writer = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=1,
+        max_overflow=0
+    )
+    apply_pragmas_on_connect(writer, writer_pragmas(settings))
+    return writer
+
+
+def create_reader_engine(url: str, settings: Settings) -> Engine:
+    """
+    Engine for request reads.
+    Sized pool of read-only connections that keep working while the crawler writes (WAL).
+    """
+    reader = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=settings.sqlite_read_pool_size,
+        max_overflow=settings.sqlite_read_pool_overflow
+    )
+    apply_pragmas_on_connect(reader, reader_pragmas(settings))
+    return reader
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Writer engine (schema work at startup), created on first use so importing the API never touches the database."""
+    return create_writer_engine(SQLITE_DATABASE_URL, settings)
+
+
+@lru_cache(maxsize=None)
+def get_read_engine() -> Engine:
+    """Reader engine, created on first use."""
+    return create_reader_engine(
+        SQLITE_READ_ONLY_URL if settings.sqlite_read_only else SQLITE_DATABASE_URL,
+        settings
+    )
+
+
+@lru_cache(maxsize=None)
+def _read_sessionmaker() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_read_engine())
+
+
+def SessionLocal() -> Session:
+    """Open a read session (same call as the former module-level sessionmaker)."""
+    return _read_sessionmaker()()
+
+
 Base = declarative_base()
 
 
-def get_database_session():
-    db = SessionLocal()
-    try:
+@lru_cache(maxsize=None)
+def get_async_sessionmaker():
+    """
+    Async engine and session factory (aiosqlite).
+    Created on first use so the sync-only deployment never imports aiosqlite.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(
+        ASYNC_SQLITE_DATABASE_URL if settings.sqlite_read_only else f"sqlite+aiosqlite:///{SQLITE_DATABASE_PATH}",
+        pool_size=settings.sqlite_read_pool_size,
+        max_overflow=settings.sqlite_read_pool_overflow
+    )
+    apply_pragmas_on_connect(async_engine.sync_engine, reader_pragmas(settings))
+    return async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_database_session():
+    async with get_async_sessionmaker()() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
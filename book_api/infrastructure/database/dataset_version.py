@@ -0,0 +1,103 @@
+"""
+Dataset version tracking.
+Tells the rest of the API when the catalog database has changed.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+UNAVAILABLE_VERSION = "unavailable"
+
+
+class DatasetVersion:
+    """
+    Cheap change detector for the SQLite catalog.
+
+    `PRAGMA data_version` changes whenever another connection commits, so it is
+    polled on a dedicated connection. Only when it moves do we re-read the stable
+    version token: the `dataset_version` row written by the crawler pipeline, or a
+    fingerprint of the books table for databases created before that row existed.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.database_path = database_path
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
+        self._token: Optional[str] = None
+        self._next_check = 0.0
+
+    def current(self) -> str:
+        """Return the current version token, probing SQLite at most once per interval."""
+        token = self._token
+        if token is not None and self._clock() < self._next_check:
+            return token
+
+        with self._lock:
+            if self._token is None or self._clock() >= self._next_check:
+                self._refresh()
+                self._next_check = self._clock() + self.check_interval
+            return self._token
+
+    def invalidate(self) -> None:
+        """Force the next call to `current` to probe the database."""
+        self._next_check = 0.0
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_connection()
+
+    def _refresh(self) -> None:
+        try:
+            connection = self._get_connection()
+            data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version or self._token in (None, UNAVAILABLE_VERSION):
+                self._token = self._read_token(connection)
+                self._data_version = data_version
+        except sqlite3.Error as e:
+            logger.warning("Could not read dataset version from %s: %s", self.database_path, e)
+            self._close_connection()
+            self._token = UNAVAILABLE_VERSION
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                f"file:{self.database_path}?mode=ro",
+                uri=True,
+                check_same_thread=False
+            )
+        return self._connection
+
+    def _close_connection(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+            self._connection = None
+
+    @staticmethod
+    def _read_token(connection: sqlite3.Connection) -> str:
+        """Read the version row published by the crawler, or fingerprint the books table."""
+        try:
+            row = connection.execute("SELECT version FROM dataset_version WHERE id = 1").fetchone()
+            if row is not None:
+                return f"v{row[0]}"
+        except sqlite3.OperationalError:
+            pass  # Table does not exist yet
+
+        row = connection.execute("SELECT COUNT(*), MAX(id), MAX(datetime) FROM books").fetchone()
+        fingerprint = hashlib.sha1(repr(tuple(row)).encode()).hexdigest()[:16]
+        return f"f{fingerprint}"
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
+from sqlalchemy.orm import deferred
 from book_api.infrastructure.database.connection import Base
 
 
@@ -16,7 +17,22 @@ class BookModel(Base):
     price_ht = Column(Float)
     price_taxed = Column(Float)
     review_number = Column(Integer)
-    description = Column(String)
+    # Heavy text, ~10x the rest of the row: only loaded by queries that undefer it (detail and exports)
+    description = deferred(Column(String))
+
+    # Back the /books/query filters and sorted lists: genre plus one range / sort column, or a single column
+    __table_args__ = (
+        Index("ix_books_genre_price_taxed", "genre_id", "price_taxed"),
+        Index("ix_books_genre_note", "genre_id", "note"),
+        Index("ix_books_genre_stock_number", "genre_id", "stock_number"),
+        Index("ix_books_genre_review_number", "genre_id", "review_number"),
+        Index("ix_books_price_taxed", "price_taxed"),
+        Index("ix_books_note", "note"),
+        Index("ix_books_stock_number", "stock_number"),
+        Index("ix_books_review_number", "review_number"),
+        # Exact and prefix UPC lookups: equality and range searches on one B-tree
+        Index("ix_books_upc", "upc"),
+    )
 
 
 class GenreModel(Base):
@@ -0,0 +1,74 @@
+"""
+Lazy, request-scoped database sessions.
+
+Repositories are built once per process and hold a `RequestSessionProxy`.
+Each request gets a `RequestSessionHolder` in a context variable; the real
+SQLAlchemy session is only opened the first time a repository uses it and is
+shared by every repository within the same request.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+_current_holder: ContextVar[Optional["RequestSessionHolder"]] = ContextVar(
+    "book_api_request_session", default=None
+)
+
+
+class RequestSessionHolder:
+    """Per-request slot for a session that may never be opened."""
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+        self._session: Optional[Session] = None
+
+    @property
+    def opened(self) -> bool:
+        return self._session is not None
+
+    def get(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class RequestSessionProxy:
+    """
+    Stands in for a Session inside app-scoped repositories.
+    Attribute access is forwarded to the current request's session, opening it on first use.
+    """
+
+    def __getattr__(self, name: str):
+        holder = _current_holder.get()
+        if holder is None:
+            raise RuntimeError("Database session used outside of a request scope")
+        return getattr(holder.get(), name)
+
+
+@contextmanager
+def request_session_scope(session_factory: Callable[[], Session]) -> Iterator[RequestSessionHolder]:
+    """Open a request scope; the session (if any was opened) is closed on exit."""
+    holder = RequestSessionHolder(session_factory)
+    token = _current_holder.set(holder)
+    try:
+        yield holder
+    finally:
+        holder.close()
+        _current_holder.reset(token)
+
+
+def begin_request_session(session_factory: Callable[[], Session]) -> RequestSessionHolder:
+    """
+    Start a scope in the current context without resetting it afterwards.
+    Used by FastAPI dependencies, whose teardown may run in a copied context.
+    """
+    holder = RequestSessionHolder(session_factory)
+    _current_holder.set(holder)
+    return holder
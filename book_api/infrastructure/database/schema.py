@@ -0,0 +1,27 @@
+"""
+Schema maintenance for databases that already exist.
+"""
+import logging
+
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.engine import Engine
+
+from book_api.infrastructure.database.connection import Base
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_indexes(bind: Engine, metadata: MetaData = Base.metadata) -> None:
+    """
+    Create the indexes declared on the models that the database lacks.
+    `create_all` skips tables that already exist, indexes included, so the crawler's database never gets them otherwise.
+    """
+    inspector = inspect(bind)
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                logger.info("Creating index %s on %s", index.name, table.name)
+                index.create(bind=bind)
@@ -0,0 +1,56 @@
+"""
+SQLite engine profile.
+PRAGMAs applied to every new connection so readers and the writer are tuned the same way on every pool checkout.
+"""
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from book_api.config.settings import Settings
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def writer_pragmas(settings: Settings) -> Dict[str, Any]:
+    """PRAGMAs for the single writer connection. journal_mode is persistent and can only be set by a writer."""
+    return {
+        "journal_mode": _checked(settings.sqlite_journal_mode, JOURNAL_MODES, "journal mode"),
+        "synchronous": _checked(settings.sqlite_synchronous, SYNCHRONOUS_MODES, "synchronous mode"),
+        "busy_timeout": int(settings.sqlite_busy_timeout_ms),
+        "cache_size": int(settings.sqlite_cache_size),
+        "mmap_size": int(settings.sqlite_mmap_size),
+    }
+
+
+def reader_pragmas(settings: Settings) -> Dict[str, Any]:
+    """PRAGMAs for pooled reader connections."""
+    return {
+        "busy_timeout": int(settings.sqlite_busy_timeout_ms),
+        "cache_size": int(settings.sqlite_cache_size),
+        "mmap_size": int(settings.sqlite_mmap_size),
+        # Belt and braces on top of mode=ro: refuse writes even on a read-write file
+        "query_only": "ON",
+    }
+
+
+def apply_pragmas_on_connect(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """Run the PRAGMAs on each new DBAPI connection opened by the engine's pool."""
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+def _checked(value: str, allowed: set, label: str) -> str:
+    # PRAGMA values can't be bound as parameters, so only accept known keywords
+    value = value.upper()
+    if value not in allowed:
+        raise ValueError(f"Unsupported SQLite {label}: {value}")
+    return value
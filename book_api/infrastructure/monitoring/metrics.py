@@ -0,0 +1,130 @@
+"""
+In-process request metrics, rendered in the Prometheus text exposition format.
+Only what the API needs: one counter and a few labelled histograms, no client library.
+"""
+import threading
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+from book_api.infrastructure.monitoring.query_stats import QueryStats
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+ROUTE_LABELS = ("method", "route")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values. Callers hold the registry lock."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        # label values -> [count per bucket..., sum, count]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+                break
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            base = _labels(self.label_names, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{base},le="{_number(bound)}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {series[-1]}')
+            lines.append(f"{self.name}_sum{{{base}}} {_number(series[-2])}")
+            lines.append(f"{self.name}_count{{{base}}} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of per-route request metrics.
+    Routes are labelled with their template (`/books/{book_id:int}`), never the raw path,
+    so the number of series stays bounded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Counter = Counter()
+        self.duration = Histogram(
+            "bookscrape_http_request_duration_seconds", "Request latency, first byte in to last byte out.",
+            LATENCY_BUCKETS, ROUTE_LABELS
+        )
+        self.app_time = Histogram(
+            "bookscrape_http_request_app_seconds",
+            "Request time spent outside SQL statements (Python work, serialisation).",
+            LATENCY_BUCKETS, ROUTE_LABELS
+        )
+        self.response_size = Histogram(
+            "bookscrape_http_response_size_bytes", "Response body size.", SIZE_BUCKETS, ROUTE_LABELS
+        )
+        self.db_queries = Histogram(
+            "bookscrape_db_queries_per_request", "SQL statements issued per request.", QUERY_COUNT_BUCKETS, ROUTE_LABELS
+        )
+        self.db_time = Histogram(
+            "bookscrape_db_time_per_request_seconds",
+            "Time spent executing SQL statements per request (row fetching excluded).",
+            LATENCY_BUCKETS, ROUTE_LABELS
+        )
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        response_bytes: int,
+        queries: QueryStats
+    ) -> None:
+        labels = (method, route)
+        with self._lock:
+            self._requests[(method, route, str(status))] += 1
+            self.duration.observe(labels, duration)
+            self.app_time.observe(labels, max(0.0, duration - queries.seconds))
+            self.response_size.observe(labels, response_bytes)
+            self.db_queries.observe(labels, queries.count)
+            self.db_time.observe(labels, queries.seconds)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text format."""
+        with self._lock:
+            lines = [
+                "# HELP bookscrape_http_requests_total Requests served, by route and status.",
+                "# TYPE bookscrape_http_requests_total counter",
+            ]
+            lines.extend(
+                f"bookscrape_http_requests_total{{{_labels(('method', 'route', 'status'), key)}}} {count}"
+                for key, count in sorted(self._requests.items())
+            )
+            for histogram in (self.duration, self.app_time, self.response_size, self.db_queries, self.db_time):
+                lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
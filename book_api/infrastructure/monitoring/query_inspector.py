@@ -0,0 +1,145 @@
+"""
+Slow-query log and N+1 detection.
+
+An instrumentation mode, off by default. Once installed, the inspector observes
+the statement timings taken by query_stats on every engine:
+  - statements slower than `slow_query_ms` are logged with their EXPLAIN QUERY PLAN
+  - inside an `inspect()` scope (a request, a test block) it counts statements and
+    their shapes, and reports a violation when the scope goes over `query_budget`
+    statements or runs the same shape `repeated_statement_limit` times (a query in a loop)
+
+In strict mode violations raise QueryBudgetExceeded, so a test build fails on them.
+"""
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from book_api.config.logging import get_typed_logger
+from book_api.config.settings import Settings
+from book_api.infrastructure.monitoring.query_stats import (
+    add_query_observer,
+    install_query_listeners,
+    remove_query_observer
+)
+
+logger = get_typed_logger(__name__)
+
+_current_report: ContextVar[Optional["QueryReport"]] = ContextVar("book_api_query_report", default=None)
+
+# Expanded IN lists and VALUES rows vary with the input size, not with the code path
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode when a scope breaks the query budget or repeats a statement."""
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with placeholder lists and whitespace collapsed."""
+    return _PLACEHOLDER_LIST.sub("(?, ...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryReport:
+    """Statements seen in one inspection scope."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        self.shapes[statement_shape(statement)] += 1
+
+
+class QueryInspector:
+    """Times statements, logs slow ones with their plan and checks scopes against the budget."""
+
+    def __init__(
+        self,
+        slow_query_ms: float = 100.0,
+        query_budget: int = 10,
+        repeated_statement_limit: int = 5,
+        strict: bool = False
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.query_budget = query_budget
+        self.repeated_statement_limit = repeated_statement_limit
+        self.strict = strict
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "QueryInspector":
+        return cls(
+            slow_query_ms=settings.slow_query_ms,
+            query_budget=settings.query_budget,
+            repeated_statement_limit=settings.repeated_query_limit,
+            strict=settings.query_inspection_strict
+        )
+
+    def install(self, target=Engine) -> None:
+        """Observe the statements timed on target, every engine by default. Safe to call more than once."""
+        install_query_listeners(target)
+        add_query_observer(self._on_statement)
+
+    def uninstall(self) -> None:
+        # The timing listeners are shared with the request metrics and stay in place
+        remove_query_observer(self._on_statement)
+
+    @contextmanager
+    def inspect(self, label: str) -> Iterator[QueryReport]:
+        """Count the statements run inside the block and check them on exit."""
+        report = QueryReport(label)
+        token = _current_report.set(report)
+        try:
+            yield report
+        finally:
+            _current_report.reset(token)
+        self.check(report)
+
+    def violations(self, report: QueryReport) -> List[str]:
+        found = []
+        if report.count > self.query_budget:
+            found.append(f"{report.label}: {report.count} statements, budget is {self.query_budget}")
+        for shape, repeats in report.shapes.most_common():
+            if repeats < self.repeated_statement_limit:
+                break
+            found.append(f"{report.label}: same statement run {repeats} times (possible N+1): {shape}")
+        return found
+
+    def check(self, report: QueryReport) -> None:
+        found = self.violations(report)
+        for violation in found:
+            logger.warning("Query budget violation - %s", violation)
+        if found and self.strict:
+            raise QueryBudgetExceeded("; ".join(found))
+
+    def _on_statement(self, conn, statement: str, parameters, executemany: bool, seconds: float) -> None:
+        elapsed_ms = seconds * 1000
+
+        report = _current_report.get()
+        if report is not None:
+            report.record(statement)
+
+        if elapsed_ms >= self.slow_query_ms:
+            where = f" in {report.label}" if report is not None else ""
+            plan = "" if executemany else _explain(conn, statement, parameters)
+            logger.warning("Slow query (%.1f ms%s): %s%s", elapsed_ms, where, statement_shape(statement), plan)
+
+
+def _explain(conn, statement: str, parameters) -> str:
+    """EXPLAIN QUERY PLAN of a SELECT, on a raw cursor so no cursor events fire again."""
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return ""
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "".join(f"\n    {row[-1]}" for row in cursor.fetchall())
+    except Exception as e:
+        return f"\n    (no plan: {e})"
+    finally:
+        cursor.close()
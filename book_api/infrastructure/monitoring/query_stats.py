@@ -0,0 +1,93 @@
+"""
+Per-request SQL statistics.
+
+SQLAlchemy cursor events count statements and time spent in them, and add
+them to the `QueryStats` of the current request, found through a context
+variable. Contexts are copied into the threadpool and into async tasks, so
+statements run by sync routes, async routes and streamed responses are all
+attributed to the request that issued them.
+
+This is the only place statements are timed: other instruments (the query
+inspector) subscribe with `add_query_observer` instead of adding cursor listeners.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("book_api_query_stats", default=None)
+_START_KEY = "book_api_query_start"
+
+# Called after each timed statement with (conn, statement, parameters, executemany, seconds)
+QueryObserver = Callable[[Any, str, Any, bool, float], None]
+_observers: List[QueryObserver] = []
+
+
+class QueryStats:
+    """Statement count and cumulated database time of one request."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Attribute the statements run inside the block to a fresh QueryStats."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def add_query_observer(observer: QueryObserver) -> None:
+    """Have observer called after every statement with its duration. Safe to call more than once."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_query_observer(observer: QueryObserver) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _observers or _current_stats.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(seconds)
+    for observer in _observers:
+        observer(conn, statement, parameters, executemany, seconds)
+
+
+def install_query_listeners(target=Engine) -> None:
+    """
+    Listen to cursor events on target, every engine by default (async engines included).
+    Safe to call more than once.
+    """
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,87 @@
+"""
+Sampling profiler.
+
+A background thread snapshots the Python stack of every other thread at a fixed
+interval and counts identical stacks. Idle threads (event loop waiting in select,
+threadpool workers waiting for work) are skipped, so on a quiet instance the
+profile of one request is what remains: the event loop part (middleware, async
+dependencies, serialisation) and the threadpool part (sync routes, repositories).
+
+Output is the collapsed-stack format ("frame;frame;frame count" per line) read by
+flamegraph.pl, speedscope and most flame-graph viewers.
+"""
+import logging.handlers
+import os
+import queue
+import selectors
+import sys
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+# A leaf frame in one of these modules means the thread is waiting, not working
+# (logging.handlers: the log QueueListener blocked on its queue)
+_IDLE_FILES = frozenset(
+    os.path.abspath(module.__file__) for module in (threading, selectors, queue, logging.handlers)
+)
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Counts the collapsed stacks of the process' threads between start() and stop()."""
+
+    def __init__(self, interval: float = 0.001, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self._idle: Dict[object, bool] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self._stacks
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or self._is_idle(frame.f_code):
+                    continue
+                self._stacks[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+            self.samples += 1
+
+    def _is_idle(self, code) -> bool:
+        idle = self._idle.get(code)
+        if idle is None:
+            idle = self._idle[code] = os.path.abspath(code.co_filename) in _IDLE_FILES
+        return idle
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = _frame_label(code)
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ";".join(reversed(labels))
+
+
+def render_collapsed(stacks: Counter) -> str:
+    """One "stack count" line per distinct stack, hottest first."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
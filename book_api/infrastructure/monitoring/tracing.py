@@ -0,0 +1,193 @@
+"""
+Request tracing with OpenTelemetry.
+
+When enabled, a request produces one span tree:
+  GET /books/{book_id:int}               (TracingMiddleware, the router layer)
+    cache.CachedBookService.get_book
+      service.BookService.get_book
+        repository.BookRepository.get_by_id   bookscrape.rows
+          SELECT                              db.statement
+
+Layers are traced by wrapping the container's objects in `TracedLayer`, SQL
+statements through SQLAlchemy cursor events. opentelemetry-sdk is optional and
+only imported when tracing is configured; until then `trace_layer` returns
+objects unchanged, so the default deployment pays nothing.
+"""
+import functools
+import inspect
+import os
+from typing import IO, Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+TRACING_EXPORTERS = ("console", "file")
+SERVICE_NAME = "bookscrape-api"
+
+_tracer = None
+# Set by configure_tracing, released by shutdown_tracing
+_provider = None
+_trace_file: Optional[IO[str]] = None
+_SPANS_KEY = "book_api_sql_spans"
+
+
+def configure_tracing(exporter: str, file_path: str = "traces.jsonl") -> None:
+    """
+    Install a global tracer provider exporting to the console or to a JSON-lines file,
+    then enable tracing. Both exporters work offline. Call shutdown_tracing when the app stops.
+    """
+    global _provider, _trace_file
+    if exporter not in TRACING_EXPORTERS:
+        raise ValueError(f"Unsupported tracing exporter: {exporter}")
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError as e:
+        raise RuntimeError("Tracing needs opentelemetry-sdk: pip install opentelemetry-sdk") from e
+
+    if exporter == "console":
+        span_exporter = ConsoleSpanExporter(service_name=SERVICE_NAME)
+    else:
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _trace_file = open(file_path, "a", encoding="utf-8")
+        span_exporter = ConsoleSpanExporter(
+            service_name=SERVICE_NAME,
+            out=_trace_file,
+            formatter=lambda span: span.to_json(indent=None) + "\n"
+        )
+
+    provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+    _provider = provider
+    enable_tracing(provider)
+
+
+def shutdown_tracing() -> None:
+    """Export the spans still batched and close the trace file opened by configure_tracing."""
+    global _provider, _trace_file
+    disable_tracing()
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+    if _trace_file is not None:
+        _trace_file.close()
+        _trace_file = None
+
+
+def enable_tracing(tracer_provider) -> None:
+    """Trace layers and SQL with spans from tracer_provider (tests pass one with an in-memory exporter)."""
+    global _tracer
+    _tracer = tracer_provider.get_tracer("book_api")
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def disable_tracing() -> None:
+    global _tracer
+    _tracer = None
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.remove(Engine, "handle_error", _handle_error)
+
+
+def get_tracer():
+    """The active tracer, or None when tracing is off."""
+    return _tracer
+
+
+def trace_layer(target: Any, layer: str) -> Any:
+    """Wrap target in a TracedLayer when tracing is on, return it unchanged otherwise."""
+    return TracedLayer(target, layer) if _tracer is not None else target
+
+
+class TracedLayer:
+    """
+    Stands in for a repository, service or cache.
+    Each public method call runs in a span named "<layer>.<Class>.<method>";
+    list results add their length as `bookscrape.rows`.
+    """
+
+    def __init__(self, target: Any, layer: str):
+        self._target = target
+        self._layer = layer
+        self._prefix = f"{layer}.{type(target).__name__}"
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        wrapped = self._wrap(name, attribute)
+        self.__dict__[name] = wrapped  # Built once per method, the target is app-scoped
+        return wrapped
+
+    def _wrap(self, name: str, method):
+        span_name = f"{self._prefix}.{name}"
+        attributes = {"bookscrape.layer": self._layer, "code.function": name}
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def traced_async(*args, **kwargs):
+                if _tracer is None:
+                    return await method(*args, **kwargs)
+                with _tracer.start_as_current_span(span_name, attributes=attributes) as span:
+                    return _record_rows(span, await method(*args, **kwargs))
+            return traced_async
+
+        @functools.wraps(method)
+        def traced(*args, **kwargs):
+            if _tracer is None:
+                return method(*args, **kwargs)
+            with _tracer.start_as_current_span(span_name, attributes=attributes) as span:
+                return _record_rows(span, method(*args, **kwargs))
+        return traced
+
+
+def _record_rows(span, result: Any) -> Any:
+    if isinstance(result, (list, tuple)):
+        span.set_attribute("bookscrape.rows", len(result))
+    return result
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _tracer is None:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = _tracer.start_span(operation, attributes={
+        "db.system": "sqlite",
+        "db.operation": operation,
+        "db.statement": statement,
+        "db.executemany": executemany,
+    })
+    conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = _pop_span(conn)
+    if span is not None:
+        # SQLite only knows the row count of writes; reads are counted by the repository span
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rows_affected", cursor.rowcount)
+        span.end()
+
+
+def _handle_error(exception_context):
+    span = _pop_span(exception_context.connection) if exception_context.connection is not None else None
+    if span is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def _pop_span(conn) -> Optional[Any]:
+    spans = conn.info.get(_SPANS_KEY)
+    return spans.pop() if spans else None
@@ -0,0 +1,59 @@
+"""
+Async implementation of the Book Repository.
+Same queries as BookRepository, awaited on an AsyncSession (aiosqlite).
+"""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from book_api.use_cases.interfaces.async_book_repository import IAsyncBookRepository
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.repositories.book_repository import BookRepository, apply_sort_and_limit
+
+
+class AsyncBookRepository(IAsyncBookRepository):
+    """
+    Non-blocking book repository.
+    Entity conversion is shared with BookRepository.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+
+    async def get_all(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books from database, optionally ordered and limited in SQL."""
+        return await self._fetch(apply_sort_and_limit(select(BookModel), sort, limit))
+
+    async def get_by_id(self, book_id: int) -> Optional[Book]:
+        """Get one book by its ID, full record included."""
+        db_book = await self.db.scalar(
+            select(BookModel).options(undefer(BookModel.description)).where(BookModel.id == book_id)
+        )
+        if db_book:
+            return BookRepository._convert_to_entity(db_book)
+        return None
+
+    async def get_by_keyword(self, keyword: str) -> List[Book]:
+        """Find books that contain keyword in title."""
+        return await self._fetch(select(BookModel).where(BookModel.title.ilike(f"%{keyword}%")))
+
+    async def get_by_genre_id(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get all books from a specific genre, optionally ordered and limited in SQL."""
+        statement = select(BookModel).where(BookModel.genre_id == genre_id)
+        return await self._fetch(apply_sort_and_limit(statement, sort, limit))
+
+    async def get_books_with_valid_prices(self) -> List[Book]:
+        """Get only books that have a valid price."""
+        return await self._fetch(select(BookModel).where(BookModel.price_taxed.isnot(None)))
+
+    async def _fetch(self, statement) -> List[Book]:
+        db_books = (await self.db.scalars(statement)).all()
+        return [BookRepository._convert_to_entity(db_book) for db_book in db_books]
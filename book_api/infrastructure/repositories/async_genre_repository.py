@@ -0,0 +1,40 @@
+"""
+Async implementation of the Genre Repository.
+"""
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from book_api.use_cases.interfaces.async_genre_repository import IAsyncGenreRepository
+from book_api.domain.entities.genre import Genre
+from book_api.infrastructure.database.models import GenreModel
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+
+
+class AsyncGenreRepository(IAsyncGenreRepository):
+    """
+    Non-blocking genre repository.
+    Entity conversion is shared with GenreRepository.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db = db_session
+
+    async def get_all(self) -> List[Genre]:
+        """Get all genres from database."""
+        db_genres = (await self.db.scalars(select(GenreModel))).all()
+        return [GenreRepository._convert_to_entity(db_genre) for db_genre in db_genres]
+
+    async def get_by_id(self, genre_id: int) -> Optional[Genre]:
+        """Get one genre by its ID."""
+        return await self._first(select(GenreModel).where(GenreModel.id == genre_id))
+
+    async def get_by_name(self, name: str) -> Optional[Genre]:
+        """Find genre by exact name."""
+        return await self._first(select(GenreModel).where(GenreModel.genre == name))
+
+    async def _first(self, statement) -> Optional[Genre]:
+        db_genre = await self.db.scalar(statement)
+        if db_genre:
+            return GenreRepository._convert_to_entity(db_genre)
+        return None
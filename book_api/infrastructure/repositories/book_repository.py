@@ -2,14 +2,24 @@
 Concrete implementation of Book Repository.
 This class actually talks to the database.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, TypeVar
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, undefer
 from decimal import Decimal
 
 from book_api.use_cases.interfaces.book_repository import IBookRepository
 from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.domain.value_objects.upc import prefix_upper_bound
 from book_api.infrastructure.database.models import BookModel
 
+# SQLite caps bound parameters per statement (999 on older builds), so IN lists are chunked
+MAX_IN_PARAMETERS = 500
+
+T = TypeVar("T")
+
 
 class BookRepository(IBookRepository):
     """
@@ -20,18 +30,68 @@ class BookRepository(IBookRepository):
     def __init__(self, db_session: Session):
         self.db = db_session
 
-    def get_all(self) -> List[Book]:
-        """Get all books from database."""
-        db_books = self.db.query(BookModel).all()
+    def get_all(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books from database, optionally ordered and limited in SQL."""
+        db_books = apply_sort_and_limit(self.db.query(BookModel), sort, limit).all()
         return [self._convert_to_entity(db_book) for db_book in db_books]
 
+    def iter_all(self, batch_size: int = 500) -> Iterator[Book]:
+        """
+        Stream all books, full records included, fetching batch_size rows at a time.
+        Only one batch of ORM objects is alive at once, whatever the catalog size.
+        """
+        query = self.db.query(BookModel).options(undefer(BookModel.description))
+        query = query.order_by(BookModel.id).yield_per(batch_size)
+        for db_book in query:
+            yield self._convert_to_entity(db_book)
+
     def get_by_id(self, book_id: int) -> Optional[Book]:
-        """Get one book by its ID."""
-        db_book = self.db.query(BookModel).filter(BookModel.id == book_id).first()
+        """Get one book by its ID, full record included."""
+        db_book = self.db.query(BookModel).options(undefer(BookModel.description)).filter(
+            BookModel.id == book_id
+        ).first()
+        if db_book:
+            return self._convert_to_entity(db_book)
+        return None
+
+    def get_by_ids(self, book_ids: List[int]) -> List[Book]:
+        """Get the books matching any of the IDs, in one round trip per chunk."""
+        db_books = []
+        for chunk in _chunked(book_ids, MAX_IN_PARAMETERS):
+            db_books.extend(self.db.query(BookModel).filter(BookModel.id.in_(chunk)).all())
+        return [self._convert_to_entity(db_book) for db_book in db_books]
+
+    def get_by_upcs(self, upcs: List[str]) -> List[Book]:
+        """Get the books matching any of the UPCs, in one round trip per chunk."""
+        db_books = []
+        for chunk in _chunked(upcs, MAX_IN_PARAMETERS):
+            db_books.extend(
+                self.db.query(BookModel).filter(BookModel.upc.in_(chunk)).order_by(BookModel.id).all()
+            )
+        return [self._convert_to_entity(db_book) for db_book in db_books]
+
+    def get_by_upc(self, upc: str) -> Optional[Book]:
+        """Get one book by its exact UPC, full record included (lowest ID on duplicates)."""
+        db_book = self.db.query(BookModel).options(undefer(BookModel.description)).filter(
+            BookModel.upc == upc
+        ).order_by(BookModel.id).first()
         if db_book:
             return self._convert_to_entity(db_book)
         return None
 
+    def get_by_upc_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Book]:
+        """
+        Get the books whose UPC starts with prefix, in UPC order.
+        Written as a range, upc >= prefix AND upc < next prefix, which SQLite answers from the
+        ix_books_upc B-tree; LIKE 'prefix%' would only use it with case-sensitive LIKE.
+        """
+        query = self.db.query(BookModel).filter(
+            BookModel.upc >= prefix, BookModel.upc < prefix_upper_bound(prefix)
+        ).order_by(BookModel.upc, BookModel.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return [self._convert_to_entity(db_book) for db_book in query.all()]
+
     def get_by_keyword(self, keyword: str) -> List[Book]:
         """Find books that contain keyword in title."""
         db_books = self.db.query(BookModel).filter(
@@ -39,11 +99,47 @@ class BookRepository(IBookRepository):
         ).all()
         return [self._convert_to_entity(db_book) for db_book in db_books]
 
-    def get_by_genre_id(self, genre_id: int) -> List[Book]:
-        """Get all books from a specific genre."""
-        db_books = self.db.query(BookModel).filter(
-            BookModel.genre_id == genre_id
-        ).all()
+    def get_by_genre_id(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get all books from a specific genre, optionally ordered and limited in SQL."""
+        query = self.db.query(BookModel).filter(BookModel.genre_id == genre_id)
+        db_books = apply_sort_and_limit(query, sort, limit).all()
+        return [self._convert_to_entity(db_book) for db_book in db_books]
+
+    def get_by_criteria(
+        self,
+        criteria: BookCriteria,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """
+        Get the books matching every filter of the criteria, in one parameterised query.
+        Each filter maps to an indexed column, see BookModel.__table_args__.
+        """
+        query = self.db.query(BookModel)
+
+        if criteria.genre_id is not None:
+            query = query.filter(BookModel.genre_id == criteria.genre_id)
+        if criteria.min_price is not None or criteria.max_price is not None:
+            query = query.filter(BookModel.price_taxed > 0)
+            if criteria.min_price is not None:
+                query = query.filter(BookModel.price_taxed >= criteria.min_price)
+            if criteria.max_price is not None:
+                query = query.filter(BookModel.price_taxed <= criteria.max_price)
+        if criteria.min_rating is not None:
+            query = query.filter(BookModel.note >= criteria.min_rating)
+        if criteria.in_stock is True:
+            query = query.filter(BookModel.stock_number > 0)
+        elif criteria.in_stock is False:
+            query = query.filter(or_(BookModel.stock_number.is_(None), BookModel.stock_number <= 0))
+        if criteria.min_reviews is not None:
+            query = query.filter(BookModel.review_number >= criteria.min_reviews)
+
+        db_books = apply_sort_and_limit(query, sort, limit).all()
         return [self._convert_to_entity(db_book) for db_book in db_books]
 
     def get_books_with_valid_prices(self) -> List[Book]:
@@ -53,12 +149,15 @@ class BookRepository(IBookRepository):
         ).all()
         return [self._convert_to_entity(db_book) for db_book in db_books]
 
-    def _convert_to_entity(self, db_book: BookModel) -> Book:
+    @staticmethod
+    def _convert_to_entity(db_book: BookModel) -> Book:
         """
         Convert database model to domain entity.
         This separates database concerns from business logic.
+        Rows were validated on the way in, so the entity is built without re-running the validators.
+        A deferred description that the query did not load stays None instead of costing one query per row.
         """
-        return Book(
+        return Book.from_trusted(
             id=db_book.id,
             title=db_book.title,
             genre_id=db_book.genre_id,
@@ -67,8 +166,44 @@ class BookRepository(IBookRepository):
             datetime=db_book.datetime,
             upc=db_book.upc,
             product_type=db_book.product_type,
-            price_ht=Decimal(str(db_book.price_ht)) if db_book.price_ht else None,
-            price_taxed=Decimal(str(db_book.price_taxed)) if db_book.price_taxed else None,
+            # 0.0 stays a price: sorted SQL lists keep it (IS NOT NULL), in-memory ranking must too
+            price_ht=_to_decimal(db_book.price_ht) if db_book.price_ht is not None else None,
+            price_taxed=_to_decimal(db_book.price_taxed) if db_book.price_taxed is not None else None,
             review_number=db_book.review_number,
-            description=db_book.description
-        )
\ No newline at end of file
+            description=db_book.__dict__.get("description")
+        )
+
+
+@lru_cache(maxsize=8192)
+def _to_decimal(value: float) -> Decimal:
+    """
+    Exact decimal for a stored price. Catalogs repeat a few thousand distinct prices,
+    so the str() round trip is memoised; Decimal is immutable and safe to share.
+    """
+    return Decimal(str(value))
+
+
+def apply_sort_and_limit(statement, sort: Optional[BookSort], limit: Optional[int]):
+    """
+    Add ORDER BY ... LIMIT to a books query (legacy Query or select()).
+    The ID tie-breaker runs in the same direction as the sort, so SQLite can walk
+    the column's index (which ends with the rowid) instead of sorting a temp B-tree.
+    """
+    if sort is not None:
+        column = getattr(BookModel, sort.attribute)
+        statement = statement.filter(column.isnot(None))
+        if sort.descending:
+            statement = statement.order_by(column.desc(), BookModel.id.desc())
+        else:
+            statement = statement.order_by(column, BookModel.id)
+    elif limit is not None:
+        statement = statement.order_by(BookModel.id)
+
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def _chunked(values: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
@@ -0,0 +1,126 @@
+"""
+Book repository answering list reads from DuckDB.
+Scans (whole catalog, a genre, filters, sorted top-k) run on the columnar copy;
+point lookups and the full-record export stay on the SQLite repository, which
+serves them from its indexes.
+"""
+from typing import Iterator, List, Optional, Sequence
+
+from book_api.use_cases.interfaces.book_repository import IBookRepository
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.infrastructure.analytics.duckdb_catalog import BOOK_COLUMNS, DuckDBCatalog
+from book_api.infrastructure.repositories.book_repository import _to_decimal
+
+_SELECT = f"SELECT {', '.join(BOOK_COLUMNS)} FROM books"
+
+
+class DuckDBBookRepository(IBookRepository):
+    """
+    IBookRepository over a DuckDBCatalog, delegating lookups by key to `point_lookups`.
+    Lists come back in the same order as from SQLite: by ID, or by the sort column then ID.
+    """
+
+    def __init__(self, catalog: DuckDBCatalog, point_lookups: IBookRepository):
+        self.catalog = catalog
+        self.point_lookups = point_lookups
+
+    def get_all(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        return self._select([], [], sort, limit)
+
+    def get_by_id(self, book_id: int) -> Optional[Book]:
+        return self.point_lookups.get_by_id(book_id)
+
+    def get_by_ids(self, book_ids: List[int]) -> List[Book]:
+        return self.point_lookups.get_by_ids(book_ids)
+
+    def get_by_upcs(self, upcs: List[str]) -> List[Book]:
+        return self.point_lookups.get_by_upcs(upcs)
+
+    def get_by_upc(self, upc: str) -> Optional[Book]:
+        return self.point_lookups.get_by_upc(upc)
+
+    def get_by_upc_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Book]:
+        # A range on SQLite's UPC index reads only the matching rows
+        return self.point_lookups.get_by_upc_prefix(prefix, limit)
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Book]:
+        # Full records: descriptions are not copied to DuckDB
+        return self.point_lookups.iter_all(batch_size)
+
+    def get_by_keyword(self, keyword: str) -> List[Book]:
+        return self._select(["title ILIKE ?"], [f"%{keyword}%"])
+
+    def get_by_genre_id(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        return self._select(["genre_id = ?"], [genre_id], sort, limit)
+
+    def get_by_criteria(
+        self,
+        criteria: BookCriteria,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Same filters as BookRepository.get_by_criteria, in one statement."""
+        conditions, parameters = [], []
+        if criteria.genre_id is not None:
+            conditions.append("genre_id = ?")
+            parameters.append(criteria.genre_id)
+        if criteria.min_price is not None or criteria.max_price is not None:
+            conditions.append("price_taxed > 0")
+            if criteria.min_price is not None:
+                conditions.append("price_taxed >= ?")
+                parameters.append(criteria.min_price)
+            if criteria.max_price is not None:
+                conditions.append("price_taxed <= ?")
+                parameters.append(criteria.max_price)
+        if criteria.min_rating is not None:
+            conditions.append("note >= ?")
+            parameters.append(criteria.min_rating)
+        if criteria.in_stock is True:
+            conditions.append("stock_number > 0")
+        elif criteria.in_stock is False:
+            conditions.append("(stock_number IS NULL OR stock_number <= 0)")
+        if criteria.min_reviews is not None:
+            conditions.append("review_number >= ?")
+            parameters.append(criteria.min_reviews)
+        return self._select(conditions, parameters, sort, limit)
+
+    def get_books_with_valid_prices(self) -> List[Book]:
+        return self._select(["price_taxed IS NOT NULL"], [])
+
+    def _select(
+        self,
+        conditions: List[str],
+        parameters: list,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Run the books query; sorted lists leave out books without a value, as in apply_sort_and_limit."""
+        order = "id"
+        if sort is not None:
+            conditions = conditions + [f"{sort.attribute} IS NOT NULL"]
+            direction = " DESC" if sort.descending else ""
+            order = f"{sort.attribute}{direction}, id{direction}"
+
+        statement = _SELECT
+        if conditions:
+            statement += f" WHERE {' AND '.join(conditions)}"
+        statement += f" ORDER BY {order}"
+        if limit is not None:
+            statement += " LIMIT ?"
+            parameters = parameters + [limit]
+        return [_to_entity(row) for row in self.catalog.fetchall(statement, parameters)]
+
+
+def _to_entity(row: Sequence) -> Book:
+    values = dict(zip(BOOK_COLUMNS, row))
+    # Same conversion as BookRepository._convert_to_entity: 0.0 stays a price
+    for key in ("price_ht", "price_taxed"):
+        values[key] = _to_decimal(values[key]) if values[key] is not None else None
+    return Book.from_trusted(**values, description=None)
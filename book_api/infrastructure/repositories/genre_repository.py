@@ -38,7 +38,8 @@ class GenreRepository(IGenreRepository):
             return self._convert_to_entity(db_genre)
         return None
 
-    def _convert_to_entity(self, db_genre: GenreModel) -> Genre:
+    @staticmethod
+    def _convert_to_entity(db_genre: GenreModel) -> Genre:
         """
         Convert database model to domain entity.
         This separates database concerns from business logic.
@@ -0,0 +1,197 @@
+"""
+Async book routes.
+Same paths and responses as book_router, served on the event loop with the aiosqlite stack.
+Enabled with BOOK_API_ASYNC_DATABASE=1.
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+
+from book_api.config.async_dependencies import get_async_book_service
+from book_api.config.logging import get_typed_logger
+from book_api.use_cases.interfaces.async_book_service import IAsyncBookService
+from book_api.interface.dto.book_dto import BookDto
+from book_api.interface.dto.response_dto import (
+    AveragePriceResponseDto,
+    AveragePriceByGenreResponseDto,
+    AverageStockResponseDto,
+    AverageStockByGenreResponseDto,
+    ErrorResponseDto
+)
+from book_api.interface.api.serialization import FastJSONResponse, encode_books, book_to_dict, dumps
+from book_api.interface.api.query_params import book_limit, book_sort
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.domain.exceptions import GenreNotFoundError
+
+# Create router and logger
+router = APIRouter(prefix="/books", tags=["Books"])
+logger = get_typed_logger(__name__)
+
+
+@router.get(
+    "",
+    response_model=List[BookDto],
+    summary="Get all books",
+    description="Retrieve all books from the database, optionally sorted and limited (e.g. `?sort=price&limit=20`)"
+)
+async def get_all_books(
+    sort: Optional[BookSort] = Depends(book_sort),
+    limit: Optional[int] = Depends(book_limit),
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> FastJSONResponse:
+    try:
+        books = await book_service.get_all_books(sort, limit)
+        return FastJSONResponse(encode_books(books))
+    except Exception as e:
+        logger.error("Error getting all books: %s", e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/search/{keyword}",
+    response_model=List[BookDto],
+    summary="Search books by keyword",
+    description="Find books that contain the keyword in their title"
+)
+async def search_books(
+    keyword: str,
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> FastJSONResponse:
+    try:
+        books = await book_service.search_books(keyword)
+        return FastJSONResponse(encode_books(books))
+    except Exception as e:
+        logger.error("Error searching books with keyword '%s': %s", keyword, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/by_genre/{genre_id}",
+    response_model=List[BookDto],
+    summary="Get books by genre",
+    description="Retrieve all books from a specific genre, optionally sorted and limited (e.g. `?sort=-rating&limit=10`)"
+)
+async def get_books_by_genre(
+    genre_id: int,
+    sort: Optional[BookSort] = Depends(book_sort),
+    limit: Optional[int] = Depends(book_limit),
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> FastJSONResponse:
+    try:
+        books = await book_service.get_books_by_genre(genre_id, sort, limit)
+        return FastJSONResponse(encode_books(books))
+    except Exception as e:
+        logger.error("Error getting books for genre %s: %s", genre_id, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/average_price/all",
+    response_model=AveragePriceResponseDto,
+    summary="Calculate average price for all books",
+    description="Calculate the average price across all books with valid prices",
+    responses={
+        200: {"description": "Average price calculated successfully"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+async def get_average_price_all(
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> AveragePriceResponseDto:
+    try:
+        result = await book_service.calculate_average_price_all()
+        return AveragePriceResponseDto(**result)
+    except Exception as e:
+        logger.error("Error calculating average price for all books: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to calculate average price")
+
+
+@router.get(
+    "/average_price/genre/{genre_id}",
+    response_model=AveragePriceByGenreResponseDto,
+    summary="Calculate average price by genre",
+    description="Calculate the average price for books in a specific genre",
+    responses={
+        200: {"description": "Average price by genre calculated successfully"},
+        404: {"model": ErrorResponseDto, "description": "Genre not found"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+async def get_average_price_by_genre(
+    genre_id: int,
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> AveragePriceByGenreResponseDto:
+    try:
+        result = await book_service.calculate_average_price_by_genre(genre_id)
+        return AveragePriceByGenreResponseDto(**result)
+    except GenreNotFoundError:
+        logger.warning("Genre %s not found", genre_id)
+        raise HTTPException(status_code=404, detail="Genre not found")
+    except Exception as e:
+        logger.error("Error calculating average price for genre %s: %s", genre_id, e)
+        raise HTTPException(status_code=500, detail="Failed to calculate average price")
+
+
+@router.get(
+    "/average_stock/all",
+    response_model=AverageStockResponseDto,
+    summary="Calculate average stock for all books",
+    description="Calculate the average stock across all books"
+)
+async def get_average_stock_all(
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> AverageStockResponseDto:
+    try:
+        result = await book_service.calculate_average_stock_all()
+        return AverageStockResponseDto(**result)
+    except Exception as e:
+        logger.error("Error calculating average stock for all books: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to calculate average stock")
+
+
+@router.get(
+    "/average_stock/genre/{genre_id}",
+    response_model=AverageStockByGenreResponseDto,
+    summary="Calculate average stock by genre",
+    description="Calculate the average stock for books in a specific genre"
+)
+async def get_average_stock_by_genre(
+    genre_id: int,
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> AverageStockByGenreResponseDto:
+    try:
+        result = await book_service.calculate_average_stock_by_genre(genre_id)
+        return AverageStockByGenreResponseDto(**result)
+    except GenreNotFoundError:
+        logger.warning("Genre %s not found", genre_id)
+        raise HTTPException(status_code=404, detail="Genre not found")
+    except Exception as e:
+        logger.error("Error calculating average stock for genre %s: %s", genre_id, e)
+        raise HTTPException(status_code=500, detail="Failed to calculate average stock")
+
+
+# Declared last, and with an int convertor, so it never shadows the fixed /books/... paths
+@router.get(
+    "/{book_id:int}",
+    response_model=BookDto,
+    summary="Get one book",
+    description="Retrieve one book with its full record. Lists leave descriptions out; only this endpoint, "
+                "/books/by_upc/{upc} and the exports return them.",
+    responses={
+        200: {"description": "Book retrieved successfully"},
+        404: {"model": ErrorResponseDto, "description": "Book not found"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+async def get_book(
+    book_id: int,
+    book_service: IAsyncBookService = Depends(get_async_book_service)
+) -> FastJSONResponse:
+    try:
+        book = await book_service.get_book(book_id)
+    except Exception as e:
+        logger.error("Error getting book %s: %s", book_id, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    if book is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return FastJSONResponse(dumps(book_to_dict(book)))
@@ -0,0 +1,65 @@
+"""
+Async genre routes.
+Same paths and responses as genre_router, served on the event loop with the aiosqlite stack.
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List
+
+from book_api.config.async_dependencies import get_async_genre_repository
+from book_api.config.logging import get_typed_logger
+from book_api.use_cases.interfaces.async_genre_repository import IAsyncGenreRepository
+from book_api.interface.dto.book_dto import GenreDto
+from book_api.interface.dto.response_dto import ErrorResponseDto
+from book_api.interface.api.genre_router import _convert_genre_to_dto
+
+# Create router and logger
+router = APIRouter(prefix="/genres", tags=["Genres"])
+logger = get_typed_logger(__name__)
+
+
+@router.get(
+    "",
+    response_model=List[GenreDto],
+    summary="Get all genres",
+    description="Retrieve all available genres",
+    responses={
+        200: {"description": "List of genres retrieved successfully"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+async def get_all_genres(
+    genre_repo: IAsyncGenreRepository = Depends(get_async_genre_repository)
+) -> List[GenreDto]:
+    try:
+        genres = await genre_repo.get_all()
+        return [_convert_genre_to_dto(genre) for genre in genres]
+    except Exception as e:
+        logger.error("Error getting all genres: %s", e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/{genre_id}",
+    response_model=GenreDto,
+    summary="Get genre by ID",
+    description="Retrieve a specific genre by its ID",
+    responses={
+        200: {"description": "Genre retrieved successfully"},
+        404: {"model": ErrorResponseDto, "description": "Genre not found"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+async def get_genre_by_id(
+    genre_id: int,
+    genre_repo: IAsyncGenreRepository = Depends(get_async_genre_repository)
+) -> GenreDto:
+    try:
+        genre = await genre_repo.get_by_id(genre_id)
+        if not genre:
+            raise HTTPException(status_code=404, detail="Genre not found")
+        return _convert_genre_to_dto(genre)
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions
+    except Exception as e:
+        logger.error("Error getting genre %s: %s", genre_id, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -1,15 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Literal, Optional
 
 from book_api.config.dependencies import get_book_service
 from book_api.config.logging import get_typed_logger
 from book_api.use_cases.interfaces.book_service import IBookService
-from book_api.interface.dto.book_dto import BookDto, GenreDto
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.interface.dto.book_dto import BookDto, GenreDto, BookBatchRequestDto
+from book_api.interface.api.serialization import FastJSONResponse, encode_books, book_to_dict, dumps
+from book_api.interface.api.query_params import book_limit, book_sort
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.domain.exceptions import GenreNotFoundError
 from book_api.interface.dto.response_dto import (
     AveragePriceResponseDto,
     AveragePriceByGenreResponseDto,
     AverageStockResponseDto,
     AverageStockByGenreResponseDto,
+    BookBatchResponseDto,
+    BookCountResponseDto,
+    GenreSummaryDto,
+    HistogramResponseDto,
+    PercentilesResponseDto,
     ErrorResponseDto
 )
 
@@ -22,14 +32,18 @@ logger = get_typed_logger(__name__)
     "",
     response_model=List[BookDto],
     summary="Get all books",
-    description="Retrieve all books from the database"
+    description="Retrieve all books from the database, optionally sorted and limited (e.g. `?sort=price&limit=20`)"
 )
-def get_all_books(book_service: IBookService = Depends(get_book_service)) -> List[BookDto]:
+def get_all_books(
+    sort: Optional[BookSort] = Depends(book_sort),
+    limit: Optional[int] = Depends(book_limit),
+    book_service: IBookService = Depends(get_book_service)
+) -> FastJSONResponse:
     try:
-        books = book_service.get_all_books()
-        return [_convert_book_to_dto(book) for book in books]
+        books = book_service.get_all_books(sort, limit)
+        return FastJSONResponse(encode_books(books))
     except Exception as e:
-        logger.error(f"Error getting all books: {e}")
+        logger.error("Error getting all books: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -42,12 +56,12 @@ def get_all_books(book_service: IBookService = Depends(get_book_service)) -> Lis
 def search_books(
     keyword: str,
     book_service: IBookService = Depends(get_book_service)
-) -> List[BookDto]:
+) -> FastJSONResponse:
     try:
         books = book_service.search_books(keyword)
-        return [_convert_book_to_dto(book) for book in books]
+        return FastJSONResponse(encode_books(books))
     except Exception as e:
-        logger.error(f"Error searching books with keyword '{keyword}': {e}")
+        logger.error("Error searching books with keyword '%s': %s", keyword, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -55,17 +69,136 @@ def search_books(
     "/by_genre/{genre_id}",
     response_model=List[BookDto],
     summary="Get books by genre",
-    description="Retrieve all books from a specific genre"
+    description="Retrieve all books from a specific genre, optionally sorted and limited (e.g. `?sort=-rating&limit=10`)"
 )
 def get_books_by_genre(
     genre_id: int,
+    sort: Optional[BookSort] = Depends(book_sort),
+    limit: Optional[int] = Depends(book_limit),
+    book_service: IBookService = Depends(get_book_service)
+) -> FastJSONResponse:
+    try:
+        books = book_service.get_books_by_genre(genre_id, sort, limit)
+        return FastJSONResponse(encode_books(books))
+    except Exception as e:
+        logger.error("Error getting books for genre %s: %s", genre_id, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/by_upc/{upc}",
+    response_model=BookDto,
+    summary="Get one book by UPC",
+    description="Retrieve the book with exactly this UPC, full record included. Served from the UPC index.",
+    responses={
+        200: {"description": "Book retrieved successfully"},
+        404: {"model": ErrorResponseDto, "description": "Book not found"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def get_book_by_upc(
+    upc: str,
+    book_service: IBookService = Depends(get_book_service)
+) -> FastJSONResponse:
+    try:
+        book = book_service.get_book_by_upc(upc)
+    except Exception as e:
+        logger.error("Error getting book with UPC %s: %s", upc, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    if book is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return FastJSONResponse(dumps(book_to_dict(book)))
+
+
+@router.get(
+    "/by_upc_prefix/{prefix}",
+    response_model=List[BookDto],
+    summary="Search books by UPC prefix",
+    description="Retrieve the books whose UPC starts with the prefix, in UPC order (e.g. `?limit=20`). "
+                "Answered by a range scan of the UPC index, not a full scan.",
+    responses={
+        200: {"description": "Books whose UPC starts with the prefix"},
+        400: {"model": ErrorResponseDto, "description": "Empty prefix"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def search_books_by_upc_prefix(
+    prefix: str,
+    limit: Optional[int] = Depends(book_limit),
+    book_service: IBookService = Depends(get_book_service)
+) -> FastJSONResponse:
+    try:
+        books = book_service.search_books_by_upc_prefix(prefix, limit)
+        return FastJSONResponse(encode_books(books))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Error searching books with UPC prefix '%s': %s", prefix, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get(
+    "/query",
+    response_model=List[BookDto],
+    summary="Query books by several criteria",
+    description="Filter books by genre, taxed price range, minimum rating, stock and review count. "
+                "Filters are optional and combined with AND; price bounds are inclusive. "
+                "Results can be sorted and limited like the other lists.",
+    responses={
+        200: {"description": "Books matching every filter"},
+        400: {"model": ErrorResponseDto, "description": "Inconsistent filters"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def query_books(
+    genre_id: Optional[int] = Query(None, description="Genre ID"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum taxed price"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum taxed price"),
+    min_rating: Optional[int] = Query(None, ge=1, le=5, description="Minimum rating"),
+    in_stock: Optional[bool] = Query(None, description="Only books in stock (true) or out of stock (false)"),
+    min_reviews: Optional[int] = Query(None, ge=0, description="Minimum number of reviews"),
+    sort: Optional[BookSort] = Depends(book_sort),
+    limit: Optional[int] = Depends(book_limit),
     book_service: IBookService = Depends(get_book_service)
-) -> List[BookDto]:
+) -> FastJSONResponse:
+    try:
+        criteria = BookCriteria(genre_id, min_price, max_price, min_rating, in_stock, min_reviews)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
-        books = book_service.get_books_by_genre(genre_id)
-        return [_convert_book_to_dto(book) for book in books]
+        books = book_service.query_books(criteria, sort, limit)
+        return FastJSONResponse(encode_books(books))
     except Exception as e:
-        logger.error(f"Error getting books for genre {genre_id}: {e}")
+        logger.error("Error querying books with %s: %s", criteria, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "/batch",
+    response_model=BookBatchResponseDto,
+    summary="Resolve many books at once",
+    description="Look up to 1000 book IDs and/or UPCs in one call. Keys with no match are reported as missing.",
+    responses={
+        200: {"description": "Books resolved"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def get_books_batch(
+    request: BookBatchRequestDto,
+    book_service: IBookService = Depends(get_book_service)
+) -> FastJSONResponse:
+    try:
+        result = book_service.get_books_batch(request.ids, request.upcs)
+        return FastJSONResponse(dumps({
+            "books_by_id": {str(key): book_to_dict(book) for key, book in result["books_by_id"].items()},
+            "books_by_upc": {key: book_to_dict(book) for key, book in result["books_by_upc"].items()},
+            "missing_ids": result["missing_ids"],
+            "missing_upcs": result["missing_upcs"],
+        }))
+    except Exception as e:
+        logger.error("Error resolving book batch: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -92,7 +225,7 @@ def get_average_price_all(
             average_price=result["average_price"]
         )
     except Exception as e:
-        logger.error(f"Error calculating average price for all books: {e}")
+        logger.error("Error calculating average price for all books: %s", e)
         raise HTTPException(status_code=500, detail="Failed to calculate average price")
 
 
@@ -112,7 +245,7 @@ def get_average_price_by_genre(
     book_service: IBookService = Depends(get_book_service)
 ) -> AveragePriceByGenreResponseDto:
     try:
-        logger.info(f"Calculating average price for genre {genre_id}")
+        logger.info("Calculating average price for genre %s", genre_id)
         result = book_service.calculate_average_price_by_genre(genre_id)
 
         return AveragePriceByGenreResponseDto(
@@ -123,11 +256,11 @@ def get_average_price_by_genre(
             average_price=result["average_price"],
             sample_prices=result["sample_prices"]
         )
-    except ValueError as e:
-        logger.warning(f"Genre {genre_id} not found: {e}")
+    except GenreNotFoundError:
+        logger.warning("Genre %s not found", genre_id)
         raise HTTPException(status_code=404, detail="Genre not found")
     except Exception as e:
-        logger.error(f"Error calculating average price for genre {genre_id}: {e}")
+        logger.error("Error calculating average price for genre %s: %s", genre_id, e)
         raise HTTPException(status_code=500, detail="Failed to calculate average price")
 
 
@@ -154,7 +287,7 @@ def get_average_stock_all(
             average_stock=result["average_stock"]
         )
     except Exception as e:
-        logger.error(f"Error calculating average stock for all books: {e}")
+        logger.error("Error calculating average stock for all books: %s", e)
         raise HTTPException(status_code=500, detail="Failed to calculate average stock")
 
 
@@ -169,7 +302,7 @@ def get_average_stock_by_genre(
     book_service: IBookService = Depends(get_book_service)
 ) -> AverageStockByGenreResponseDto:
     try:
-        logger.info(f"Calculating average stock for genre {genre_id}")
+        logger.info("Calculating average stock for genre %s", genre_id)
         result = book_service.calculate_average_stock_by_genre(genre_id)
 
         return AverageStockByGenreResponseDto(
@@ -180,26 +313,169 @@ def get_average_stock_by_genre(
             average_stock=result["average_stock"],
             sample_stocks=result["sample_stocks"]
         )
-    except ValueError as e:
-        logger.warning(f"Genre {genre_id} not found: {e}")
+    except GenreNotFoundError:
+        logger.warning("Genre %s not found", genre_id)
         raise HTTPException(status_code=404, detail="Genre not found")
     except Exception as e:
-        logger.error(f"Error calculating average stock for genre {genre_id}: {e}")
+        logger.error("Error calculating average stock for genre %s: %s", genre_id, e)
         raise HTTPException(status_code=500, detail="Failed to calculate average stock")
 
 
-def _convert_book_to_dto(book) -> BookDto:
-    return BookDto(
-        id=book.id,
-        title=book.title,
-        genre_id=book.genre_id,
-        note=book.note,
-        stock_number=book.stock_number,
-        datetime=book.datetime,
-        upc=book.upc,
-        product_type=book.product_type,
-        price_ht=float(book.price_ht) if book.price_ht else None,
-        price_taxed=float(book.price_taxed) if book.price_taxed else None,
-        review_number=book.review_number,
-        description=book.description
-    )
\ No newline at end of file
+@router.get(
+    "/histogram/{column}",
+    response_model=HistogramResponseDto,
+    summary="Histogram of a numeric column",
+    description="Equal-width histogram of a book column, for all books or one genre. Missing values are ignored.",
+    responses={
+        200: {"description": "Histogram calculated successfully"},
+        404: {"model": ErrorResponseDto, "description": "Genre not found"},
+        422: {"model": ErrorResponseDto, "description": "Invalid parameters"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def get_histogram(
+    column: Literal["price_ht", "price_taxed", "note", "stock_number", "review_number"],
+    bins: int = Query(10, ge=1, le=100, description="Number of bins"),
+    genre_id: Optional[int] = Query(None, description="Restrict to one genre"),
+    book_service: IBookService = Depends(get_book_service)
+) -> HistogramResponseDto:
+    try:
+        logger.info("Calculating histogram of %s for genre %s", column, genre_id)
+        result = book_service.calculate_histogram(column, bins, genre_id)
+
+        return HistogramResponseDto(
+            column=result["column"],
+            genre_id=result["genre_id"],
+            edges=result["edges"],
+            counts=result["counts"]
+        )
+    except GenreNotFoundError:
+        logger.warning("Genre %s not found", genre_id)
+        raise HTTPException(status_code=404, detail="Genre not found")
+    except ValueError as e:
+        logger.warning("Invalid histogram request for %s: %s", column, e)
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error("Error calculating histogram of %s: %s", column, e)
+        raise HTTPException(status_code=500, detail="Failed to calculate histogram")
+
+
+@router.get(
+    "/percentiles/{column}",
+    response_model=PercentilesResponseDto,
+    summary="Percentiles of a numeric column",
+    description="Linearly interpolated percentiles of a book column (`?p=50&p=90&p=99`), for all books or one genre. "
+                "Missing values are ignored.",
+    responses={
+        200: {"description": "Percentiles calculated successfully"},
+        404: {"model": ErrorResponseDto, "description": "Genre not found"},
+        422: {"model": ErrorResponseDto, "description": "Percentile outside 0-100 or invalid parameters"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def get_percentiles(
+    column: Literal["price_ht", "price_taxed", "note", "stock_number", "review_number"],
+    p: List[float] = Query([50, 90, 99], description="Percentiles to compute, 0 to 100"),
+    genre_id: Optional[int] = Query(None, description="Restrict to one genre"),
+    book_service: IBookService = Depends(get_book_service)
+) -> PercentilesResponseDto:
+    if any(not 0 <= percent <= 100 for percent in p):
+        raise HTTPException(status_code=422, detail="Percentiles must be between 0 and 100")
+    try:
+        logger.info("Calculating percentiles %s of %s for genre %s", p, column, genre_id)
+        result = book_service.calculate_percentiles(column, p, genre_id)
+
+        return PercentilesResponseDto(
+            column=result["column"],
+            genre_id=result["genre_id"],
+            count=result["count"],
+            percentiles=result["percentiles"]
+        )
+    except GenreNotFoundError:
+        logger.warning("Genre %s not found", genre_id)
+        raise HTTPException(status_code=404, detail="Genre not found")
+    except ValueError as e:
+        logger.warning("Invalid percentiles request for %s: %s", column, e)
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error("Error calculating percentiles of %s: %s", column, e)
+        raise HTTPException(status_code=500, detail="Failed to calculate percentiles")
+
+
+@router.get(
+    "/stats/genres",
+    response_model=List[GenreSummaryDto],
+    summary="Summary of every genre",
+    description="Number of books, average price and average stock of each genre, in one pass over the catalog"
+)
+def get_genre_summary(
+    book_service: IBookService = Depends(get_book_service)
+) -> List[GenreSummaryDto]:
+    try:
+        logger.info("Calculating per-genre summary")
+        return [GenreSummaryDto(**summary) for summary in book_service.calculate_genre_summary()]
+    except Exception as e:
+        logger.error("Error calculating per-genre summary: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to calculate genre summary")
+
+
+@router.get(
+    "/count",
+    response_model=BookCountResponseDto,
+    summary="Count books matching filters",
+    description="Count the books matching every given filter, with the same filters as /books/query. "
+                "Price bounds are inclusive and apply to the taxed price.",
+    responses={
+        200: {"description": "Books counted successfully"},
+        400: {"model": ErrorResponseDto, "description": "Inconsistent filters"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def count_books(
+    genre_id: Optional[int] = Query(None, description="Restrict to one genre"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum taxed price"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum taxed price"),
+    min_rating: Optional[int] = Query(None, ge=1, le=5, description="Minimum rating"),
+    in_stock: Optional[bool] = Query(None, description="Only books in stock (true) or out of stock (false)"),
+    min_reviews: Optional[int] = Query(None, ge=0, description="Minimum number of reviews"),
+    book_service: IBookService = Depends(get_book_service)
+) -> BookCountResponseDto:
+    try:
+        criteria = BookCriteria(genre_id, min_price, max_price, min_rating, in_stock, min_reviews)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        count = book_service.count_books(criteria)
+        return BookCountResponseDto(count=count)
+    except Exception as e:
+        logger.error("Error counting books with %s: %s", criteria, e)
+        raise HTTPException(status_code=500, detail="Failed to count books")
+
+
+# Declared last, and with an int convertor, so it never shadows the fixed /books/... paths
+@router.get(
+    "/{book_id:int}",
+    response_model=BookDto,
+    summary="Get one book",
+    description="Retrieve one book with its full record. Lists leave descriptions out; only this endpoint, "
+                "/books/by_upc/{upc} and the exports return them.",
+    responses={
+        200: {"description": "Book retrieved successfully"},
+        404: {"model": ErrorResponseDto, "description": "Book not found"},
+        500: {"model": ErrorResponseDto, "description": "Internal server error"}
+    }
+)
+def get_book(
+    book_id: int,
+    book_service: IBookService = Depends(get_book_service)
+) -> FastJSONResponse:
+    try:
+        book = book_service.get_book(book_id)
+    except Exception as e:
+        logger.error("Error getting book %s: %s", book_id, e)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    if book is None:
+        raise HTTPException(status_code=404, detail="Book not found")
+    return FastJSONResponse(dumps(book_to_dict(book)))
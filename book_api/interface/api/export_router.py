@@ -0,0 +1,78 @@
+"""
+Catalog export routes.
+Kept in their own router so both the sync and the async stacks can serve them.
+"""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing import Callable, Iterable, Iterator
+
+from book_api.config.dependencies import get_book_service
+from book_api.config.logging import get_typed_logger
+from book_api.use_cases.interfaces.book_service import IBookService
+from book_api.interface.api.streaming import ndjson_chunks, csv_chunks, gzip_chunks
+
+# Create router and logger
+router = APIRouter(prefix="/books", tags=["Books"])
+logger = get_typed_logger(__name__)
+
+
+@router.get(
+    "/export.ndjson",
+    response_class=StreamingResponse,
+    summary="Export all books as NDJSON",
+    description="Stream the whole catalog, one JSON object per line. Use gzip=true for a compressed download.",
+    responses={200: {"content": {"application/x-ndjson": {}, "application/gzip": {}}}}
+)
+def export_books_ndjson(
+    gzip: bool = Query(False, description="Compress the stream with gzip"),
+    batch_size: int = Query(500, ge=1, le=10000, description="Rows fetched per database round trip"),
+    book_service: IBookService = Depends(get_book_service)
+) -> StreamingResponse:
+    return _export_response(
+        book_service.iter_all_books(batch_size), ndjson_chunks, "books.ndjson", "application/x-ndjson", gzip
+    )
+
+
+@router.get(
+    "/export.csv",
+    response_class=StreamingResponse,
+    summary="Export all books as CSV",
+    description="Stream the whole catalog as CSV with a header row. Use gzip=true for a compressed download.",
+    responses={200: {"content": {"text/csv": {}, "application/gzip": {}}}}
+)
+def export_books_csv(
+    gzip: bool = Query(False, description="Compress the stream with gzip"),
+    batch_size: int = Query(500, ge=1, le=10000, description="Rows fetched per database round trip"),
+    book_service: IBookService = Depends(get_book_service)
+) -> StreamingResponse:
+    return _export_response(
+        book_service.iter_all_books(batch_size), csv_chunks, "books.csv", "text/csv; charset=utf-8", gzip
+    )
+
+
+def _export_response(
+    books: Iterable,
+    encoder: Callable[[Iterable], Iterator[bytes]],
+    filename: str,
+    media_type: str,
+    compress: bool
+) -> StreamingResponse:
+    chunks = _log_stream_errors(encoder(books), filename)
+    if compress:
+        chunks = gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+def _log_stream_errors(chunks: Iterator[bytes], filename: str) -> Iterator[bytes]:
+    # Headers are already sent when a stream fails, so the best we can do is log and stop
+    try:
+        yield from chunks
+    except Exception as e:
+        logger.error("Error while streaming %s: %s", filename, e)
+        raise
@@ -30,7 +30,7 @@ def get_all_genres(
         genres = genre_repo.get_all()
         return [_convert_genre_to_dto(genre) for genre in genres]
     except Exception as e:
-        logger.error(f"Error getting all genres: {e}")
+        logger.error("Error getting all genres: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -50,7 +50,7 @@ def get_genre_by_id(
     genre_repo: IGenreRepository = Depends(get_genre_repository)
 ) -> GenreDto:
     try:
-        logger.info(f"Getting genre with ID: {genre_id}")
+        logger.info("Getting genre with ID: %s", genre_id)
         genre = genre_repo.get_by_id(genre_id)
         if not genre:
             raise HTTPException(status_code=404, detail="Genre not found")
@@ -58,7 +58,7 @@ def get_genre_by_id(
     except HTTPException:
         raise  # Re-raise HTTP exceptions
     except Exception as e:
-        logger.error(f"Error getting genre {genre_id}: {e}")
+        logger.error("Error getting genre %s: %s", genre_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
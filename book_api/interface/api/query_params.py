@@ -0,0 +1,32 @@
+"""
+Query parameters shared by the list endpoints.
+"""
+from typing import Optional
+
+from fastapi import HTTPException, Query
+
+from book_api.domain.value_objects.book_sort import BookSort, SORT_FIELDS
+
+MAX_LIMIT = 1000
+
+
+def book_sort(
+    sort: Optional[str] = Query(
+        None,
+        description=f"Sort field, prefix with '-' for descending: {', '.join(SORT_FIELDS)}. "
+                    "Books without a value for the field are left out."
+    )
+) -> Optional[BookSort]:
+    """Parse the `sort` parameter into a BookSort."""
+    if sort is None:
+        return None
+    try:
+        return BookSort.parse(sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def book_limit(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description="Maximum number of books returned")
+) -> Optional[int]:
+    return limit
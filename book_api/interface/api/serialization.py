@@ -0,0 +1,59 @@
+"""
+Fast JSON serialization for trusted database reads.
+
+Books coming out of our repositories are trusted reads of our own database,
+so list endpoints encode them straight to bytes instead of building BookDto objects
+and letting FastAPI validate them again against response_model.
+orjson is used when installed, with the standard library as a fallback.
+"""
+import json
+from typing import Any, Dict, Iterable
+
+from starlette.responses import Response
+
+from book_api.domain.entities.book import Book
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def book_to_dict(book: Book) -> Dict[str, Any]:
+    """Same shape as BookDto, without going through Pydantic."""
+    return {
+        "id": book.id,
+        "title": book.title,
+        "genre_id": book.genre_id,
+        "note": book.note,
+        "stock_number": book.stock_number,
+        "datetime": book.datetime,
+        "upc": book.upc,
+        "product_type": book.product_type,
+        "price_ht": float(book.price_ht) if book.price_ht is not None else None,
+        "price_taxed": float(book.price_taxed) if book.price_taxed is not None else None,
+        "review_number": book.review_number,
+        "description": book.description,
+    }
+
+
+def dumps(content: Any) -> bytes:
+    """Encode plain Python data (dicts, lists, numbers, strings) to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_books(books: Iterable[Book]) -> bytes:
+    """Encode books as a JSON array matching List[BookDto]."""
+    return dumps([book_to_dict(book) for book in books])
+
+
+class FastJSONResponse(Response):
+    """JSON response that accepts pre-encoded bytes or plain data."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
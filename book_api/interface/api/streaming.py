@@ -0,0 +1,55 @@
+"""
+Chunked encoders for catalog exports.
+Each function turns an iterator of books into an iterator of bytes, so responses
+can start sending before the last row has been read from the database.
+"""
+import csv
+import io
+import zlib
+from typing import Iterable, Iterator
+
+from book_api.domain.entities.book import Book
+from book_api.interface.dto.book_dto import BookDto
+from book_api.interface.api.serialization import book_to_dict, dumps
+
+EXPORT_FIELDS = list(BookDto.model_fields)
+
+
+def ndjson_chunks(books: Iterable[Book], rows_per_chunk: int = 500) -> Iterator[bytes]:
+    """One JSON object per line, grouped in chunks of rows_per_chunk lines."""
+    lines = []
+    for book in books:
+        lines.append(dumps(book_to_dict(book)))
+        if len(lines) >= rows_per_chunk:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def csv_chunks(books: Iterable[Book], rows_per_chunk: int = 500) -> Iterator[bytes]:
+    """CSV with a header row, grouped in chunks of rows_per_chunk lines."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    rows = 0
+    for book in books:
+        writer.writerow(book_to_dict(book))
+        rows += 1
+        if rows >= rows_per_chunk:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a byte stream on the fly into a single gzip member."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List
 from decimal import Decimal
 
@@ -56,4 +56,26 @@ class BookSearchRequestDto(BaseModel):
             "example": {
                 "keyword": "science"
             }
-        }
\ No newline at end of file
+        }
+
+
+MAX_BATCH_KEYS = 1000
+
+
+class BookBatchRequestDto(BaseModel):
+    ids: List[int] = Field(default_factory=list, max_length=MAX_BATCH_KEYS, description="Book IDs to resolve")
+    upcs: List[str] = Field(default_factory=list, max_length=MAX_BATCH_KEYS, description="UPCs to resolve")
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> "BookBatchRequestDto":
+        if not self.ids and not self.upcs:
+            raise ValueError("Provide at least one id or upc")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ids": [1, 2, 3],
+                "upcs": ["a897fe39b1053632"]
+            }
+        }
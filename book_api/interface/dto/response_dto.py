@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import List, Any
+from typing import Dict, List, Any, Optional
+
+from book_api.interface.dto.book_dto import BookDto
 
 
 class AveragePriceResponseDto(BaseModel):
@@ -74,6 +76,91 @@ class AverageStockByGenreResponseDto(BaseModel):
         }
 
 
+class BookBatchResponseDto(BaseModel):
+    books_by_id: Dict[int, BookDto] = Field(..., description="Found books, keyed by requested ID")
+    books_by_upc: Dict[str, BookDto] = Field(..., description="Found books, keyed by requested UPC")
+    missing_ids: List[int] = Field(..., description="Requested IDs with no matching book")
+    missing_upcs: List[str] = Field(..., description="Requested UPCs with no matching book")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "books_by_id": {"1": {"id": 1, "title": "Example Book", "upc": "a897fe39b1053632"}},
+                "books_by_upc": {},
+                "missing_ids": [99999],
+                "missing_upcs": ["0000000000000000"]
+            }
+        }
+
+
+class HistogramResponseDto(BaseModel):
+    column: str = Field(..., description="Histogrammed column")
+    genre_id: Optional[int] = Field(None, description="Genre ID, or null for all books")
+    edges: List[float] = Field(..., description="Bin edges, one more than the number of bins")
+    counts: List[int] = Field(..., description="Number of books per bin")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "column": "price_taxed",
+                "genre_id": None,
+                "edges": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+                "counts": [198, 203, 196, 201, 202]
+            }
+        }
+
+
+class PercentilesResponseDto(BaseModel):
+    column: str = Field(..., description="Column the percentiles are computed on")
+    genre_id: Optional[int] = Field(None, description="Genre ID, or null for all books")
+    count: int = Field(..., description="Number of books with a value for the column")
+    percentiles: Dict[str, Optional[float]] = Field(..., description="Value at each requested percentile")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "column": "price_taxed",
+                "genre_id": None,
+                "count": 1000,
+                "percentiles": {"p50": 35.98, "p90": 53.2, "p99": 59.42}
+            }
+        }
+
+
+class GenreSummaryDto(BaseModel):
+    genre_id: int = Field(..., description="Genre ID")
+    genre_name: Optional[str] = Field(None, description="Genre name")
+    total_books: int = Field(..., description="Total books in genre")
+    books_with_price: int = Field(..., description="Books with valid prices")
+    average_price: float = Field(..., description="Average price")
+    books_with_stock: int = Field(..., description="Books with stock info")
+    average_stock: int = Field(..., description="Average stock number")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "genre_id": 1,
+                "genre_name": "Fiction",
+                "total_books": 65,
+                "books_with_price": 65,
+                "average_price": 36.07,
+                "books_with_stock": 65,
+                "average_stock": 12
+            }
+        }
+
+
+class BookCountResponseDto(BaseModel):
+    count: int = Field(..., description="Number of books matching the filters")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "count": 42
+            }
+        }
+
+
 class ErrorResponseDto(BaseModel):
     detail: str = Field(..., description="Error description")
 
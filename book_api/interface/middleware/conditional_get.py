@@ -0,0 +1,73 @@
+"""
+HTTP conditional responses (ETag / 304 Not Modified).
+The ETag only depends on the dataset version and the request, so it can be checked
+before any repository or service work runs.
+"""
+import hashlib
+from typing import Callable, Iterable, Optional
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from book_api.infrastructure.database.dataset_version import UNAVAILABLE_VERSION
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """
+    Attach ETag and Cache-Control headers to read endpoints and answer
+    If-None-Match with 304 when the client already has the current data.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        version: Callable[[], str],
+        path_prefixes: Iterable[str] = ("/books", "/genres"),
+        max_age: int = 0
+    ):
+        super().__init__(app)
+        self.version = version
+        self.path_prefixes = tuple(path_prefixes)
+        self.cache_control = f"public, max-age={max_age}, must-revalidate"
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.method not in ("GET", "HEAD") or not request.url.path.startswith(self.path_prefixes):
+            return await call_next(request)
+
+        etag = self._compute_etag(request)
+        if etag is None:
+            return await call_next(request)
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": self.cache_control}
+            )
+
+        response = await call_next(request)
+        if response.status_code == 200:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = self.cache_control
+        return response
+
+    def _compute_etag(self, request: Request) -> Optional[str]:
+        version = self.version()
+        if version == UNAVAILABLE_VERSION:
+            return None
+
+        # Sort query parameters so ?a=1&b=2 and ?b=2&a=1 share an ETag
+        query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+        digest = hashlib.sha1(f"{version}|{request.url.path}|{query}".encode()).hexdigest()[:20]
+        return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110, section 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == wanted for candidate in if_none_match.split(","))
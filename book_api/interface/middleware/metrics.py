@@ -0,0 +1,70 @@
+"""
+Request metrics middleware.
+Plain ASGI rather than BaseHTTPMiddleware so streamed responses (exports) are
+measured to their last chunk, with the SQL they run while streaming.
+"""
+import time
+from typing import Dict, Iterable
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from book_api.infrastructure.monitoring.metrics import MetricsRegistry
+from book_api.infrastructure.monitoring.query_stats import track_queries
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Record latency, status, response size, SQL count and SQL time for every HTTP request."""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry, exclude_paths: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.registry = registry
+        self.exclude_paths = frozenset(exclude_paths)
+        # Routes that served a request, by template
+        self._seen_routes: Dict[str, BaseRoute] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # Kept if the app fails before starting a response
+        size = 0
+
+        async def measured_send(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, measured_send)
+            finally:
+                self.registry.observe_request(
+                    scope["method"],
+                    self._route_template(scope),
+                    status,
+                    time.perf_counter() - start,
+                    size,
+                    queries
+                )
+
+    def _route_template(self, scope: Scope) -> str:
+        """Path template of the route that served the request, never the raw path."""
+        # The router stores the matched route in the scope
+        route = scope.get("route")
+        if route is not None:
+            self._seen_routes.setdefault(route.path, route)
+            return route.path
+        # Answered before routing (a 304 from ConditionalGetMiddleware). The client got its ETag
+        # from an earlier 200 of the same route, so that route is among those already seen.
+        for seen in list(self._seen_routes.values()):
+            if seen.matches(scope)[0] == Match.FULL:
+                return seen.path
+        return UNMATCHED_ROUTE
@@ -0,0 +1,118 @@
+"""
+On-demand request profiling.
+A request carrying the profiling secret in `X-Profile-Token` is run under the
+sampling profiler; everyone else goes straight through.
+"""
+import hmac
+import os
+import re
+import threading
+import time
+from typing import List, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from book_api.config.logging import get_typed_logger
+from book_api.infrastructure.monitoring.stack_sampler import StackSampler, render_collapsed
+
+logger = get_typed_logger(__name__)
+
+PROFILE_HEADER = b"x-profile-token"
+
+
+class ProfilingMiddleware:
+    """
+    Profile single requests that present the secret.
+
+    With `output_dir`, the collapsed stacks are written there and the normal response
+    is returned with an `X-Profile-File` header. Without it, the profile replaces the
+    response body (`text/plain`), the route's own status is kept in `X-Profile-Status`.
+    One request is profiled at a time; others carrying the header are served normally.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        secret: str,
+        output_dir: Optional[str] = None,
+        interval: float = 0.001
+    ):
+        if not secret:
+            raise ValueError("A profiling secret is required")
+        self.app = app
+        self.secret = secret.encode()
+        self.output_dir = output_dir
+        self.interval = interval
+        self._busy = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._authorized(scope) or not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._busy.release()
+
+    def _authorized(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return hmac.compare_digest(value, self.secret)
+        return False
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        held: List[Message] = []
+
+        async def hold_or_send(message: Message) -> None:
+            if self.output_dir is None:
+                held.append(message)  # Replaced by the profile once the route is done
+            elif message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-file", file_name.encode())]
+                await send(message)
+            else:
+                await send(message)
+
+        file_name = _profile_file_name(scope)
+        sampler = StackSampler(self.interval)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, hold_or_send)
+        finally:
+            stacks = sampler.stop()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                "Profiled %s %s: %.1f ms, %s samples", scope["method"], scope["path"], elapsed_ms, sampler.samples
+            )
+
+        profile = render_collapsed(stacks)
+        if self.output_dir is not None:
+            # Disk I/O off the event loop, other requests keep being served meanwhile
+            await run_in_threadpool(_write_profile, self.output_dir, file_name, profile)
+            return
+
+        status = next((message["status"] for message in held if message["type"] == "http.response.start"), 500)
+        body = profile.encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-profile-status", str(status).encode()),
+                (b"x-profile-samples", str(sampler.samples).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def _write_profile(output_dir: str, file_name: str, profile: str) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, file_name), "w") as output:
+        output.write(profile)
+
+
+def _profile_file_name(scope: Scope) -> str:
+    path = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() % 1_000_000:06d}-{scope['method']}-{path}.collapsed"
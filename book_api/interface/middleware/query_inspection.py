@@ -0,0 +1,29 @@
+"""
+Query budget middleware.
+Runs every HTTP request inside a QueryInspector scope labelled with its route.
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from book_api.infrastructure.monitoring.query_inspector import QueryInspector
+
+
+class QueryInspectionMiddleware:
+    """Flag requests that go over the query budget or repeat a statement (N+1)."""
+
+    def __init__(self, app: ASGIApp, inspector: QueryInspector):
+        self.app = app
+        self.inspector = inspector
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.inspector.inspect(f"{scope['method']} {scope['path']}") as report:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # Prefer the route template once routing has run
+                route = scope.get("route")
+                if route is not None:
+                    report.label = f"{scope['method']} {route.path}"
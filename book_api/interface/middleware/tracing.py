@@ -0,0 +1,54 @@
+"""
+Request tracing middleware.
+Opens the root span of each request; layer and SQL spans nest under it.
+"""
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from book_api.infrastructure.monitoring.tracing import get_tracer
+
+
+class TracingMiddleware:
+    """Server span per HTTP request, named after the route template once routing has run."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        tracer = get_tracer()
+        if scope["type"] != "http" or tracer is None:
+            await self.app(scope, receive, send)
+            return
+
+        from opentelemetry.trace import SpanKind, Status, StatusCode, get_current_span
+
+        # Recent FastAPI versions open their own server span when a tracer provider is set
+        if getattr(get_current_span(), "kind", None) == SpanKind.SERVER:
+            await self.app(scope, receive, send)
+            return
+
+        size = 0
+
+        with tracer.start_as_current_span(
+            f"{scope['method']} {scope['path']}",
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]}
+        ) as span:
+
+            async def traced_send(message: Message) -> None:
+                nonlocal size
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, traced_send)
+            finally:
+                span.set_attribute("http.response.body.size", size)
+                route = scope.get("route")
+                if route is not None:
+                    span.set_attribute("http.route", route.path)
+                    span.update_name(f"{scope['method']} {route.path}")
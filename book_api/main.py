@@ -1,30 +1,173 @@
-from fastapi import FastAPI
-from book_api.infrastructure.database.connection import engine, Base
-from book_api.interface.api.book_router import router as book_router
-from book_api.interface.api.genre_router import router as genre_router
-from book_api.config.logging import setup_logging
+import time
 
-# Setup logging
-setup_logging(level="INFO")
+# Taken before the other imports, to report how long importing the API takes (hence the E402 waivers)
+_IMPORT_STARTED = time.perf_counter()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+import logging  # noqa: E402
+from contextlib import asynccontextmanager  # noqa: E402
+from typing import Optional  # noqa: E402
 
-# Initialize FastAPI application
-app = FastAPI(
-    title="BookScrape API - Clean Architecture",
-    description="API pour livres et genres - Version refactorisée selon Clean Architecture",
-    version="2.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
+from fastapi import APIRouter, FastAPI  # noqa: E402
+from fastapi.responses import PlainTextResponse  # noqa: E402
+from book_api.interface.api.book_router import router as book_router  # noqa: E402
+from book_api.interface.api.genre_router import router as genre_router  # noqa: E402
+from book_api.interface.api.export_router import router as export_router  # noqa: E402
+from book_api.config.logging import setup_logging_from_settings  # noqa: E402
+from book_api.config.settings import get_settings  # noqa: E402
+from book_api.config.container import get_container  # noqa: E402
+from book_api.config.dependencies import get_query_cache, get_dataset_version, get_metrics  # noqa: E402
+from book_api.infrastructure.monitoring.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE  # noqa: E402
+from book_api.interface.middleware.conditional_get import ConditionalGetMiddleware  # noqa: E402
 
-# Include routers
-app.include_router(book_router)
-app.include_router(genre_router)
+logger = logging.getLogger(__name__)
 
 
-@app.get("/", tags=["Root"])
+def routes_not_in(router: APIRouter, served_by: APIRouter) -> APIRouter:
+    """Copy of router without the (path, method) pairs that served_by already handles."""
+    served = {(route.path, method) for route in served_by.routes for method in route.methods}
+    remaining = APIRouter()
+    remaining.routes.extend(
+        route for route in router.routes
+        if not any((route.path, method) in served for method in route.methods)
+    )
+    return remaining
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Database work happens here, once the server starts, never at import.
+    Timings are logged and kept in `app.state.startup_timings`.
+    """
+    # Imported here: the schema helpers pull in the models, the engine is created on first use
+    from book_api.infrastructure.database.connection import Base, get_engine
+    from book_api.infrastructure.database.schema import ensure_indexes
+
+    timings = app.state.startup_timings
+    start = time.perf_counter()
+
+    # Create database tables, and the indexes missing from existing ones
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes(engine)
+    schema_done = time.perf_counter()
+
+    # Genres are served from memory, load them before the first request
+    get_container().genre_repository.load()
+    genres_done = time.perf_counter()
+
+    timings.update(
+        schema_ms=round((schema_done - start) * 1000, 1),
+        genres_ms=round((genres_done - schema_done) * 1000, 1),
+        startup_ms=round((genres_done - start) * 1000, 1),
+    )
+    logger.info(
+        "Startup done in %s ms (schema %s ms, genres %s ms); imports took %s ms, app creation %s ms",
+        timings["startup_ms"], timings["schema_ms"], timings["genres_ms"],
+        timings["import_ms"], timings["create_app_ms"]
+    )
+    yield
+
+    if get_settings().tracing_exporter:
+        from book_api.infrastructure.monitoring.tracing import shutdown_tracing
+
+        shutdown_tracing()
+
+
+def create_app() -> FastAPI:
+    """
+    Build the API from the settings.
+    Nothing here opens the database: engines are lazy and schema work runs in `lifespan`.
+    Optional middlewares are only imported when they are enabled.
+    """
+    started = time.perf_counter()
+    settings = get_settings()
+
+    # Setup logging: written by a background thread, hot-path loggers optionally sampled
+    setup_logging_from_settings(settings)
+
+    # Tracing wraps the container's layers, so it is configured before the container is built
+    if settings.tracing_exporter:
+        from book_api.infrastructure.monitoring.tracing import configure_tracing
+
+        configure_tracing(settings.tracing_exporter, settings.tracing_file)
+
+    # Initialize FastAPI application
+    app = FastAPI(
+        title="BookScrape API - Clean Architecture",
+        description="API pour livres et genres - Version refactorisée selon Clean Architecture",
+        version="2.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan
+    )
+
+    # Answer If-None-Match with 304 before any database work
+    app.add_middleware(
+        ConditionalGetMiddleware,
+        version=lambda: get_dataset_version().current(),
+        max_age=settings.http_cache_max_age
+    )
+
+    # Slow-query log and query budget per request, off unless BOOK_API_QUERY_INSPECTION=1
+    if settings.query_inspection:
+        from book_api.interface.middleware.query_inspection import QueryInspectionMiddleware
+
+        get_container().query_inspector.install()
+        app.add_middleware(QueryInspectionMiddleware, inspector=get_container().query_inspector)
+
+    # Outside the middlewares above, so 304s and errors are measured too
+    if settings.metrics_enabled:
+        from book_api.infrastructure.monitoring.query_stats import install_query_listeners
+        from book_api.interface.middleware.metrics import MetricsMiddleware
+
+        install_query_listeners()
+        app.add_middleware(MetricsMiddleware, registry=get_metrics())
+
+    # Root span of each request, around the metrics so their overhead shows in the trace
+    if settings.tracing_exporter:
+        from book_api.interface.middleware.tracing import TracingMiddleware
+
+        app.add_middleware(TracingMiddleware)
+
+    # Per-request profiles on demand, for callers holding the secret
+    if settings.profiling_secret:
+        from book_api.interface.middleware.profiling import ProfilingMiddleware
+
+        app.add_middleware(
+            ProfilingMiddleware,
+            secret=settings.profiling_secret,
+            output_dir=settings.profiling_output_dir or None,
+            interval=settings.profiling_interval_ms / 1000
+        )
+
+    # Include routers (async stack is opt-in with BOOK_API_ASYNC_DATABASE=1)
+    app.include_router(export_router)
+    if settings.async_database:
+        from book_api.interface.api.async_book_router import router as async_book_router
+        from book_api.interface.api.async_genre_router import router as async_genre_router
+
+        app.include_router(async_book_router)
+        app.include_router(async_genre_router)
+        # Endpoints without an async implementation are still served by the threadpool routers
+        app.include_router(routes_not_in(book_router, async_book_router))
+    else:
+        app.include_router(book_router)
+        app.include_router(genre_router)
+
+    app.include_router(health_router)
+
+    app.state.startup_timings = {
+        "import_ms": round((_IMPORT_DONE - _IMPORT_STARTED) * 1000, 1),
+        "create_app_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    return app
+
+
+health_router = APIRouter()
+
+
+@health_router.get("/", tags=["Root"])
 def read_root():
     """
     Root endpoint.
@@ -36,9 +179,44 @@ def read_root():
     }
 
 
-@app.get("/health", tags=["Health"])
+@health_router.get("/health", tags=["Health"])
 def health_check():
     """
     Health check endpoint.
     """
-    return {"status": "healthy", "architecture": "clean"}
\ No newline at end of file
+    return {"status": "healthy", "architecture": "clean"}
+
+
+@health_router.get("/cache/stats", tags=["Health"])
+def cache_stats():
+    """
+    Hit/miss counters of the read-through cache.
+    """
+    return get_query_cache().stats()
+
+
+@health_router.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def read_metrics():
+    """
+    Per-route latency, response size and SQL metrics in Prometheus text format.
+    """
+    return PlainTextResponse(get_metrics().render(), media_type=METRICS_CONTENT_TYPE)
+
+
+_IMPORT_DONE = time.perf_counter()
+
+_app: Optional[FastAPI] = None
+
+
+def __getattr__(name: str):
+    """
+    `book_api.main.app`, for `uvicorn book_api.main:app`, built on first access rather than at import:
+    a process that only imports the module (or runs `--factory book_api.main:create_app`) sets up
+    logging, tracing and the container once, from create_app.
+    """
+    global _app
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _app is None:
+        _app = create_app()
+    return _app
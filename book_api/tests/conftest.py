@@ -33,4 +33,24 @@ def sample_books_list():
         Book(id=1, title="Book 1", genre_id=1, price_taxed=Decimal("10.00")),
         Book(id=2, title="Book 2", genre_id=1, price_taxed=Decimal("20.00")),
         Book(id=3, title="Book 3", genre_id=2, price_taxed=None),
-    ]
\ No newline at end of file
+    ]
+
+
+@pytest.fixture
+def db_session():
+    """Fixture that provides a session on an empty in-memory database."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from book_api.infrastructure.database.connection import Base
+    from book_api.infrastructure.database import models  # noqa: F401 - registers tables
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
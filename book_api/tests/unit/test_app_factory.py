@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def run_python(code: str, database_path: str) -> dict:
+    """Run code in a fresh interpreter (settings and engines are process-wide) and return its JSON output."""
+    env = dict(os.environ, BOOK_API_DATABASE_PATH=database_path, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_importing_the_app_does_not_touch_the_database(tmp_path):
+    database = tmp_path / "catalog.db"
+
+    output = run_python("""
+        import json, logging
+        import book_api.main
+        from book_api.config.container import get_container
+        from book_api.infrastructure.database import connection
+        print(json.dumps({
+            "engines": connection.get_engine.cache_info().currsize,
+            "containers": get_container.cache_info().currsize,
+            "log_handlers": len(logging.getLogger().handlers),
+        }))
+    """, str(database))
+
+    assert not database.exists()
+    assert output == {"engines": 0, "containers": 0, "log_handlers": 0}
+
+
+def test_module_level_app_is_built_once_on_first_access(tmp_path):
+    output = run_python("""
+        import json
+        import book_api.main
+        from book_api.main import app
+        print(json.dumps({"same": book_api.main.app is app, "title": app.title}))
+    """, str(tmp_path / "catalog.db"))
+
+    assert output == {"same": True, "title": "BookScrape API - Clean Architecture"}
+
+
+def test_importing_the_legacy_app_does_not_connect(tmp_path):
+    output = run_python("""
+        import json
+        import book_api.app.main
+        from book_api.app.database import engine
+        print(json.dumps({"connections": engine.pool.checkedin() + engine.pool.checkedout()}))
+    """, str(tmp_path / "unused.db"))
+
+    assert output["connections"] == 0
+
+
+def test_lifespan_creates_the_schema_and_reports_timings(tmp_path):
+    database = tmp_path / "catalog.db"
+
+    output = run_python("""
+        import json, sqlite3
+        from fastapi.testclient import TestClient
+        from book_api.main import create_app
+        from book_api.config.settings import get_settings
+
+        app = create_app()
+        with TestClient(app) as client:
+            status = client.get("/genres").status_code
+        tables = [row[0] for row in sqlite3.connect(get_settings().database_path).execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")]
+        print(json.dumps({"status": status, "tables": tables, "timings": app.state.startup_timings}))
+    """, str(database))
+
+    assert output["status"] == 200
+    assert {"books", "books_genres"} <= set(output["tables"])
+    assert {"import_ms", "create_app_ms", "schema_ms", "genres_ms", "startup_ms"} <= set(output["timings"])
@@ -0,0 +1,90 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from book_api.use_cases.services.async_book_service import AsyncBookService
+from book_api.domain.entities.book import Book
+from book_api.domain.entities.genre import Genre
+
+
+class TestAsyncBookService:
+    def setup_method(self):
+        """Setup async mocked repositories before each test."""
+        self.mock_book_repo = AsyncMock()
+        self.mock_genre_repo = AsyncMock()
+        self.service = AsyncBookService(self.mock_book_repo, self.mock_genre_repo)
+
+    def test_calculate_average_price_all(self):
+        self.mock_book_repo.get_all.return_value = [
+            Book(id=1, title="Book 1", genre_id=1, price_taxed=Decimal("10.00")),
+            Book(id=2, title="Book 2", genre_id=1, price_taxed=Decimal("20.00")),
+            Book(id=3, title="Book 3", genre_id=1, price_taxed=None),
+        ]
+
+        result = asyncio.run(self.service.calculate_average_price_all())
+
+        assert result == {"total_books": 3, "books_with_price": 2, "average_price": 15.00}
+
+    def test_calculate_average_stock_by_genre(self):
+        self.mock_genre_repo.get_by_id.return_value = Genre(id=1, name="Fiction")
+        self.mock_book_repo.get_by_genre_id.return_value = [
+            Book(id=1, title="Book 1", genre_id=1, stock_number=10),
+            Book(id=2, title="Book 2", genre_id=1, stock_number=20),
+        ]
+
+        result = asyncio.run(self.service.calculate_average_stock_by_genre(1))
+
+        assert result["genre_name"] == "Fiction"
+        assert result["average_stock"] == 15
+        assert result["sample_stocks"] == [10, 20]
+
+    def test_genre_not_found(self):
+        self.mock_genre_repo.get_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="Genre not found"):
+            asyncio.run(self.service.calculate_average_price_by_genre(999))
+
+
+class TestAsyncBookRepository:
+    def test_queries_run_on_async_session(self):
+        pytest.importorskip("aiosqlite")
+        pytest.importorskip("greenlet")
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        from book_api.infrastructure.database.connection import Base
+        from book_api.infrastructure.database.models import BookModel, GenreModel
+        from book_api.infrastructure.repositories.async_book_repository import AsyncBookRepository
+        from book_api.infrastructure.repositories.async_genre_repository import AsyncGenreRepository
+
+        async def scenario():
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with async_sessionmaker(engine)() as session:
+                session.add(GenreModel(id=1, genre="poetry"))
+                session.add_all([
+                    BookModel(id=1, title="Python Poems", genre_id=1, price_taxed=12.5),
+                    BookModel(id=2, title="Other", genre_id=2),
+                ])
+                await session.commit()
+
+                books = AsyncBookRepository(session)
+                genres = AsyncGenreRepository(session)
+                result = (
+                    await books.get_by_keyword("python"),
+                    await books.get_by_genre_id(2),
+                    await books.get_by_id(3),
+                    await genres.get_by_id(1),
+                )
+            await engine.dispose()
+            return result
+
+        by_keyword, by_genre, missing, genre = asyncio.run(scenario())
+
+        assert [book.id for book in by_keyword] == [1]
+        assert by_keyword[0].price_taxed == Decimal("12.5")
+        assert [book.id for book in by_genre] == [2]
+        assert missing is None
+        assert genre.name == "Poetry"
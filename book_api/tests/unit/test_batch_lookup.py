@@ -0,0 +1,86 @@
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event
+
+from book_api.domain.entities.book import Book
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.repositories import book_repository
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.interface.dto.book_dto import BookBatchRequestDto, MAX_BATCH_KEYS
+from book_api.use_cases.services.book_service import BookService
+
+
+class TestBookRepositoryBatch:
+    def setup_books(self, db_session):
+        db_session.add_all([
+            BookModel(id=i, title=f"Book {i}", genre_id=1, upc=f"{i:016x}") for i in range(1, 8)
+        ])
+        db_session.commit()
+
+    def test_get_by_ids_is_chunked(self, db_session, monkeypatch):
+        self.setup_books(db_session)
+        monkeypatch.setattr(book_repository, "MAX_IN_PARAMETERS", 3)
+        statements = []
+
+        @event.listens_for(db_session.bind, "before_cursor_execute")
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        books = BookRepository(db_session).get_by_ids([1, 2, 3, 4, 5, 42])
+
+        assert sorted(book.id for book in books) == [1, 2, 3, 4, 5]
+        assert len(statements) == 2
+
+    def test_get_by_upcs(self, db_session):
+        self.setup_books(db_session)
+
+        books = BookRepository(db_session).get_by_upcs([f"{2:016x}", "missing"])
+
+        assert [book.id for book in books] == [2]
+
+
+class TestBookServiceBatch:
+    def setup_method(self):
+        self.mock_book_repo = Mock()
+        self.service = BookService(self.mock_book_repo, Mock())
+
+    def test_results_are_keyed_by_input_with_missing_keys(self):
+        self.mock_book_repo.get_by_ids.return_value = [Book(id=2, title="B", genre_id=1)]
+        self.mock_book_repo.get_by_upcs.return_value = [Book(id=5, title="E", genre_id=1, upc="abc")]
+
+        result = self.service.get_books_batch([2, 3, 2], ["abc", "zzz"])
+
+        assert list(result["books_by_id"]) == [2]
+        assert result["books_by_upc"]["abc"].id == 5
+        assert result["missing_ids"] == [3]
+        assert result["missing_upcs"] == ["zzz"]
+        self.mock_book_repo.get_by_ids.assert_called_once_with([2, 3])
+
+    def test_upcs_are_looked_up_case_insensitively(self):
+        self.mock_book_repo.get_by_upcs.return_value = [Book(id=5, title="E", genre_id=1, upc="abc")]
+
+        result = self.service.get_books_batch([], ["ABC", "abc", "Zz"])
+
+        self.mock_book_repo.get_by_upcs.assert_called_once_with(["abc", "zz"])
+        assert {upc: book.id for upc, book in result["books_by_upc"].items()} == {"ABC": 5, "abc": 5}
+        assert result["missing_upcs"] == ["Zz"]
+
+    def test_no_query_for_empty_key_list(self):
+        self.mock_book_repo.get_by_ids.return_value = []
+
+        result = self.service.get_books_batch([1], [])
+
+        self.mock_book_repo.get_by_upcs.assert_not_called()
+        assert result["missing_ids"] == [1]
+
+
+class TestBookBatchRequestDto:
+    def test_empty_request_is_rejected(self):
+        with pytest.raises(ValidationError):
+            BookBatchRequestDto()
+
+    def test_too_many_keys_are_rejected(self):
+        with pytest.raises(ValidationError):
+            BookBatchRequestDto(ids=list(range(MAX_BATCH_KEYS + 1)))
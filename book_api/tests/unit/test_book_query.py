@@ -0,0 +1,118 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.database.schema import ensure_indexes
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.use_cases.services.book_service import BookService
+
+BOOKS = [
+    dict(id=1, title="A", genre_id=1, note=5, stock_number=3, price_taxed=12.0, review_number=0),
+    dict(id=2, title="B", genre_id=1, note=2, stock_number=0, price_taxed=24.0, review_number=4),
+    dict(id=3, title="C", genre_id=2, note=4, stock_number=None, price_taxed=None, review_number=1),
+    dict(id=4, title="D", genre_id=2, note=3, stock_number=7, price_taxed=36.5, review_number=None),
+    dict(id=5, title="E", genre_id=1, note=4, stock_number=12, price_taxed=16.0, review_number=2),
+]
+
+FILTERED_CRITERIA = [
+    BookCriteria(genre_id=1),
+    BookCriteria(genre_id=1, min_price=10, max_price=20),
+    BookCriteria(genre_id=1, min_rating=4),
+    BookCriteria(min_price=10, max_price=20),
+    BookCriteria(min_rating=4),
+    BookCriteria(in_stock=True),
+    BookCriteria(min_reviews=2),
+    BookCriteria(genre_id=2, in_stock=True, min_reviews=1),
+    BookCriteria(min_price=15, min_rating=3, in_stock=True, min_reviews=0),
+]
+
+
+@pytest.fixture
+def repository(db_session):
+    db_session.add_all([BookModel(**row) for row in BOOKS])
+    db_session.commit()
+    return BookRepository(db_session)
+
+
+def query_plan(db_session, criteria):
+    """Run the repository query and return SQLite's plan for the statement it sent."""
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        BookRepository(db_session).get_by_criteria(criteria)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = sent[-1]
+    rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+class TestBookCriteria:
+    def test_inconsistent_bounds_are_rejected(self):
+        with pytest.raises(ValueError, match="greater than maximum"):
+            BookCriteria(min_price=20, max_price=10)
+        with pytest.raises(ValueError, match="between 1 and 5"):
+            BookCriteria(min_rating=6)
+        with pytest.raises(ValueError, match="negative"):
+            BookCriteria(min_reviews=-1)
+
+    def test_is_empty(self):
+        assert BookCriteria().is_empty()
+        assert not BookCriteria(in_stock=False).is_empty()
+
+
+class TestBookRepositoryQuery:
+    @pytest.mark.parametrize("criteria, expected_ids", [
+        (BookCriteria(), [1, 2, 3, 4, 5]),
+        (BookCriteria(genre_id=1, min_price=10, max_price=20), [1, 5]),
+        (BookCriteria(min_rating=4, in_stock=True), [1, 5]),
+        (BookCriteria(in_stock=False), [2, 3]),
+        (BookCriteria(min_reviews=1, genre_id=2), [3]),
+        (BookCriteria(min_price=0), [1, 2, 4, 5]),
+    ])
+    def test_filters_are_combined(self, repository, criteria, expected_ids):
+        assert sorted(book.id for book in repository.get_by_criteria(criteria)) == expected_ids
+
+    @pytest.mark.parametrize("criteria", FILTERED_CRITERIA)
+    def test_filtered_queries_use_an_index(self, db_session, criteria):
+        plan = query_plan(db_session, criteria)
+
+        assert plan, "no query plan"
+        assert not any(step.startswith("SCAN books") and "INDEX" not in step for step in plan), plan
+        assert any("USING INDEX" in step or "USING COVERING INDEX" in step for step in plan), plan
+
+
+class TestEnsureIndexes:
+    def test_creates_missing_indexes_only(self, db_session):
+        engine = db_session.get_bind()
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ix_books_genre_price_taxed")
+
+        ensure_indexes(engine)
+        ensure_indexes(engine)  # Nothing left to create
+
+        with engine.connect() as connection:
+            names = {row[0] for row in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'books'"
+            )}
+        assert "ix_books_genre_price_taxed" in names
+
+
+class TestBookServiceQuery:
+    def test_query_books_delegates_to_repository(self):
+        book_repo = Mock()
+        service = BookService(book_repo, Mock())
+        criteria = BookCriteria(genre_id=1, in_stock=True)
+
+        service.query_books(criteria)
+
+        book_repo.get_by_criteria.assert_called_once_with(criteria, None, None)
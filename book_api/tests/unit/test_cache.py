@@ -0,0 +1,202 @@
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from book_api.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from book_api.infrastructure.cache.cached_book_service import CachedBookService
+from book_api.infrastructure.database.dataset_version import DatasetVersion
+from book_api.domain.value_objects.book_sort import BookSort
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUTTLCache:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = LRUTTLCache(max_entries=2, ttl=10, clock=self.clock)
+
+    def test_hit_after_miss(self):
+        loader = Mock(return_value="value")
+
+        assert self.cache.get_or_load("key", loader) == "value"
+        assert self.cache.get_or_load("key", loader) == "value"
+
+        loader.assert_called_once()
+        assert self.cache.stats()["hits"] == 1
+        assert self.cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get_or_load("a", lambda: 1)
+        self.cache.get_or_load("b", lambda: 2)
+        self.cache.get_or_load("a", lambda: 1)  # "a" becomes most recent
+        self.cache.get_or_load("c", lambda: 3)
+
+        loader = Mock(return_value=2)
+        self.cache.get_or_load("b", loader)
+
+        loader.assert_called_once()
+        assert self.cache.stats()["evictions"] >= 1
+
+    def test_entry_expires_after_ttl(self):
+        loader = Mock(return_value="value")
+        self.cache.get_or_load("key", loader)
+
+        self.clock.now = 11
+        self.cache.get_or_load("key", loader)
+
+        assert loader.call_count == 2
+        assert self.cache.stats()["expirations"] == 1
+
+    def test_new_version_clears_cache(self):
+        loader = Mock(return_value="value")
+        self.cache.get_or_load("key", loader, version="v1")
+        self.cache.get_or_load("key", loader, version="v2")
+
+        assert loader.call_count == 2
+        assert self.cache.stats()["invalidations"] == 1
+
+    def test_value_loaded_for_stale_version_is_not_stored(self):
+        def loader():
+            # Another request sees a newer dataset while we are loading
+            self.cache.get_or_load("other", lambda: None, version="v2")
+            return "stale"
+
+        self.cache.get_or_load("key", loader, version="v1")
+
+        assert self.cache.stats()["entries"] == 1
+
+    def test_peek_never_loads(self):
+        assert self.cache.peek("key", version="v1") is None
+        self.cache.get_or_load("key", lambda: "value", version="v1")
+
+        assert self.cache.peek("key", version="v1") == "value"
+        assert self.cache.peek("key", version="v2") is None
+        self.clock.now = 11
+        assert self.cache.peek("key", version="v1") is None
+        assert self.cache.stats()["misses"] == 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            LRUTTLCache(max_entries=0)
+
+
+class TestCachedBookService:
+    def setup_method(self):
+        self.inner = Mock()
+        self.version = "v1"
+        self.service = CachedBookService(self.inner, LRUTTLCache(), lambda: self.version)
+
+    def test_repeated_calls_hit_inner_service_once(self):
+        self.inner.calculate_average_price_by_genre.return_value = {"average_price": 10.0}
+
+        self.service.calculate_average_price_by_genre(1)
+        result = self.service.calculate_average_price_by_genre(1)
+
+        assert result == {"average_price": 10.0}
+        self.inner.calculate_average_price_by_genre.assert_called_once_with(1)
+
+    def test_arguments_are_part_of_the_key(self):
+        self.service.search_books("python")
+        self.service.search_books("poetry")
+
+        assert self.inner.search_books.call_count == 2
+
+    def test_dataset_change_invalidates(self):
+        self.service.get_all_books()
+        self.version = "v2"
+        self.service.get_all_books()
+
+        assert self.inner.get_all_books.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        self.inner.calculate_average_stock_by_genre.side_effect = ValueError("Genre not found")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                self.service.calculate_average_stock_by_genre(999)
+
+        assert self.inner.calculate_average_stock_by_genre.call_count == 2
+
+    def test_lists_bypass_the_cache_when_disabled(self):
+        cache = LRUTTLCache()
+        service = CachedBookService(self.inner, cache, lambda: self.version, cache_lists=False)
+
+        for _ in range(2):
+            service.get_all_books()
+            service.get_books_by_genre(1, BookSort("price"), 5)
+            service.calculate_average_price_all()
+
+        assert self.inner.get_all_books.call_count == 2
+        self.inner.get_books_by_genre.assert_called_with(1, BookSort("price"), 5)
+        assert self.inner.get_books_by_genre.call_count == 2
+        # Aggregates are small and still cached
+        self.inner.calculate_average_price_all.assert_called_once_with()
+        assert len(cache) == 1
+
+
+class TestDatasetVersion:
+    def _create_database(self, path):
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT, datetime TEXT)")
+        conn.execute("INSERT INTO books (title, datetime) VALUES ('Book 1', '2024-01-01')")
+        conn.commit()
+        return conn
+
+    def test_version_changes_when_books_are_added(self, tmp_path):
+        path = str(tmp_path / "books.db")
+        writer = self._create_database(path)
+        version = DatasetVersion(path, check_interval=0)
+
+        first = version.current()
+        assert version.current() == first
+
+        writer.execute("INSERT INTO books (title, datetime) VALUES ('Book 2', '2024-01-02')")
+        writer.commit()
+
+        assert version.current() != first
+        version.close()
+        writer.close()
+
+    def test_version_row_from_pipeline_is_preferred(self, tmp_path):
+        path = str(tmp_path / "books.db")
+        writer = self._create_database(path)
+        writer.execute("CREATE TABLE dataset_version (id INTEGER PRIMARY KEY, version INTEGER, updated_at TEXT)")
+        writer.execute("INSERT INTO dataset_version (id, version) VALUES (1, 7)")
+        writer.commit()
+
+        version = DatasetVersion(path, check_interval=0)
+        assert version.current() == "v7"
+
+        writer.execute("UPDATE dataset_version SET version = 8 WHERE id = 1")
+        writer.commit()
+
+        assert version.current() == "v8"
+        version.close()
+        writer.close()
+
+    def test_probe_is_throttled(self, tmp_path):
+        path = str(tmp_path / "books.db")
+        writer = self._create_database(path)
+        clock = FakeClock()
+        version = DatasetVersion(path, check_interval=5, clock=clock)
+
+        first = version.current()
+        writer.execute("INSERT INTO books (title, datetime) VALUES ('Book 2', '2024-01-02')")
+        writer.commit()
+
+        assert version.current() == first
+        clock.now = 6
+        assert version.current() != first
+        version.close()
+        writer.close()
+
+    def test_missing_database(self, tmp_path):
+        version = DatasetVersion(str(tmp_path / "missing.db"), check_interval=0)
+        assert version.current() == "unavailable"
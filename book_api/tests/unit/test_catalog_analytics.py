@@ -0,0 +1,233 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from book_api.config.dependencies import get_book_service
+from book_api.domain.entities.book import Book
+from book_api.domain.entities.genre import Genre
+from book_api.domain.exceptions import GenreNotFoundError
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.infrastructure.database.models import BookModel
+from book_api.interface.api.book_router import router
+from book_api.use_cases.services.book_service import BookService
+from book_api.use_cases.services.book_statistics import (
+    genre_summary,
+    histogram,
+    matches_filters,
+    percentiles,
+    price_summary,
+    stock_summary
+)
+
+np = pytest.importorskip("numpy")
+
+from book_api.infrastructure.analytics.catalog_snapshot import CatalogSnapshot, CatalogSnapshotProvider  # noqa: E402
+from book_api.infrastructure.analytics.numpy_catalog_analytics import NumpyCatalogAnalytics  # noqa: E402
+
+BOOKS = [
+    dict(id=1, title="A", genre_id=1, note=5, stock_number=3, price_ht=10.0, price_taxed=12.0, review_number=0),
+    dict(id=2, title="B", genre_id=1, note=2, stock_number=0, price_ht=20.0, price_taxed=24.0, review_number=4),
+    dict(id=3, title="C", genre_id=2, note=4, stock_number=None, price_ht=None, price_taxed=None, review_number=1),
+    dict(id=4, title="D", genre_id=2, note=3, stock_number=7, price_ht=30.0, price_taxed=36.5, review_number=None),
+    dict(id=5, title="E", genre_id=1, note=None, stock_number=12, price_ht=5.0, price_taxed=6.0, review_number=2),
+]
+
+
+def as_entity(row):
+    prices = {key: Decimal(str(row[key])) if row[key] is not None else None for key in ("price_ht", "price_taxed")}
+    return Book(**{**row, **prices})
+
+
+@pytest.fixture
+def analytics(db_session):
+    db_session.add_all([BookModel(**row) for row in BOOKS])
+    db_session.commit()
+    provider = CatalogSnapshotProvider(lambda: db_session, lambda: "v1")
+    return NumpyCatalogAnalytics(provider)
+
+
+class TestCatalogSnapshot:
+    def test_columns_are_read_only_arrays_with_nan_for_missing(self, db_session):
+        db_session.add_all([BookModel(**row) for row in BOOKS])
+        db_session.commit()
+
+        snapshot = CatalogSnapshot.load(db_session, "v1")
+
+        assert len(snapshot) == 5
+        assert snapshot.ids.tolist() == [1, 2, 3, 4, 5]
+        assert np.isnan(snapshot.price_taxed[2])
+        assert snapshot.genre_rows[1].tolist() == [0, 1, 4]
+        with pytest.raises(ValueError):
+            snapshot.price_taxed[0] = 1.0
+
+    def test_empty_catalog(self, db_session):
+        snapshot = CatalogSnapshot.load(db_session, "v1")
+
+        assert len(snapshot) == 0
+        assert snapshot.column("price_taxed", genre_id=1).size == 0
+
+    def test_provider_reloads_only_when_version_changes(self):
+        version = Mock(return_value="v1")
+        factory = Mock()
+        factory.return_value.query.return_value.order_by.return_value.all.return_value = []
+        provider = CatalogSnapshotProvider(factory, version)
+
+        first = provider.current()
+        assert provider.current() is first
+        version.return_value = "v2"
+        second = provider.current()
+
+        assert second is not first
+        assert second.version == "v2"
+        assert factory.call_count == 2
+
+
+class TestNumpyCatalogAnalytics:
+    """The vectorised backend must give the same answers as the per-book functions."""
+
+    @pytest.mark.parametrize("genre_id", [None, 1, 2, 99])
+    def test_summaries_match_python(self, analytics, genre_id):
+        books = [as_entity(row) for row in BOOKS if genre_id is None or row["genre_id"] == genre_id]
+
+        assert analytics.price_summary(genre_id) == price_summary(books)
+        assert analytics.stock_summary(genre_id) == stock_summary(books)
+
+    @pytest.mark.parametrize("column", ["price_taxed", "note", "stock_number", "review_number"])
+    def test_histogram_matches_python(self, analytics, column):
+        values = [float(row[column]) for row in BOOKS if row[column] is not None]
+
+        result = analytics.histogram(column, bins=4)
+
+        assert result["counts"] == histogram(values, 4)["counts"]
+        assert result["edges"] == pytest.approx(histogram(values, 4)["edges"])
+
+    @pytest.mark.parametrize("column", ["price_taxed", "note", "stock_number", "review_number"])
+    def test_percentiles_match_python(self, analytics, column):
+        values = [float(row[column]) for row in BOOKS if row[column] is not None]
+
+        result = analytics.percentiles(column, [0, 10, 50, 95, 100])
+        expected = percentiles(values, [0, 10, 50, 95, 100])
+
+        assert result["count"] == expected["count"]
+        assert result["values"] == pytest.approx(expected["values"])
+
+    def test_genre_summary_matches_python(self, analytics):
+        assert analytics.genre_summary() == genre_summary([as_entity(row) for row in BOOKS])
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"genre_id": 1},
+        {"min_price": 10, "max_price": 30},
+        {"min_rating": 3},
+        {"in_stock": True},
+        {"in_stock": False, "genre_id": 2},
+        {"min_reviews": 1},
+        {"min_reviews": 2, "genre_id": 1},
+    ])
+    def test_count_matches_python(self, analytics, filters):
+        criteria = BookCriteria(**filters)
+        expected = sum(1 for row in BOOKS if matches_filters(as_entity(row), criteria))
+
+        assert analytics.count(criteria) == expected
+
+    def test_unknown_column_is_rejected(self, analytics):
+        with pytest.raises(ValueError):
+            analytics.histogram("title")
+
+
+class TestBookServiceWithAnalytics:
+    def setup_method(self):
+        self.mock_book_repo = Mock()
+        self.mock_genre_repo = Mock()
+        self.mock_analytics = Mock()
+        self.service = BookService(self.mock_book_repo, self.mock_genre_repo, self.mock_analytics)
+
+    def test_averages_do_not_load_books(self):
+        self.mock_analytics.price_summary.return_value = {
+            "total_books": 2, "books_with_price": 2, "average_price": 15.0, "sample_prices": [10.0, 20.0]
+        }
+
+        result = self.service.calculate_average_price_all()
+
+        assert result == {"total_books": 2, "books_with_price": 2, "average_price": 15.0}
+        self.mock_book_repo.get_all.assert_not_called()
+
+    def test_genre_is_still_checked(self):
+        self.mock_genre_repo.get_by_id.return_value = None
+
+        with pytest.raises(GenreNotFoundError, match="Genre not found"):
+            self.service.calculate_average_stock_by_genre(999)
+
+        self.mock_analytics.stock_summary.assert_not_called()
+
+    def test_histogram_and_count_are_delegated(self):
+        self.mock_genre_repo.get_by_id.return_value = Genre(id=1, name="Fiction")
+        self.mock_analytics.histogram.return_value = {"edges": [0.0, 1.0], "counts": [3]}
+        self.mock_analytics.count.return_value = 3
+
+        assert self.service.calculate_histogram("note", 1, 1)["counts"] == [3]
+        assert self.service.count_books(BookCriteria(min_rating=4)) == 3
+        self.mock_analytics.count.assert_called_once_with(BookCriteria(min_rating=4))
+
+    def test_percentiles_are_labelled_by_percent(self):
+        self.mock_analytics.percentiles.return_value = {"count": 4, "values": [2.0, 4.5]}
+
+        result = self.service.calculate_percentiles("note", (50, 99.5))
+
+        assert result == {"column": "note", "genre_id": None, "count": 4, "percentiles": {"p50": 2.0, "p99.5": 4.5}}
+
+    def test_percentiles_out_of_range_are_rejected(self):
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            self.service.calculate_percentiles("note", (50, 101))
+
+        self.mock_analytics.percentiles.assert_not_called()
+
+    def test_genre_summary_adds_genre_names(self):
+        self.mock_genre_repo.get_all.return_value = [Genre(id=1, name="Fiction")]
+        self.mock_analytics.genre_summary.return_value = [
+            {"genre_id": 1, "total_books": 2}, {"genre_id": 2, "total_books": 1}
+        ]
+
+        result = self.service.calculate_genre_summary()
+
+        assert [summary["genre_name"] for summary in result] == ["Fiction", None]
+        self.mock_book_repo.get_all.assert_not_called()
+
+
+class TestAnalyticsRoutes:
+    def setup_method(self):
+        self.mock_genre_repo = Mock()
+        self.mock_genre_repo.get_by_id.side_effect = lambda genre_id: {1: Genre(id=1, name="Fiction")}.get(genre_id)
+        self.mock_analytics = Mock()
+        service = BookService(Mock(), self.mock_genre_repo, self.mock_analytics)
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_book_service] = lambda: service
+        self.client = TestClient(app)
+
+    @pytest.mark.parametrize("path", ["/books/histogram/note?genre_id=999", "/books/percentiles/note?genre_id=999"])
+    def test_unknown_genre_is_not_found(self, path):
+        response = self.client.get(path)
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Genre not found"
+
+    def test_invalid_parameters_are_unprocessable(self):
+        self.mock_analytics.histogram.side_effect = ValueError("Unknown column: note")
+        self.mock_analytics.percentiles.side_effect = ValueError("Unknown column: note")
+
+        for path in ("/books/histogram/note?genre_id=1", "/books/percentiles/note", "/books/percentiles/note?p=101"):
+            response = self.client.get(path)
+            assert response.status_code == 422, path
+
+    def test_count_uses_the_query_criteria(self):
+        self.mock_analytics.count.return_value = 2
+
+        response = self.client.get("/books/count?genre_id=1&min_reviews=3")
+
+        assert response.json() == {"count": 2}
+        self.mock_analytics.count.assert_called_once_with(BookCriteria(genre_id=1, min_reviews=3))
+        assert self.client.get("/books/count?min_price=50&max_price=10").status_code == 400
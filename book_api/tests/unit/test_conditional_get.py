@@ -0,0 +1,75 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from book_api.interface.middleware.conditional_get import ConditionalGetMiddleware
+
+
+class TestConditionalGetMiddleware:
+    def setup_method(self):
+        self.version = "v1"
+        self.calls = 0
+
+        app = FastAPI()
+        app.add_middleware(ConditionalGetMiddleware, version=lambda: self.version, max_age=30)
+
+        @app.get("/books")
+        def list_books(limit: int = 10):
+            self.calls += 1
+            return [{"id": 1}]
+
+        @app.get("/health")
+        def health():
+            return {"status": "healthy"}
+
+        self.client = TestClient(app)
+
+    def test_etag_and_cache_control_are_set(self):
+        response = self.client.get("/books")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "public, max-age=30, must-revalidate"
+
+    def test_matching_etag_returns_304_without_calling_route(self):
+        etag = self.client.get("/books").headers["etag"]
+
+        response = self.client.get("/books", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert self.calls == 1
+
+    def test_etag_depends_on_query_parameters(self):
+        first = self.client.get("/books?limit=5").headers["etag"]
+        second = self.client.get("/books?limit=6").headers["etag"]
+
+        assert first != second
+
+    def test_new_dataset_version_changes_etag(self):
+        etag = self.client.get("/books").headers["etag"]
+        self.version = "v2"
+
+        response = self.client.get("/books", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_etag_list_and_weak_comparison(self):
+        etag = self.client.get("/books").headers["etag"]
+        strong = etag.removeprefix("W/")
+
+        response = self.client.get("/books", headers={"If-None-Match": f'"other", {strong}'})
+
+        assert response.status_code == 304
+
+    def test_other_paths_are_untouched(self):
+        response = self.client.get("/health")
+
+        assert "etag" not in response.headers
+
+    def test_unavailable_version_disables_etag(self):
+        self.version = "unavailable"
+
+        response = self.client.get("/books")
+
+        assert "etag" not in response.headers
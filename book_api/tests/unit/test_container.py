@@ -0,0 +1,88 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from book_api.config.container import Container
+from book_api.config.settings import Settings
+from book_api.infrastructure.database.request_session import (
+    RequestSessionProxy,
+    RequestSessionHolder,
+    request_session_scope
+)
+
+
+class TestRequestSession:
+    def test_session_is_opened_lazily_and_shared(self):
+        factory = Mock()
+        proxy = RequestSessionProxy()
+
+        with request_session_scope(factory) as holder:
+            assert not holder.opened
+            proxy.query("a")
+            proxy.query("b")
+
+        factory.assert_called_once()
+        factory.return_value.close.assert_called_once()
+
+    def test_unused_scope_never_opens_a_session(self):
+        factory = Mock()
+
+        with request_session_scope(factory):
+            pass
+
+        factory.assert_not_called()
+
+    def test_proxy_outside_scope_fails_loudly(self):
+        with pytest.raises(RuntimeError, match="outside of a request scope"):
+            RequestSessionProxy().query("a")
+
+    def test_holder_close_is_idempotent(self):
+        holder = RequestSessionHolder(Mock())
+        holder.get()
+        holder.close()
+        holder.close()
+
+        assert not holder.opened
+
+
+class TestContainer:
+    def test_services_are_built_once(self, tmp_path):
+        container = Container(Settings(), session_factory=Mock(), database_path=str(tmp_path / "books.db"))
+
+        assert container.book_service is container.book_service
+        assert container.book_repository.db is container.db
+
+    def test_one_session_per_request_across_repositories(self, tmp_path):
+        sessions = []
+
+        def factory():
+            session = Mock()
+            sessions.append(session)
+            return session
+
+        container = Container(Settings(), session_factory=factory, database_path=str(tmp_path / "books.db"))
+        app = FastAPI()
+
+        async def scope():
+            with request_session_scope(container.session_factory) as holder:
+                yield holder
+
+        @app.get("/both")
+        def both(_=Depends(scope)):
+            container.book_repository.db.query("books")
+            container.db.query("genres")
+            return None
+
+        @app.get("/none")
+        def none(_=Depends(scope)):
+            return None
+
+        client = TestClient(app)
+        client.get("/both")
+        client.get("/none")
+        client.get("/both")
+
+        assert len(sessions) == 2
+        assert all(session.close.called for session in sessions)
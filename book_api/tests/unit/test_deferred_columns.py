@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import event
+
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.repositories.book_repository import BookRepository
+
+
+@pytest.fixture
+def repository(db_session):
+    db_session.add_all([
+        BookModel(id=i, title=f"Book {i}", genre_id=1, note=3, description=f"Long description {i} " * 50)
+        for i in range(1, 6)
+    ])
+    db_session.commit()
+    db_session.expunge_all()  # Start from an empty identity map, like a new request
+    return BookRepository(db_session)
+
+
+@pytest.fixture
+def statements(db_session):
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    yield sent
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+class TestDeferredDescription:
+    def test_lists_do_not_select_description(self, repository, statements):
+        books = repository.get_all()
+
+        assert len(books) == 5
+        assert all(book.description is None for book in books)
+        assert len(statements) == 1  # No lazy load per row
+        assert "description" not in statements[0]
+
+    def test_detail_loads_full_record(self, repository, statements):
+        book = repository.get_by_id(3)
+
+        assert book.description.startswith("Long description 3")
+        assert len(statements) == 1
+
+    def test_export_stream_loads_full_record(self, repository):
+        assert all(book.description for book in repository.iter_all(batch_size=2))
@@ -1,7 +1,9 @@
 import pytest
 from decimal import Decimal
+from types import SimpleNamespace
 
 from book_api.domain.entities.book import Book
+from book_api.infrastructure.repositories.book_repository import BookRepository
 from book_api.domain.entities.genre import Genre
 
 
@@ -83,6 +85,39 @@ class TestBookEntity:
         assert book.get_formatted_title() == "Test Book"
 
 
+class TestTrustedBook:
+    """Test class for the validation-free construction path."""
+
+    def test_from_trusted_equals_validated_book(self):
+        fields = dict(id=1, title="Test", genre_id=2, note=3, stock_number=4, price_taxed=Decimal("5.50"))
+
+        assert Book.from_trusted(**fields) == Book(**fields)
+
+    def test_from_trusted_skips_validation(self):
+        """Trusted reads are not re-validated, external input still is."""
+        book = Book.from_trusted(id=1, title="Test", genre_id=1, note=9)
+
+        assert book.note == 9
+        with pytest.raises(ValueError):
+            Book(id=1, title="Test", genre_id=1, note=9)
+
+    def test_book_is_slotted(self):
+        book = Book.from_trusted(id=1, title="Test", genre_id=1)
+
+        assert not hasattr(book, "__dict__")
+        with pytest.raises(AttributeError):
+            book.unknown = 1
+
+    def test_repository_prices_are_memoised(self):
+        row = dict(id=1, title="T", genre_id=1, note=None, stock_number=None, datetime=None, upc=None,
+                   product_type=None, price_ht=41.25, price_taxed=49.5, review_number=None, description=None)
+        first = BookRepository._convert_to_entity(SimpleNamespace(**row))
+        second = BookRepository._convert_to_entity(SimpleNamespace(**row))
+
+        assert first.price_taxed == Decimal("49.5")
+        assert first.price_taxed is second.price_taxed
+
+
 class TestGenreEntity:
     """Test class for Genre domain entity."""
 
@@ -0,0 +1,202 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.infrastructure.database.connection import Base
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.use_cases.services.book_statistics import (
+    genre_summary,
+    histogram,
+    matches_filters,
+    percentiles,
+    price_summary,
+    stock_summary
+)
+
+pytest.importorskip("duckdb")
+pytest.importorskip("numpy")
+
+from book_api.infrastructure.analytics.duckdb_catalog import DuckDBCatalog  # noqa: E402
+from book_api.infrastructure.analytics.duckdb_catalog_analytics import DuckDBCatalogAnalytics  # noqa: E402
+from book_api.infrastructure.repositories.duckdb_book_repository import DuckDBBookRepository  # noqa: E402
+
+BOOKS = [
+    dict(id=1, title="The Secret", genre_id=1, note=5, stock_number=3, price_ht=10.0, price_taxed=12.0,
+         review_number=0, upc="u1"),
+    dict(id=2, title="B", genre_id=1, note=2, stock_number=0, price_ht=20.0, price_taxed=24.0, review_number=4,
+         upc="u2"),
+    dict(id=3, title="secret garden", genre_id=2, note=4, stock_number=None, price_ht=None, price_taxed=None,
+         review_number=1, upc=None),
+    dict(id=4, title="D", genre_id=2, note=3, stock_number=7, price_ht=30.0, price_taxed=36.5, review_number=None,
+         upc="u4"),
+    dict(id=5, title="E", genre_id=1, note=None, stock_number=12, price_ht=5.0, price_taxed=6.0, review_number=2,
+         upc="u5"),
+    dict(id=6, title=None, genre_id=None, note=1, stock_number=1, price_ht=8.0, price_taxed=9.6, review_number=3,
+         upc="u6"),
+]
+
+
+def as_entity(row):
+    prices = {key: Decimal(str(row[key])) if row[key] is not None else None for key in ("price_ht", "price_taxed")}
+    return Book(**{**row, **prices})
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / "books.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add_all([BookModel(**row) for row in BOOKS])
+        session.commit()
+    yield path, factory
+    engine.dispose()
+
+
+@pytest.fixture
+def catalog(database):
+    return DuckDBCatalog("sqlite", database[0], lambda: "v1")
+
+
+class TestDuckDBCatalog:
+    def test_copy_keeps_nulls_and_types(self, catalog):
+        rows = catalog.fetchall("SELECT id, title, upc, stock_number, price_taxed FROM books ORDER BY id")
+
+        assert len(rows) == len(BOOKS)
+        assert rows[2] == (3, "secret garden", None, None, None)
+        assert rows[5][1] is None
+        assert isinstance(rows[0][3], int)
+
+    def test_reloads_when_dataset_version_changes(self, database):
+        path, factory = database
+        version = Mock(return_value="v1")
+        catalog = DuckDBCatalog("sqlite", path, version)
+        assert catalog.fetchall("SELECT count(*) FROM books") == [(6,)]
+
+        with factory() as session:
+            session.add(BookModel(id=7, title="G", genre_id=2, price_taxed=1.0))
+            session.commit()
+        assert catalog.fetchall("SELECT count(*) FROM books") == [(6,)]
+        version.return_value = "v2"
+
+        assert catalog.fetchall("SELECT count(*) FROM books") == [(7,)]
+
+    def test_parquet_export_is_a_source(self, catalog, database, tmp_path):
+        catalog.export_parquet(str(tmp_path / "books.parquet"))
+
+        parquet = DuckDBCatalog(str(tmp_path / "*.parquet"), database[0], Mock(side_effect=AssertionError))
+
+        assert parquet.fetchall("SELECT count(*), sum(price_taxed) FROM books") == \
+            catalog.fetchall("SELECT count(*), sum(price_taxed) FROM books")
+
+
+class TestDuckDBCatalogAnalytics:
+    """The DuckDB backend must give the same answers as the per-book functions."""
+
+    @pytest.fixture
+    def analytics(self, catalog):
+        return DuckDBCatalogAnalytics(catalog)
+
+    @pytest.mark.parametrize("genre_id", [None, 1, 2, 99])
+    def test_summaries_match_python(self, analytics, genre_id):
+        books = [as_entity(row) for row in BOOKS if genre_id is None or row["genre_id"] == genre_id]
+
+        assert analytics.price_summary(genre_id) == price_summary(books)
+        assert analytics.stock_summary(genre_id) == stock_summary(books)
+
+    @pytest.mark.parametrize("column", ["price_taxed", "note", "stock_number", "review_number"])
+    def test_histogram_and_percentiles_match_python(self, analytics, column):
+        values = [float(row[column]) for row in BOOKS if row[column] is not None]
+
+        result = analytics.histogram(column, bins=4)
+        assert result["counts"] == histogram(values, 4)["counts"]
+        assert result["edges"] == pytest.approx(histogram(values, 4)["edges"])
+
+        result = analytics.percentiles(column, [0, 25, 50, 99, 100])
+        expected = percentiles(values, [0, 25, 50, 99, 100])
+        assert result["count"] == expected["count"]
+        assert result["values"] == pytest.approx(expected["values"])
+
+    def test_percentiles_of_an_empty_genre(self, analytics):
+        assert analytics.percentiles("note", [50], genre_id=99) == {"count": 0, "values": [None]}
+
+    def test_genre_summary_matches_python(self, analytics):
+        assert analytics.genre_summary() == genre_summary([as_entity(row) for row in BOOKS])
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"genre_id": 1},
+        {"min_price": 10, "max_price": 30},
+        {"min_rating": 3},
+        {"in_stock": True},
+        {"in_stock": False, "genre_id": 2},
+        {"min_reviews": 1},
+        {"min_reviews": 2, "genre_id": 1},
+    ])
+    def test_count_matches_python(self, analytics, filters):
+        criteria = BookCriteria(**filters)
+        expected = sum(1 for row in BOOKS if matches_filters(as_entity(row), criteria))
+
+        assert analytics.count(criteria) == expected
+
+    def test_unknown_column_is_rejected(self, analytics):
+        with pytest.raises(ValueError):
+            analytics.percentiles("title; DROP TABLE books", [50])
+
+
+class TestDuckDBBookRepository:
+    """Lists must match the SQLite repository, lookups by key must go to it."""
+
+    @pytest.fixture
+    def repositories(self, catalog, database):
+        session = database[1]()
+        sqlite = BookRepository(session)
+        yield DuckDBBookRepository(catalog, point_lookups=sqlite), sqlite
+        session.close()
+
+    @pytest.mark.parametrize("call, ordered", [
+        (lambda repo: repo.get_all(), False),
+        (lambda repo: repo.get_all(BookSort.parse("-price"), 3), True),
+        (lambda repo: repo.get_all(BookSort.parse("rating")), True),
+        (lambda repo: repo.get_by_keyword("secret"), False),
+        (lambda repo: repo.get_by_genre_id(1, BookSort.parse("stock")), True),
+        (lambda repo: repo.get_by_criteria(BookCriteria(min_price=10, min_rating=2)), False),
+        (lambda repo: repo.get_by_criteria(BookCriteria(genre_id=2, in_stock=False)), False),
+        (lambda repo: repo.get_by_criteria(BookCriteria(min_reviews=2), BookSort.parse("-reviews"), 2), True),
+        (lambda repo: repo.get_books_with_valid_prices(), False),
+    ])
+    def test_lists_match_sqlite(self, repositories, call, ordered):
+        duckdb_repository, sqlite_repository = repositories
+        expected = call(sqlite_repository)
+        if not ordered:
+            # Unsorted SQLite queries come back in whatever order the plan walks; DuckDB's are by ID
+            expected = sorted(expected, key=lambda book: book.id)
+
+        assert [book.__getstate__() for book in call(duckdb_repository)] == \
+            [book.__getstate__() for book in expected]
+
+    def test_lookups_by_key_stay_on_sqlite(self, catalog):
+        point_lookups = Mock()
+        repository = DuckDBBookRepository(catalog, point_lookups=point_lookups)
+
+        repository.get_by_id(1)
+        repository.get_by_ids([1, 2])
+        repository.get_by_upcs(["u1"])
+        repository.get_by_upc("u1")
+        repository.get_by_upc_prefix("u", 5)
+        repository.iter_all(100)
+
+        point_lookups.get_by_id.assert_called_once_with(1)
+        point_lookups.get_by_ids.assert_called_once_with([1, 2])
+        point_lookups.get_by_upcs.assert_called_once_with(["u1"])
+        point_lookups.get_by_upc.assert_called_once_with("u1")
+        point_lookups.get_by_upc_prefix.assert_called_once_with("u", 5)
+        point_lookups.iter_all.assert_called_once_with(100)
@@ -0,0 +1,61 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+
+from book_api.infrastructure.cache.genre_registry import GenreRegistry
+from book_api.infrastructure.database.models import GenreModel
+
+
+@pytest.fixture
+def statements(db_session):
+    """Statements sent to the database while the test runs."""
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    yield sent
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.fixture
+def registry(db_session):
+    db_session.add_all([GenreModel(id=2, genre="  poetry "), GenreModel(id=1, genre="Travel")])
+    db_session.commit()
+    version = Mock(return_value="v1")
+    registry = GenreRegistry(lambda: db_session, version)
+    registry.version = version  # Let tests move the version
+    return registry
+
+
+class TestGenreRegistry:
+    def test_lookups_after_load_do_no_io(self, registry, statements):
+        registry.load()
+        loaded = len(statements)
+
+        assert [genre.id for genre in registry.get_all()] == [1, 2]
+        assert registry.get_by_id(2).name == "Poetry"  # Normalised once, at load
+        assert registry.get_by_id(99) is None
+        assert registry.get_by_name("Travel").id == 1
+        assert len(statements) == loaded
+
+    def test_get_by_name_matches_stored_name(self, registry):
+        assert registry.get_by_name("  poetry ").id == 2
+        assert registry.get_by_name("Unknown") is None
+
+    def test_reloads_when_dataset_version_changes(self, registry, db_session):
+        registry.load()
+        db_session.add(GenreModel(id=3, genre="Fantasy"))
+        db_session.commit()
+
+        assert registry.get_by_id(3) is None
+        registry.version.return_value = "v2"
+        assert registry.get_by_id(3).name == "Fantasy"
+
+    def test_get_all_returns_a_copy(self, registry):
+        registry.get_all().clear()
+
+        assert len(registry.get_all()) == 2
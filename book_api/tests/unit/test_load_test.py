@@ -0,0 +1,59 @@
+import asyncio
+from collections import Counter
+
+import httpx
+from fastapi import FastAPI
+
+from book_api.benchmarks.load_test import MIX, percentile, run, summarize, uncovered_routes
+
+
+def stub_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/books")
+    def books():
+        return [{"id": i, "upc": f"upc{i}"} for i in range(1, 11)]
+
+    @app.get("/genres")
+    def genres():
+        return [{"id": 1, "name": "Fiction"}, {"id": 2, "name": "Poetry"}]
+
+    @app.api_route("/{path:path}", methods=["GET", "POST"])
+    def anything(path: str):
+        return {}
+
+    return app
+
+
+class TestLoadTest:
+    def test_percentile_is_nearest_rank(self):
+        ordered = [float(value) for value in range(1, 101)]
+
+        assert percentile(ordered, 0.50) == 50
+        assert percentile(ordered, 0.95) == 95
+        assert percentile(ordered, 0.99) == 99
+        assert percentile([7.0], 0.99) == 7
+        assert percentile([], 0.5) == 0.0
+
+    def test_summary_reports_milliseconds_and_errors(self):
+        summary = summarize({"GET /genres": [0.001, 0.002, 0.010]}, Counter({"GET /genres": 1}), 2.0)
+
+        route = summary["routes"]["GET /genres"]
+        assert summary["requests"] == 3 and summary["errors"] == 1
+        assert summary["throughput_rps"] == 1.5
+        assert route["p50_ms"] == 2.0 and route["max_ms"] == 10.0
+
+    def test_mix_covers_every_route(self):
+        assert uncovered_routes() == []
+
+    def test_run_sends_the_requested_number_of_requests(self):
+        async def go():
+            transport = httpx.ASGITransport(app=stub_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await run(client, MIX, concurrency=4, requests=200, duration=None, seed=1)
+
+        results = asyncio.run(go())
+
+        assert results["requests"] == 200
+        assert results["errors"] == 0
+        assert set(results["routes"]) <= {route.name for route in MIX}
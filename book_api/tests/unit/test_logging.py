@@ -0,0 +1,144 @@
+import logging
+import threading
+from logging.handlers import QueueListener
+
+import pytest
+
+from book_api.config.logging import (
+    NonBlockingQueueHandler,
+    RateLimitFilter,
+    SamplingFilter,
+    parse_logger_values,
+    setup_logging,
+    stop_logging
+)
+
+
+class RecordingHandler(logging.Handler):
+    """Keeps the formatted messages and the thread that formatted them."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+def make_record(name="book_api.use_cases.services.book_service", level=logging.INFO, args=(1,)):
+    return logging.LogRecord(name, level, __file__, 1, "Getting book ID: %s", args, None)
+
+
+class FormattedBy:
+    """Argument remembering which thread turned it into text."""
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread().name)
+        return "42"
+
+
+class TestNonBlockingQueueHandler:
+    def test_messages_are_formatted_by_the_listener(self):
+        handler = NonBlockingQueueHandler()
+        target = RecordingHandler()
+        listener = QueueListener(handler.queue, target)
+        listener.start()
+
+        argument = FormattedBy()
+        handler.handle(make_record(args=(argument,)))
+        assert argument.threads == []
+        listener.stop()
+
+        assert target.messages == ["Getting book ID: 42"]
+        assert argument.threads == list(target.threads)
+        assert threading.current_thread().name not in target.threads
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = NonBlockingQueueHandler(capacity=2)
+
+        for book_id in range(5):
+            handler.handle(make_record(args=(book_id,)))
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+
+class TestSamplingFilter:
+    def test_keeps_one_in_every_below_warning(self):
+        sampling = SamplingFilter("book_api.use_cases", every=10)
+
+        kept = [sampling.filter(make_record()) for _ in range(100)]
+
+        assert sum(kept) == 10
+        assert sampling.dropped == 90
+
+    def test_warnings_and_other_loggers_always_pass(self):
+        sampling = SamplingFilter("book_api.use_cases", every=1000)
+        sampling.filter(make_record())
+
+        assert all(sampling.filter(make_record(level=logging.WARNING)) for _ in range(10))
+        assert all(sampling.filter(make_record(name="book_api.interface.api.book_router")) for _ in range(10))
+        assert all(sampling.filter(make_record(name="book_api.use_cases_other")) for _ in range(10))
+
+
+class TestRateLimitFilter:
+    def test_allows_per_second_and_refills(self):
+        now = [0.0]
+        limit = RateLimitFilter("book_api", per_second=5, clock=lambda: now[0])
+
+        assert sum(limit.filter(make_record()) for _ in range(20)) == 5
+        now[0] += 0.4
+        assert sum(limit.filter(make_record()) for _ in range(20)) == 2
+        assert limit.filter(make_record(level=logging.ERROR))
+        assert limit.dropped == 33
+
+
+class TestSetupLogging:
+    @pytest.fixture
+    def bare_root(self):
+        """Root logger as in a fresh process, restored afterwards."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield root
+        stop_logging()
+        root.handlers = handlers
+        root.setLevel(level)
+
+    def test_installs_one_queue_handler_with_filters(self, bare_root):
+        bare_root.handlers = []  # pytest's capture handlers are added just before the test runs
+        setup_logging(sample_rates={"book_api.use_cases": 0.1}, rate_limits={"book_api.interface": 50})
+        setup_logging(sample_rates={"book_api.use_cases": 0.1}, rate_limits={"book_api.interface": 50})
+
+        [handler] = bare_root.handlers
+        assert isinstance(handler, NonBlockingQueueHandler)
+        assert [type(f) for f in handler.filters] == [SamplingFilter, RateLimitFilter]
+        assert handler.filters[0].every == 10
+
+    def test_leaves_foreign_handlers_alone(self, bare_root):
+        foreign = RecordingHandler()
+        bare_root.handlers = [foreign]
+
+        setup_logging(sample_rates={"book_api.use_cases": 0.5})
+
+        assert bare_root.handlers == [foreign]
+        # Settings still apply: the filters go on the handlers already there
+        for book_id in range(4):
+            logging.getLogger("book_api.use_cases.services.book_service").info("Getting book ID: %s", book_id)
+        assert foreign.messages == ["Getting book ID: 0", "Getting book ID: 2"]
+
+        stop_logging()
+        assert foreign.filters == []
+
+    def test_parse_logger_values(self):
+        assert parse_logger_values("book_api.use_cases=0.01, book_api.interface.api=50,") == {
+            "book_api.use_cases": 0.01,
+            "book_api.interface.api": 50.0,
+        }
+        assert parse_logger_values("") == {}
+        with pytest.raises(ValueError):
+            parse_logger_values("book_api.use_cases")
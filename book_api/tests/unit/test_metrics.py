@@ -0,0 +1,119 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from book_api.infrastructure.monitoring.metrics import MetricsRegistry
+from book_api.infrastructure.monitoring.query_stats import QueryStats, install_query_listeners, track_queries
+from book_api.interface.middleware.conditional_get import ConditionalGetMiddleware
+from book_api.interface.middleware.metrics import MetricsMiddleware
+
+
+def sample(text_output: str, name: str) -> float:
+    """Value of the one sample line starting with name."""
+    return float(next(line for line in text_output.splitlines() if line.startswith(name)).rsplit(" ", 1)[1])
+
+
+class TestQueryStats:
+    def test_statements_are_attributed_to_the_current_scope_only(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        install_query_listeners(engine)
+        install_query_listeners(engine)  # Idempotent
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with track_queries() as stats:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            connection.execute(text("SELECT 3"))
+
+        assert stats.count == 2
+        assert stats.seconds > 0
+
+
+class TestMetricsRegistry:
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        queries = QueryStats()
+        for duration in (0.0005, 0.003, 0.2):
+            registry.observe_request("GET", "/books", 200, duration, 100, queries)
+
+        output = registry.render()
+
+        prefix = 'bookscrape_http_request_duration_seconds_bucket{method="GET",route="/books",'
+        assert sample(output, prefix + 'le="0.001"}') == 1
+        assert sample(output, prefix + 'le="0.005"}') == 2
+        assert sample(output, prefix + 'le="0.25"}') == 3
+        assert sample(output, prefix + 'le="+Inf"}') == 3
+        assert sample(output, 'bookscrape_http_requests_total{method="GET",route="/books",status="200"}') == 3
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.observe_request("GET", 'a"b\\c', 200, 0.1, 0, QueryStats())
+
+        assert 'route="a\\"b\\\\c"' in registry.render()
+
+
+class TestMetricsMiddleware:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        install_query_listeners(self.engine)
+        self.registry = MetricsRegistry()
+
+        app = FastAPI()
+        app.add_middleware(ConditionalGetMiddleware, version=lambda: "v1")
+        app.add_middleware(MetricsMiddleware, registry=self.registry)
+
+        @app.get("/books/export.ndjson")
+        def export():
+            return StreamingResponse(iter([b"a" * 1000, b"b" * 500]))
+
+        @app.get("/books/{book_id}")
+        def get_book(book_id: int):
+            with self.engine.connect() as connection:
+                for _ in range(3):
+                    connection.execute(text("SELECT 1"))
+            return {"id": book_id}
+
+        @app.get("/metrics")
+        def metrics():
+            return "ignored"
+
+        self.client = TestClient(app)
+
+    def test_route_template_status_and_sql_are_recorded(self):
+        self.client.get("/books/1")
+        self.client.get("/books/2")
+
+        output = self.registry.render()
+
+        labels = '{method="GET",route="/books/{book_id}"}'
+        assert sample(output, 'bookscrape_http_requests_total{method="GET",route="/books/{book_id}",status="200"}') == 2
+        assert sample(output, f"bookscrape_db_queries_per_request_sum{labels}") == 6
+        assert sample(output, f"bookscrape_db_time_per_request_seconds_sum{labels}") > 0
+        assert "/books/1" not in output
+
+    def test_streamed_response_size_is_counted(self):
+        self.client.get("/books/export.ndjson")
+
+        output = self.registry.render()
+
+        assert sample(output, 'bookscrape_http_response_size_bytes_sum{method="GET",route="/books/export.ndjson"}') == 1500
+
+    def test_not_modified_is_labelled_with_the_route(self):
+        etag = self.client.get("/books/1").headers["etag"]
+        self.client.get("/books/1", headers={"If-None-Match": etag})
+
+        output = self.registry.render()
+
+        assert sample(output, 'bookscrape_http_requests_total{method="GET",route="/books/{book_id}",status="304"}') == 1
+
+    def test_unknown_paths_and_metrics_endpoint(self):
+        self.client.get("/nothing/here")
+        self.client.get("/metrics")
+
+        output = self.registry.render()
+
+        assert sample(output, 'bookscrape_http_requests_total{method="GET",route="unmatched",status="404"}') == 1
+        assert 'route="/metrics"' not in output
@@ -0,0 +1,102 @@
+import asyncio
+import queue
+import time
+from logging.handlers import QueueListener
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from book_api.infrastructure.monitoring.stack_sampler import StackSampler, render_collapsed
+from book_api.interface.middleware import profiling
+from book_api.interface.middleware.profiling import ProfilingMiddleware
+
+
+def busy_loop(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def profiled_app(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, secret="s3cret", **options)
+
+    @app.get("/books")
+    def books():
+        busy_loop(0.05)
+        return [{"id": 1}]
+
+    return TestClient(app)
+
+
+class TestStackSampler:
+    def test_busy_function_shows_up_in_collapsed_stacks(self):
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        busy_loop(0.05)
+        stacks = sampler.stop()
+
+        output = render_collapsed(stacks)
+        assert sampler.samples > 0
+        assert "busy_loop (test_profiling.py:" in output
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in output.splitlines())
+
+    def test_waiting_log_listener_is_idle(self):
+        listener = QueueListener(queue.SimpleQueue())
+        listener.start()
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        busy_loop(0.02)
+        stacks = sampler.stop()
+        listener.stop()
+
+        assert "_monitor" not in render_collapsed(stacks)
+
+
+class TestProfilingMiddleware:
+    def test_requests_without_the_secret_are_untouched(self):
+        client = profiled_app()
+
+        for headers in ({}, {"X-Profile-Token": "guess"}):
+            response = client.get("/books", headers=headers)
+            assert response.json() == [{"id": 1}]
+            assert "x-profile-samples" not in response.headers
+
+    def test_profile_is_returned_in_place_of_the_body(self):
+        response = profiled_app().get("/books", headers={"X-Profile-Token": "s3cret"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["x-profile-status"] == "200"
+        assert "busy_loop" in response.text
+
+    def test_profile_is_stored_when_an_output_dir_is_set(self, tmp_path):
+        response = profiled_app(output_dir=str(tmp_path)).get("/books", headers={"X-Profile-Token": "s3cret"})
+
+        assert response.json() == [{"id": 1}]
+        stored = tmp_path / response.headers["x-profile-file"]
+        assert "busy_loop" in stored.read_text()
+
+    def test_profile_is_written_off_the_event_loop(self, tmp_path, monkeypatch):
+        on_loop = []
+        write_profile = profiling._write_profile
+
+        def recording_write(*args):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            write_profile(*args)
+
+        monkeypatch.setattr(profiling, "_write_profile", recording_write)
+        profiled_app(output_dir=str(tmp_path)).get("/books", headers={"X-Profile-Token": "s3cret"})
+
+        assert on_loop == [False]
+
+    def test_a_secret_is_required(self):
+        with pytest.raises(ValueError):
+            ProfilingMiddleware(FastAPI(), secret="")
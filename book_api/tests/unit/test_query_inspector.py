@@ -0,0 +1,142 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.infrastructure.database.models import BookModel, GenreModel
+from book_api.infrastructure.monitoring.query_inspector import (
+    QueryBudgetExceeded,
+    QueryInspector,
+    statement_shape
+)
+from book_api.infrastructure.monitoring.query_stats import (
+    add_query_observer,
+    remove_query_observer,
+    track_queries
+)
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+from book_api.interface.middleware.query_inspection import QueryInspectionMiddleware
+from book_api.use_cases.services.book_service import BookService
+
+
+@pytest.fixture
+def inspector(db_session):
+    db_session.add_all([GenreModel(id=1, genre="Poetry"), GenreModel(id=2, genre="Travel")])
+    db_session.add_all([
+        BookModel(id=i, title=f"Book {i}", genre_id=1 + i % 2, note=1 + i % 5, stock_number=i,
+                  price_taxed=10 + i, upc=f"upc{i}")
+        for i in range(1, 21)
+    ])
+    db_session.commit()
+
+    engine = db_session.get_bind()
+    inspector = QueryInspector(slow_query_ms=10_000, query_budget=10, repeated_statement_limit=5, strict=True)
+    inspector.install(engine)
+    yield inspector
+    inspector.uninstall()
+
+
+class TestStatementShape:
+    def test_in_lists_and_whitespace_are_collapsed(self):
+        first = statement_shape("SELECT * FROM books\n WHERE id IN (?, ?, ?)")
+        second = statement_shape("SELECT * FROM books WHERE id IN (?,?)")
+
+        assert first == second == "SELECT * FROM books WHERE id IN (?, ...)"
+
+
+class TestQueryInspector:
+    def test_query_in_a_loop_is_flagged(self, inspector, db_session):
+        repository = BookRepository(db_session)
+
+        with pytest.raises(QueryBudgetExceeded, match="possible N\\+1"):
+            with inspector.inspect("loop"):
+                for book_id in range(1, 6):
+                    repository.get_by_id(book_id)
+
+    def test_batched_lookup_passes(self, inspector, db_session):
+        with inspector.inspect("batch") as report:
+            BookRepository(db_session).get_by_ids(list(range(1, 6)))
+
+        assert report.count == 1
+
+    def test_budget_violation_is_logged_when_not_strict(self, inspector, db_session, caplog):
+        inspector.strict = False
+        inspector.query_budget = 2
+
+        with caplog.at_level(logging.WARNING), inspector.inspect("chatty") as report:
+            for book_id in range(1, 4):
+                db_session.execute(text("SELECT title FROM books WHERE id = :id"), {"id": book_id})
+
+        assert report.count == 3
+        assert "chatty: 3 statements, budget is 2" in caplog.text
+
+    def test_statements_outside_a_scope_are_not_counted(self, inspector, db_session):
+        db_session.execute(text("SELECT 1"))
+        with inspector.inspect("empty") as report:
+            pass
+
+        assert report.count == 0
+
+    def test_slow_query_is_logged_with_its_plan(self, inspector, db_session, caplog):
+        inspector.slow_query_ms = 0
+
+        with caplog.at_level(logging.WARNING):
+            BookRepository(db_session).get_by_genre_id(1)
+
+        assert "Slow query" in caplog.text
+        assert "ix_books_genre" in caplog.text  # EXPLAIN QUERY PLAN output
+
+    def test_shares_the_request_metrics_timing(self, inspector, db_session):
+        seen = []
+
+        def observer(conn, statement, parameters, executemany, seconds):
+            seen.append(seconds)
+
+        add_query_observer(observer)
+        try:
+            with track_queries() as stats, inspector.inspect("shared") as report:
+                for book_id in range(1, 3):
+                    db_session.execute(text("SELECT title FROM books WHERE id = :id"), {"id": book_id})
+        finally:
+            remove_query_observer(observer)
+
+        # One timing per statement, handed to the request metrics and to every observer
+        assert stats.count == report.count == len(seen) == 2
+        assert stats.seconds == pytest.approx(sum(seen))
+        assert list(db_session.connection().info) == ["book_api_query_start"]
+
+    def test_service_paths_stay_within_budget(self, inspector, db_session):
+        service = BookService(BookRepository(db_session), GenreRepository(db_session))
+        calls = {
+            "get_all_books": lambda: service.get_all_books(BookSort("price"), 5),
+            "get_book": lambda: service.get_book(3),
+            "get_books_by_genre": lambda: service.get_books_by_genre(1),
+            "get_books_batch": lambda: service.get_books_batch([1, 2, 3], ["upc4", "upc5"]),
+            "query_books": lambda: service.query_books(BookCriteria(genre_id=1, min_rating=2)),
+            "calculate_average_price_by_genre": lambda: service.calculate_average_price_by_genre(1),
+            "calculate_average_stock_by_genre": lambda: service.calculate_average_stock_by_genre(2),
+            "count_books": lambda: service.count_books(BookCriteria(genre_id=1, in_stock=True)),
+        }
+
+        for name, call in calls.items():
+            with inspector.inspect(name):
+                call()
+
+
+class TestQueryInspectionMiddleware:
+    def test_strict_mode_fails_the_request_with_the_route_label(self, inspector, db_session):
+        app = FastAPI()
+        app.add_middleware(QueryInspectionMiddleware, inspector=inspector)
+
+        @app.get("/books/{book_id}")
+        def get_book(book_id: int):
+            repository = BookRepository(db_session)
+            return [repository.get_by_id(book_id + offset) is not None for offset in range(6)]
+
+        with pytest.raises(QueryBudgetExceeded, match="GET /books/{book_id}"):
+            TestClient(app).get("/books/1")
@@ -0,0 +1,128 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import event
+
+from book_api.domain.value_objects.book_sort import BookSort, SORT_FIELDS
+from book_api.infrastructure.cache.cached_book_service import CachedBookService
+from book_api.infrastructure.cache.lru_ttl_cache import LRUTTLCache
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.use_cases.services.ranking import rank_books
+
+BOOKS = [
+    dict(id=i, title=f"Book {i}", genre_id=i % 3 + 1, note=i % 5 + 1 if i % 7 else None,
+         stock_number=(i * 7) % 11, price_taxed=float(10 + (i * 13) % 17) if i % 4 else None,
+         review_number=i % 4)
+    for i in range(1, 41)
+]
+
+SORTS = [BookSort(field, descending) for field in SORT_FIELDS for descending in (False, True)]
+
+
+@pytest.fixture
+def repository(db_session):
+    db_session.add_all([BookModel(**row) for row in BOOKS])
+    db_session.commit()
+    return BookRepository(db_session)
+
+
+def query_plans(db_session, call):
+    """Run a repository call and return SQLite's plan for every statement it sent."""
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    connection = db_session.connection()
+    return [
+        [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+        for statement, parameters in sent
+    ]
+
+
+class TestBookSort:
+    def test_parse(self):
+        assert BookSort.parse("price") == BookSort("price")
+        assert BookSort.parse("-reviews") == BookSort("reviews", descending=True)
+        assert str(BookSort.parse("-rating")) == "-rating"
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError, match="Cannot sort by"):
+            BookSort.parse("title")
+
+
+class TestRankBooks:
+    @pytest.mark.parametrize("sort", SORTS, ids=str)
+    @pytest.mark.parametrize("limit", [None, 1, 5, 100])
+    def test_in_memory_ranking_matches_sql(self, repository, sort, limit):
+        from_sql = repository.get_all(sort, limit)
+        in_memory = rank_books(repository.get_all(), sort, limit)
+
+        assert [book.id for book in in_memory] == [book.id for book in from_sql]
+
+    def test_books_without_the_field_are_left_out(self, repository):
+        books = rank_books(repository.get_all(), BookSort("rating"))
+
+        assert all(book.note is not None for book in books)
+        assert len(books) == sum(1 for row in BOOKS if row["note"] is not None)
+
+    def test_limit_without_sort_keeps_lowest_ids(self, repository):
+        assert [book.id for book in rank_books(repository.get_all()[::-1], limit=3)] == [1, 2, 3]
+
+
+class TestSortedQueriesUseIndexes:
+    @pytest.mark.parametrize("sort", SORTS, ids=str)
+    def test_top_n_walks_an_index(self, db_session, sort):
+        repository = BookRepository(db_session)
+        plans = query_plans(db_session, lambda: repository.get_all(sort, 20))
+        plans += query_plans(db_session, lambda: repository.get_by_genre_id(1, sort, 20))
+
+        for plan in plans:
+            assert any("INDEX" in step for step in plan), plan
+            assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+class TestCachedRanking:
+    def setup_method(self):
+        self.service = Mock()
+        self.cached = CachedBookService(self.service, LRUTTLCache(), lambda: "v1")
+
+    def test_cold_cache_pushes_sort_and_limit_to_the_service(self):
+        self.service.get_books_by_genre.return_value = []
+
+        self.cached.get_books_by_genre(2, BookSort("price"), 5)
+
+        self.service.get_books_by_genre.assert_called_once_with(2, BookSort("price"), 5)
+
+    def test_cached_full_list_is_ranked_in_memory(self, repository):
+        self.service.get_all_books.return_value = repository.get_all()
+        self.cached.get_all_books()
+
+        top = self.cached.get_all_books(BookSort("stock", descending=True), 3)
+
+        assert self.service.get_all_books.call_count == 1
+        assert [book.id for book in top] == [book.id for book in repository.get_all(BookSort("stock", True), 3)]
+
+    def test_free_books_rank_the_same_cold_and_warm(self, db_session):
+        db_session.add_all([
+            BookModel(id=1, title="Free", genre_id=1, price_taxed=0.0),
+            BookModel(id=2, title="Paid", genre_id=1, price_taxed=5.0),
+            BookModel(id=3, title="Unpriced", genre_id=1, price_taxed=None),
+        ])
+        db_session.commit()
+        repository = BookRepository(db_session)
+        self.service.get_all_books.side_effect = repository.get_all
+
+        cold = self.cached.get_all_books(BookSort("price"), 10)  # ORDER BY ... LIMIT in SQL
+        self.cached.get_all_books()
+        warm = self.cached.get_all_books(BookSort("price"), 10)  # Ranked from the cached list
+
+        assert [book.id for book in cold] == [book.id for book in warm] == [1, 2]
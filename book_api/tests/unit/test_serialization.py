@@ -0,0 +1,38 @@
+import json
+from decimal import Decimal
+
+from book_api.domain.entities.book import Book
+from book_api.interface.api.serialization import encode_books, FastJSONResponse
+from book_api.interface.dto.book_dto import BookDto
+
+
+class TestFastSerialization:
+    def test_encode_books_matches_dto_json(self):
+        books = [
+            Book(id=1, title="Book 1", genre_id=1, note=4, price_ht=Decimal("10.00"), price_taxed=Decimal("12.34")),
+            Book(id=2, title="Book 2", genre_id=2, description="Café   line"),
+            Book(id=3, title="Free", genre_id=2, price_ht=Decimal("0"), price_taxed=Decimal("0.00")),
+        ]
+        expected = [
+            BookDto(
+                id=book.id, title=book.title, genre_id=book.genre_id, note=book.note,
+                price_ht=float(book.price_ht) if book.price_ht is not None else None,
+                price_taxed=float(book.price_taxed) if book.price_taxed is not None else None,
+                description=book.description
+            ).model_dump()
+            for book in books
+        ]
+
+        assert json.loads(encode_books(books)) == expected
+        assert json.loads(encode_books(books))[2]["price_taxed"] == 0.0  # A free book still has a price
+
+    def test_response_passes_bytes_through(self):
+        response = FastJSONResponse(b'[{"id":1}]')
+
+        assert response.body == b'[{"id":1}]'
+        assert response.media_type == "application/json"
+
+    def test_response_encodes_plain_data(self):
+        response = FastJSONResponse({"total": 1})
+
+        assert json.loads(response.body) == {"total": 1}
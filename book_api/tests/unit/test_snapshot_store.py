@@ -0,0 +1,158 @@
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.infrastructure.database.models import BookModel
+
+np = pytest.importorskip("numpy")
+
+from book_api.infrastructure.analytics.catalog_snapshot import COLUMNS, CatalogSnapshot  # noqa: E402
+from book_api.infrastructure.analytics.numpy_catalog_analytics import NumpyCatalogAnalytics  # noqa: E402
+from book_api.infrastructure.analytics.snapshot_store import (  # noqa: E402
+    CURRENT_FILE,
+    MappedSnapshotProvider,
+    SnapshotStore
+)
+
+BOOKS = [
+    dict(id=1, title="A", genre_id=1, note=5, stock_number=3, price_ht=10.0, price_taxed=12.0, review_number=0),
+    dict(id=2, title="B", genre_id=2, note=2, stock_number=0, price_ht=20.0, price_taxed=24.0, review_number=4),
+    dict(id=3, title="C", genre_id=None, note=4, stock_number=None, price_ht=None, price_taxed=None, review_number=1),
+    dict(id=4, title="D", genre_id=1, note=3, stock_number=7, price_ht=30.0, price_taxed=36.5, review_number=None),
+]
+
+
+@pytest.fixture
+def loaded(db_session):
+    db_session.add_all([BookModel(**row) for row in BOOKS])
+    db_session.commit()
+    return CatalogSnapshot.load(db_session, "v1")
+
+
+def counting_factory(db_session):
+    """Session factory that counts how many snapshots were built from the database."""
+    factory = Mock(return_value=db_session)
+    db_session.close = Mock()  # The provider closes what it opens; keep the in-memory database
+    return factory
+
+
+class TestSnapshotFiles:
+    def test_open_maps_the_saved_arrays(self, loaded, tmp_path):
+        loaded.save(str(tmp_path))
+
+        mapped = CatalogSnapshot.open(str(tmp_path), "v1")
+
+        for name in COLUMNS:
+            np.testing.assert_array_equal(getattr(mapped, name), getattr(loaded, name))
+        assert {genre: rows.tolist() for genre, rows in mapped.genre_rows.items()} == \
+            {genre: rows.tolist() for genre, rows in loaded.genre_rows.items()}
+        assert isinstance(mapped.price_taxed.base, np.memmap)
+        with pytest.raises(ValueError):
+            mapped.price_taxed[0] = 1.0
+
+    def test_empty_catalog_round_trip(self, db_session, tmp_path):
+        CatalogSnapshot.load(db_session, "v0").save(str(tmp_path))
+
+        mapped = CatalogSnapshot.open(str(tmp_path), "v0")
+
+        assert len(mapped) == 0
+        assert mapped.column("price_taxed", genre_id=1).size == 0
+
+
+class TestSnapshotStore:
+    def test_publish_swaps_current(self, loaded, tmp_path):
+        store = SnapshotStore(str(tmp_path))
+        assert store.current_name() is None
+
+        first = store.publish(loaded)
+        second = store.publish(CatalogSnapshot(**{**loaded.__dict__, "version": "v2"}))
+
+        assert store.current_name() == second
+        assert store.version_of(first) == "v1"
+        assert store.open(second).version == "v2"
+        assert not [name for name in os.listdir(tmp_path) if name.startswith(".tmp-")]
+
+    def test_old_snapshots_are_pruned(self, loaded, tmp_path):
+        store = SnapshotStore(str(tmp_path), keep=2)
+
+        names = [store.publish(CatalogSnapshot(**{**loaded.__dict__, "version": f"v{i}"})) for i in range(4)]
+
+        assert store.snapshots() == names[-2:]
+        with open(tmp_path / CURRENT_FILE) as current:
+            assert current.read() == names[-1]
+
+    def test_lock_removes_abandoned_staging(self, tmp_path):
+        store = SnapshotStore(str(tmp_path))
+        os.makedirs(tmp_path / ".tmp-v1.1")
+
+        with store.lock():
+            pass
+
+        assert not (tmp_path / ".tmp-v1.1").exists()
+
+
+class TestMappedSnapshotProvider:
+    def test_first_worker_builds_the_others_map(self, db_session, tmp_path):
+        db_session.add_all([BookModel(**row) for row in BOOKS])
+        db_session.commit()
+        factory = counting_factory(db_session)
+        version = Mock(return_value="v1")
+
+        workers = [MappedSnapshotProvider(SnapshotStore(str(tmp_path)), factory, version) for _ in range(3)]
+        snapshots = [worker.current() for worker in workers]
+
+        assert factory.call_count == 1
+        assert all(snapshot.version == "v1" for snapshot in snapshots)
+        assert workers[0].current() is snapshots[0]
+
+    def test_new_dataset_version_publishes_a_new_snapshot(self, db_session, tmp_path):
+        db_session.add_all([BookModel(**row) for row in BOOKS])
+        db_session.commit()
+        factory = counting_factory(db_session)
+        version = Mock(return_value="v1")
+        store = SnapshotStore(str(tmp_path))
+        provider = MappedSnapshotProvider(store, factory, version)
+
+        old = provider.current()
+        db_session.add(BookModel(id=5, title="E", genre_id=2, price_taxed=6.0))
+        db_session.commit()
+        version.return_value = "v2"
+        new = provider.current()
+
+        assert factory.call_count == 2
+        assert store.version_of(store.current_name()) == "v2"
+        assert len(old) == 4  # A reader holding the old snapshot keeps a consistent view
+        assert len(new) == 5
+
+    def test_concurrent_workers_build_once(self, db_session, tmp_path):
+        db_session.add_all([BookModel(**row) for row in BOOKS])
+        db_session.commit()
+        factory = counting_factory(db_session)
+        workers = [MappedSnapshotProvider(SnapshotStore(str(tmp_path)), factory, lambda: "v1") for _ in range(4)]
+        barrier = threading.Barrier(len(workers))
+
+        def serve(worker):
+            barrier.wait()
+            worker.current()
+
+        threads = [threading.Thread(target=serve, args=(worker,)) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.call_count == 1
+
+    def test_analytics_over_mapped_snapshot(self, db_session, tmp_path):
+        db_session.add_all([BookModel(**row) for row in BOOKS])
+        db_session.commit()
+        provider = MappedSnapshotProvider(SnapshotStore(str(tmp_path)), counting_factory(db_session), lambda: "v1")
+
+        analytics = NumpyCatalogAnalytics(provider)
+
+        assert analytics.price_summary()["books_with_price"] == 3
+        assert analytics.price_summary(genre_id=1)["average_price"] == 24.25
+        assert analytics.count(BookCriteria(in_stock=True)) == 2
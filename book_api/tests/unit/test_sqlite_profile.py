@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from book_api.config.settings import Settings
+from book_api.infrastructure.database.connection import create_reader_engine, create_writer_engine
+from book_api.infrastructure.database.sqlite_profile import writer_pragmas
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestSQLiteProfile:
+    def setup_method(self):
+        self.settings = Settings(sqlite_mmap_size=1024 * 1024, sqlite_cache_size=-2048, sqlite_read_pool_size=2)
+
+    def test_writer_enables_wal(self, tmp_path):
+        path = tmp_path / "books.db"
+        writer = create_writer_engine(f"sqlite:///{path}", self.settings)
+
+        assert _pragma(writer, "journal_mode") == "wal"
+        assert _pragma(writer, "synchronous") == 1  # NORMAL
+        assert _pragma(writer, "cache_size") == -2048
+        writer.dispose()
+
+    def test_readers_are_read_only_and_tuned(self, tmp_path):
+        path = tmp_path / "books.db"
+        writer = create_writer_engine(f"sqlite:///{path}", self.settings)
+        with writer.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE books (id INTEGER PRIMARY KEY)")
+            conn.exec_driver_sql("INSERT INTO books (id) VALUES (1)")
+
+        reader = create_reader_engine(f"sqlite:///file:{path}?mode=ro&uri=true", self.settings)
+
+        assert _pragma(reader, "mmap_size") == 1024 * 1024
+        assert _pragma(reader, "query_only") == 1
+        assert reader.pool.size() == 2
+        with reader.connect() as conn:
+            assert conn.exec_driver_sql("SELECT COUNT(*) FROM books").scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.exec_driver_sql("INSERT INTO books (id) VALUES (2)")
+        reader.dispose()
+        writer.dispose()
+
+    def test_readers_see_writes_while_writer_is_open(self, tmp_path):
+        path = tmp_path / "books.db"
+        writer = create_writer_engine(f"sqlite:///{path}", self.settings)
+        with writer.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE books (id INTEGER PRIMARY KEY)")
+        reader = create_reader_engine(f"sqlite:///file:{path}?mode=ro&uri=true", self.settings)
+
+        with writer.connect() as write_conn:
+            write_conn.exec_driver_sql("INSERT INTO books (id) VALUES (1)")
+            # Uncommitted write: WAL readers still see the last committed state
+            with reader.connect() as conn:
+                assert conn.exec_driver_sql("SELECT COUNT(*) FROM books").scalar() == 0
+            write_conn.commit()
+
+        with reader.connect() as conn:
+            assert conn.exec_driver_sql("SELECT COUNT(*) FROM books").scalar() == 1
+        reader.dispose()
+        writer.dispose()
+
+    def test_unknown_journal_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="journal mode"):
+            writer_pragmas(Settings(sqlite_journal_mode="WAL; DROP TABLE books"))
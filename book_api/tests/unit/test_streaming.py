@@ -0,0 +1,58 @@
+import csv
+import gzip
+import io
+import json
+from decimal import Decimal
+
+from book_api.domain.entities.book import Book
+from book_api.infrastructure.database.models import BookModel
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.interface.api.streaming import ndjson_chunks, csv_chunks, gzip_chunks, EXPORT_FIELDS
+
+
+def _books(count):
+    return [
+        Book(id=i, title=f"Book {i}", genre_id=1, price_taxed=Decimal("10.50"), description="Line 1\nLine 2")
+        for i in range(1, count + 1)
+    ]
+
+
+class TestStreamingEncoders:
+    def test_ndjson_one_object_per_line(self):
+        chunks = list(ndjson_chunks(_books(5), rows_per_chunk=2))
+
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode().splitlines()
+        assert len(lines) == 5
+        assert json.loads(lines[0])["price_taxed"] == 10.5
+        assert json.loads(lines[0])["description"] == "Line 1\nLine 2"
+
+    def test_csv_has_header_and_all_rows(self):
+        chunks = list(csv_chunks(_books(5), rows_per_chunk=2))
+
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        assert len(chunks) == 3
+        assert len(rows) == 5
+        assert list(rows[0]) == EXPORT_FIELDS
+
+    def test_csv_empty_catalog_still_has_header(self):
+        content = b"".join(csv_chunks([])).decode()
+
+        assert content.strip() == ",".join(EXPORT_FIELDS)
+
+    def test_gzip_round_trip(self):
+        raw = b"".join(ndjson_chunks(_books(50), rows_per_chunk=10))
+
+        compressed = b"".join(gzip_chunks(ndjson_chunks(_books(50), rows_per_chunk=10)))
+
+        assert gzip.decompress(compressed) == raw
+
+
+class TestBookRepositoryIterAll:
+    def test_iter_all_streams_every_row_in_id_order(self, db_session):
+        db_session.add_all([BookModel(id=i, title=f"Book {i}", genre_id=1) for i in (3, 1, 2)])
+        db_session.commit()
+
+        books = list(BookRepository(db_session).iter_all(batch_size=2))
+
+        assert [book.id for book in books] == [1, 2, 3]
@@ -0,0 +1,36 @@
+import sqlite3
+
+from book_api.benchmarks.synthetic_catalog import generate_catalog, generate_rows
+from book_api.benchmarks.scaling import uncovered_methods
+from book_api.infrastructure.database.models import BookModel
+
+
+class TestSyntheticCatalog:
+    def test_rows_are_deterministic_and_in_range(self):
+        rows = list(generate_rows(500, genres=10, seed=7))
+
+        assert rows == list(generate_rows(500, genres=10, seed=7))
+        assert [row[0] for row in rows] == list(range(1, 501))
+        assert all(1 <= row[2] <= 10 and 1 <= row[3] <= 5 for row in rows)
+        assert all(10 <= row[8] <= 59.99 and row[8] == row[9] for row in rows)
+        assert any(row[4] == 0 for row in rows)
+        assert len({row[6] for row in rows}) == 500  # UPCs are unique
+
+    def test_catalog_has_the_api_schema(self, tmp_path):
+        path = str(tmp_path / "catalog.db")
+        generate_catalog(path, 300, genres=5, batch_size=64)
+
+        connection = sqlite3.connect(path)
+        try:
+            assert connection.execute("SELECT count(*) FROM books").fetchone() == (300,)
+            assert connection.execute("SELECT count(*) FROM books_genres").fetchone() == (5,)
+            indexes = {name for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'books'"
+            )}
+            assert {index.name for index in BookModel.__table__.indexes} <= indexes
+            assert connection.execute("SELECT count(*) FROM sqlite_stat1").fetchone()[0] > 0
+        finally:
+            connection.close()
+
+    def test_scaling_suite_covers_every_interface_method(self):
+        assert uncovered_methods() == []
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from book_api.infrastructure.database.models import BookModel, GenreModel
+from book_api.infrastructure.monitoring.tracing import (
+    TracedLayer,
+    configure_tracing,
+    disable_tracing,
+    enable_tracing,
+    get_tracer,
+    shutdown_tracing,
+    trace_layer
+)
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.infrastructure.repositories.genre_repository import GenreRepository
+from book_api.interface.middleware.tracing import TracingMiddleware
+from book_api.use_cases.services.book_service import BookService
+
+pytest.importorskip("opentelemetry.sdk")
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+
+@pytest.fixture
+def spans():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    enable_tracing(provider)
+    yield exporter
+    disable_tracing()
+
+
+@pytest.fixture
+def service(db_session, spans):
+    db_session.add(GenreModel(id=1, genre="Poetry"))
+    db_session.add_all([BookModel(id=i, title=f"Book {i}", genre_id=1, price_taxed=10 + i) for i in range(1, 4)])
+    db_session.commit()
+    spans.clear()
+    return trace_layer(
+        BookService(trace_layer(BookRepository(db_session), "repository"), GenreRepository(db_session)),
+        "service"
+    )
+
+
+def parent_of(span, finished):
+    return next((other for other in finished if span.parent and other.context.span_id == span.parent.span_id), None)
+
+
+class TestTracing:
+    def test_trace_layer_is_a_no_op_when_tracing_is_off(self):
+        repository = BookRepository(None)
+
+        assert trace_layer(repository, "repository") is repository
+
+    def test_layers_and_sql_are_nested_spans(self, service, spans):
+        books = service.get_books_by_genre(1)
+
+        finished = spans.get_finished_spans()
+        by_name = {span.name: span for span in finished}
+        sql = by_name["SELECT"]
+        repository = by_name["repository.BookRepository.get_by_genre_id"]
+        layer = by_name["service.BookService.get_books_by_genre"]
+
+        assert len(books) == 3
+        assert parent_of(sql, finished) is repository
+        assert parent_of(repository, finished) is layer
+        assert repository.attributes["bookscrape.rows"] == 3
+        assert repository.attributes["bookscrape.layer"] == "repository"
+        assert "FROM books" in sql.attributes["db.statement"]
+        assert sql.attributes["db.system"] == "sqlite"
+
+    def test_wrapped_methods_keep_their_results_and_errors(self, service, spans):
+        assert isinstance(service, TracedLayer)
+        assert service.get_book(2).id == 2
+
+        with pytest.raises(ValueError):
+            service.calculate_average_price_by_genre(99)
+
+        failed = [span for span in spans.get_finished_spans() if not span.status.is_ok]
+        assert [span.name for span in failed] == ["service.BookService.calculate_average_price_by_genre"]
+
+    def test_middleware_opens_a_root_span_named_after_the_route(self, service, spans):
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware)
+
+        @app.get("/books/{book_id}")
+        def get_book(book_id: int):
+            return {"id": service.get_book(book_id).id}
+
+        TestClient(app).get("/books/2")
+
+        finished = spans.get_finished_spans()
+        root = next(span for span in finished if span.parent is None)
+        assert root.name == "GET /books/{book_id}"
+        assert root.attributes["http.response.status_code"] == 200
+        assert parent_of(next(span for span in finished if span.name == "service.BookService.get_book"),
+                         finished) is root
+
+    def test_shutdown_writes_batched_spans_and_closes_the_file(self, tmp_path):
+        trace_file = tmp_path / "traces" / "spans.jsonl"
+        configure_tracing("file", str(trace_file))
+        with get_tracer().start_as_current_span("last request"):
+            pass
+
+        shutdown_tracing()
+
+        [line] = trace_file.read_text().splitlines()
+        assert json.loads(line)["name"] == "last request"
+        assert get_tracer() is None
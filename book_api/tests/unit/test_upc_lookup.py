@@ -0,0 +1,119 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from book_api.config.dependencies import get_book_service
+from book_api.infrastructure.database.models import BookModel
+from book_api.domain.value_objects.upc import prefix_upper_bound
+from book_api.infrastructure.repositories.book_repository import BookRepository
+from book_api.interface.api.book_router import router
+from book_api.use_cases.services.book_service import BookService
+
+UPCS = ["a897fe39b1053632", "a8a1f3a0bfd30b3b", "a8a1f3a0bfd30b3c", "b0c1d2e3f4a5b6c7", "a8"]
+
+
+@pytest.fixture
+def repository(db_session):
+    db_session.add_all([
+        BookModel(id=i, title=f"Book {i}", genre_id=1, upc=upc, description=f"About {i}")
+        for i, upc in enumerate(UPCS, start=1)
+    ])
+    db_session.add(BookModel(id=9, title="Duplicate", genre_id=1, upc=UPCS[1]))
+    db_session.commit()
+    return BookRepository(db_session)
+
+
+def plan_of(db_session, call):
+    """Run call and return SQLite's plan for the last statement it sent."""
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = sent[-1]
+    rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return " ".join(row[-1] for row in rows)
+
+
+class TestBookRepositoryUpc:
+    def test_exact_lookup_returns_the_full_record(self, repository):
+        book = repository.get_by_upc(UPCS[1])
+
+        assert book.id == 2  # Lowest ID on duplicate UPCs, as in the batch lookup
+        assert book.description == "About 2"
+        assert repository.get_by_upc("a8a1") is None
+
+    @pytest.mark.parametrize("prefix, limit, expected_ids", [
+        ("a8", None, [5, 1, 2, 9, 3]),
+        ("a8a1f3a0bfd30b3", 2, [2, 9]),
+        ("a8a1f3a0bfd30b3c", None, [3]),
+        ("b", None, [4]),
+        ("c", None, []),
+    ])
+    def test_prefix_lookup_is_in_upc_order(self, repository, prefix, limit, expected_ids):
+        assert [book.id for book in repository.get_by_upc_prefix(prefix, limit)] == expected_ids
+
+    @pytest.mark.parametrize("call", [
+        lambda repository: repository.get_by_upc(UPCS[0]),
+        lambda repository: repository.get_by_upc_prefix("a8a", 20),
+    ])
+    def test_lookups_search_the_upc_index(self, repository, db_session, call):
+        plan = plan_of(db_session, lambda: call(repository))
+
+        assert "SEARCH books USING INDEX ix_books_upc" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_prefix_upper_bound(self):
+        assert prefix_upper_bound("a8") == "a9"
+        assert prefix_upper_bound("a8f") == "a8g"
+        assert "a8ff" < prefix_upper_bound("a8f") <= "a9"
+        with pytest.raises(ValueError, match="must not be empty"):
+            prefix_upper_bound("")
+
+
+class TestUpcRoutes:
+    @pytest.fixture
+    def client(self, repository):
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_book_service] = lambda: BookService(repository, Mock())
+        return TestClient(app)
+
+    def test_exact_route(self, client):
+        response = client.get(f"/books/by_upc/{UPCS[0]}")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == 1
+        assert response.json()["description"] == "About 1"
+        assert client.get("/books/by_upc/ffffffffffffffff").status_code == 404
+
+    def test_prefix_route(self, client):
+        response = client.get("/books/by_upc_prefix/a8a1?limit=2")
+
+        assert response.status_code == 200
+        assert [book["upc"] for book in response.json()] == [UPCS[1], UPCS[1]]
+        assert client.get("/books/by_upc_prefix/a8a1?limit=0").status_code == 422
+
+    def test_uppercase_input_is_normalised(self, client):
+        response = client.get(f"/books/by_upc/{UPCS[0].upper()}")
+        assert response.status_code == 200
+        assert response.json()["id"] == 1
+
+        response = client.get("/books/by_upc_prefix/A8A1")
+        assert [book["id"] for book in response.json()] == [2, 9, 3]
+
+    def test_blank_prefix_is_a_bad_request(self, client):
+        response = client.get("/books/by_upc_prefix/%20")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "UPC prefix must not be empty"
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_sort import BookSort
+
+
+class IAsyncBookRepository(ABC):
+    """Async counterpart of IBookRepository, for the non-blocking database stack."""
+
+    @abstractmethod
+    async def get_all(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books from database, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, book_id: int) -> Optional[Book]:
+        """Get one book by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_keyword(self, keyword: str) -> List[Book]:
+        """Find books that contain keyword in title."""
+        pass
+
+    @abstractmethod
+    async def get_by_genre_id(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get all books from a specific genre, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    async def get_books_with_valid_prices(self) -> List[Book]:
+        """Get only books that have a valid price."""
+        pass
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_sort import BookSort
+
+
+class IAsyncBookService(ABC):
+    """Async counterpart of IBookService, for the non-blocking database stack."""
+
+    @abstractmethod
+    async def get_all_books(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    async def get_book(self, book_id: int) -> Optional[Book]:
+        """Get one book with its full record (description included)."""
+        pass
+
+    @abstractmethod
+    async def search_books(self, keyword: str) -> List[Book]:
+        """Search books by keyword."""
+        pass
+
+    @abstractmethod
+    async def get_books_by_genre(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get books from specific genre, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    async def calculate_average_price_all(self) -> Dict[str, Any]:
+        """Calculate average price for all books."""
+        pass
+
+    @abstractmethod
+    async def calculate_average_price_by_genre(self, genre_id: int) -> Dict[str, Any]:
+        """Calculate average price for books in specific genre."""
+        pass
+
+    @abstractmethod
+    async def calculate_average_stock_all(self) -> Dict[str, Any]:
+        """Calculate average stock for all books."""
+        pass
+
+    @abstractmethod
+    async def calculate_average_stock_by_genre(self, genre_id: int) -> Dict[str, Any]:
+        """Calculate average stock for books in specific genre."""
+        pass
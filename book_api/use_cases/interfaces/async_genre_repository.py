@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from book_api.domain.entities.genre import Genre
+
+
+class IAsyncGenreRepository(ABC):
+    """Async counterpart of IGenreRepository, for the non-blocking database stack."""
+
+    @abstractmethod
+    async def get_all(self) -> List[Genre]:
+        """Get all genres from database."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, genre_id: int) -> Optional[Genre]:
+        """Get one genre by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> Optional[Genre]:
+        """Find genre by exact name."""
+        pass
@@ -1,18 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
 
 
 class IBookRepository(ABC):
 
     @abstractmethod
-    def get_all(self) -> List[Book]:
-        """Get all books from database."""
+    def get_all(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books from database, optionally ordered and limited."""
         pass
 
     @abstractmethod
     def get_by_id(self, book_id: int) -> Optional[Book]:
-        """Get one book by its ID."""
+        """Get one book by its ID, full record included."""
+        pass
+
+    @abstractmethod
+    def get_by_ids(self, book_ids: List[int]) -> List[Book]:
+        """Get the books matching any of the IDs, in one round trip per chunk."""
+        pass
+
+    @abstractmethod
+    def get_by_upcs(self, upcs: List[str]) -> List[Book]:
+        """Get the books matching any of the UPCs, in one round trip per chunk."""
+        pass
+
+    @abstractmethod
+    def get_by_upc(self, upc: str) -> Optional[Book]:
+        """Get one book by its exact UPC, full record included."""
+        pass
+
+    @abstractmethod
+    def get_by_upc_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Book]:
+        """Get the books whose UPC starts with prefix, in UPC order, optionally limited."""
         pass
 
     @abstractmethod
@@ -21,11 +43,31 @@ class IBookRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_genre_id(self, genre_id: int) -> List[Book]:
-        """Get all books from a specific genre."""
+    def get_by_genre_id(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get all books from a specific genre, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    def get_by_criteria(
+        self,
+        criteria: BookCriteria,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get the books matching every filter of the criteria, optionally ordered and limited."""
         pass
 
     @abstractmethod
     def get_books_with_valid_prices(self) -> List[Book]:
         """Get only books that have a valid price."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Book]:
+        """Stream all books, full records included, fetching batch_size rows at a time."""
+        pass
@@ -1,13 +1,40 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Optional, Sequence
 from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
 
 
 class IBookService(ABC):
 
     @abstractmethod
-    def get_all_books(self) -> List[Book]:
-        """Get all books."""
+    def get_all_books(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    def get_book(self, book_id: int) -> Optional[Book]:
+        """Get one book with its full record (description included)."""
+        pass
+
+    @abstractmethod
+    def iter_all_books(self, batch_size: int = 500) -> Iterator[Book]:
+        """Stream all books without loading the whole catalog in memory."""
+        pass
+
+    @abstractmethod
+    def get_books_batch(self, book_ids: List[int], upcs: List[str]) -> Dict[str, Any]:
+        """Resolve many books by ID and/or UPC at once, reporting the keys that were not found."""
+        pass
+
+    @abstractmethod
+    def get_book_by_upc(self, upc: str) -> Optional[Book]:
+        """Get one book by its exact UPC, with its full record."""
+        pass
+
+    @abstractmethod
+    def search_books_by_upc_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Book]:
+        """Get the books whose UPC starts with prefix, in UPC order, optionally limited."""
         pass
 
     @abstractmethod
@@ -16,8 +43,23 @@ class IBookService(ABC):
         pass
 
     @abstractmethod
-    def get_books_by_genre(self, genre_id: int) -> List[Book]:
-        """Get books from specific genre."""
+    def get_books_by_genre(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get books from specific genre, optionally ordered and limited."""
+        pass
+
+    @abstractmethod
+    def query_books(
+        self,
+        criteria: BookCriteria,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get the books matching every filter of the criteria, optionally ordered and limited."""
         pass
 
     @abstractmethod
@@ -38,4 +80,29 @@ class IBookService(ABC):
     @abstractmethod
     def calculate_average_stock_by_genre(self, genre_id: int) -> Dict[str, Any]:
         """Calculate average stock for books in specific genre."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def calculate_histogram(self, column: str, bins: int = 10, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        """Distribution of a numeric column, for all books or one genre."""
+        pass
+
+    @abstractmethod
+    def calculate_percentiles(
+        self,
+        column: str,
+        percents: Sequence[float],
+        genre_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Percentiles (0-100) of a numeric column, for all books or one genre."""
+        pass
+
+    @abstractmethod
+    def calculate_genre_summary(self) -> List[Dict[str, Any]]:
+        """Book count, average price and average stock of every genre."""
+        pass
+
+    @abstractmethod
+    def count_books(self, criteria: BookCriteria) -> int:
+        """Count the books matching every filter of the criteria."""
+        pass
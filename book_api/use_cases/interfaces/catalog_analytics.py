@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+from book_api.domain.value_objects.book_criteria import BookCriteria
+
+# Numeric book columns that analytics can aggregate
+ANALYTICS_COLUMNS = ("price_ht", "price_taxed", "note", "stock_number", "review_number")
+
+
+class ICatalogAnalytics(ABC):
+    """
+    Aggregates over the whole catalog, or one genre of it.
+    Summaries have the same shape as `book_statistics.price_summary` / `stock_summary`.
+    """
+
+    @abstractmethod
+    def price_summary(self, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        """Average taxed price of the books with a valid price."""
+        pass
+
+    @abstractmethod
+    def stock_summary(self, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        """Average stock of the books with a stock number."""
+        pass
+
+    @abstractmethod
+    def histogram(self, column: str, bins: int = 10, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        """Equal-width histogram of a numeric column, ignoring missing values."""
+        pass
+
+    @abstractmethod
+    def percentiles(self, column: str, percents: Sequence[float], genre_id: Optional[int] = None) -> Dict[str, Any]:
+        """Linearly interpolated percentiles (0-100) of a numeric column, ignoring missing values."""
+        pass
+
+    @abstractmethod
+    def genre_summary(self) -> List[Dict[str, Any]]:
+        """Book count, average price and average stock of each genre, ordered by genre ID."""
+        pass
+
+    @abstractmethod
+    def count(self, criteria: BookCriteria) -> int:
+        """Number of books matching every filter of the criteria."""
+        pass
@@ -0,0 +1,88 @@
+"""
+Async Book Service.
+Same business rules as BookService, with awaited repository calls.
+"""
+from typing import List, Dict, Any, Optional
+import logging
+
+from book_api.use_cases.interfaces.async_book_service import IAsyncBookService
+from book_api.use_cases.interfaces.async_book_repository import IAsyncBookRepository
+from book_api.use_cases.interfaces.async_genre_repository import IAsyncGenreRepository
+from book_api.use_cases.services.book_statistics import price_summary, stock_summary
+from book_api.domain.entities.book import Book
+from book_api.domain.exceptions import GenreNotFoundError
+from book_api.domain.value_objects.book_sort import BookSort
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBookService(IAsyncBookService):
+    """
+    Service that contains business logic for books, for async routes.
+    Calculations are shared with BookService through book_statistics.
+    """
+
+    def __init__(self, book_repo: IAsyncBookRepository, genre_repo: IAsyncGenreRepository):
+        self.book_repo = book_repo
+        self.genre_repo = genre_repo
+
+    async def get_all_books(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books, optionally ordered and limited."""
+        logger.info("Getting all books (sort=%s, limit=%s)", sort, limit)
+        return await self.book_repo.get_all(sort, limit)
+
+    async def get_book(self, book_id: int) -> Optional[Book]:
+        """Get one book with its full record."""
+        logger.info("Getting book ID: %s", book_id)
+        return await self.book_repo.get_by_id(book_id)
+
+    async def search_books(self, keyword: str) -> List[Book]:
+        """Search books by keyword."""
+        logger.info("Searching books with keyword: %s", keyword)
+        return await self.book_repo.get_by_keyword(keyword)
+
+    async def get_books_by_genre(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get books from specific genre, optionally ordered and limited."""
+        logger.info("Getting books for genre ID: %s (sort=%s, limit=%s)", genre_id, sort, limit)
+        return await self.book_repo.get_by_genre_id(genre_id, sort, limit)
+
+    async def calculate_average_price_all(self) -> Dict[str, Any]:
+        """Calculate average price for all books."""
+        logger.info("Calculating average price for all books")
+        summary = price_summary(await self.book_repo.get_all())
+        del summary["sample_prices"]
+        return summary
+
+    async def calculate_average_price_by_genre(self, genre_id: int) -> Dict[str, Any]:
+        """Calculate average price for books in specific genre."""
+        logger.info("Calculating average price for genre ID: %s", genre_id)
+
+        genre = await self.genre_repo.get_by_id(genre_id)
+        if not genre:
+            raise GenreNotFoundError(genre_id)
+
+        summary = price_summary(await self.book_repo.get_by_genre_id(genre_id))
+        return {"genre_id": genre_id, "genre_name": genre.name, **summary}
+
+    async def calculate_average_stock_all(self) -> Dict[str, Any]:
+        """Calculate average stock for all books."""
+        logger.info("Calculating average stock for all books")
+        summary = stock_summary(await self.book_repo.get_all())
+        del summary["sample_stocks"]
+        return summary
+
+    async def calculate_average_stock_by_genre(self, genre_id: int) -> Dict[str, Any]:
+        """Calculate average stock for books in specific genre."""
+        logger.info("Calculating average stock for genre ID: %s", genre_id)
+
+        genre = await self.genre_repo.get_by_id(genre_id)
+        if not genre:
+            raise GenreNotFoundError(genre_id)
+
+        summary = stock_summary(await self.book_repo.get_by_genre_id(genre_id))
+        return {"genre_id": genre_id, "genre_name": genre.name, **summary}
@@ -2,13 +2,26 @@
 Book Service - Contains all business logic for books.
 This is where we put calculations, validations, and business rules.
 """
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Optional, Sequence
 import logging
 
 from book_api.use_cases.interfaces.book_service import IBookService
 from book_api.use_cases.interfaces.book_repository import IBookRepository
 from book_api.use_cases.interfaces.genre_repository import IGenreRepository
+from book_api.use_cases.interfaces.catalog_analytics import ICatalogAnalytics, ANALYTICS_COLUMNS
+from book_api.use_cases.services.book_statistics import (
+    genre_summary,
+    histogram,
+    matches_filters,
+    percentiles,
+    price_summary,
+    stock_summary
+)
 from book_api.domain.entities.book import Book
+from book_api.domain.exceptions import GenreNotFoundError
+from book_api.domain.value_objects.book_criteria import BookCriteria
+from book_api.domain.value_objects.book_sort import BookSort
+from book_api.domain.value_objects.upc import normalize_upc
 
 logger = logging.getLogger(__name__)
 
@@ -17,26 +30,98 @@ class BookService(IBookService):
     """
     Service that contains business logic for books.
     This is where we put all the calculations and business rules.
+    Aggregates run on `analytics` when one is given, otherwise over the books loaded from the repository.
     """
 
-    def __init__(self, book_repo: IBookRepository, genre_repo: IGenreRepository):
+    def __init__(
+        self,
+        book_repo: IBookRepository,
+        genre_repo: IGenreRepository,
+        analytics: Optional[ICatalogAnalytics] = None
+    ):
         self.book_repo = book_repo
         self.genre_repo = genre_repo
+        self.analytics = analytics
 
-    def get_all_books(self) -> List[Book]:
-        """Get all books."""
-        logger.info("Getting all books")
-        return self.book_repo.get_all()
+    def get_all_books(self, sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+        """Get all books, optionally ordered and limited."""
+        logger.info("Getting all books (sort=%s, limit=%s)", sort, limit)
+        return self.book_repo.get_all(sort, limit)
+
+    def get_book(self, book_id: int) -> Optional[Book]:
+        """
+        Get one book with its full record.
+        List and aggregate methods leave the description out; this is where it is read.
+        """
+        logger.info("Getting book ID: %s", book_id)
+        return self.book_repo.get_by_id(book_id)
+
+    def iter_all_books(self, batch_size: int = 500) -> Iterator[Book]:
+        """Stream all books without loading the whole catalog in memory."""
+        logger.info("Streaming all books")
+        return self.book_repo.iter_all(batch_size)
+
+    def get_books_batch(self, book_ids: List[int], upcs: List[str]) -> Dict[str, Any]:
+        """
+        Resolve many books by ID and/or UPC at once.
+        Results are keyed by the requested value; unknown keys are listed as missing.
+        """
+        book_ids = list(dict.fromkeys(book_ids))  # De-duplicate, keep order
+        upcs = list(dict.fromkeys(upcs))
+        logger.info("Batch lookup of %s IDs and %s UPCs", len(book_ids), len(upcs))
+
+        by_id = {book.id: book for book in self.book_repo.get_by_ids(book_ids)} if book_ids else {}
+        by_upc = {}
+        if upcs:
+            for book in self.book_repo.get_by_upcs(list(dict.fromkeys(map(normalize_upc, upcs)))):
+                by_upc.setdefault(book.upc, book)  # First (lowest ID) wins on duplicate UPCs
+        # Looked up in stored form, reported under the value the caller sent
+        found_upcs = {upc: by_upc[normalize_upc(upc)] for upc in upcs if normalize_upc(upc) in by_upc}
+
+        return {
+            "books_by_id": {book_id: by_id[book_id] for book_id in book_ids if book_id in by_id},
+            "books_by_upc": found_upcs,
+            "missing_ids": [book_id for book_id in book_ids if book_id not in by_id],
+            "missing_upcs": [upc for upc in upcs if upc not in found_upcs],
+        }
+
+    def get_book_by_upc(self, upc: str) -> Optional[Book]:
+        """Get one book by its exact UPC, with its full record."""
+        logger.info("Getting book UPC: %s", upc)
+        return self.book_repo.get_by_upc(normalize_upc(upc))
+
+    def search_books_by_upc_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Book]:
+        """Get the books whose UPC starts with prefix, in UPC order, optionally limited."""
+        prefix = normalize_upc(prefix)
+        if not prefix:
+            raise ValueError("UPC prefix must not be empty")
+        logger.info("Searching books with UPC prefix: %s (limit=%s)", prefix, limit)
+        return self.book_repo.get_by_upc_prefix(prefix, limit)
 
     def search_books(self, keyword: str) -> List[Book]:
         """Search books by keyword."""
-        logger.info(f"Searching books with keyword: {keyword}")
+        logger.info("Searching books with keyword: %s", keyword)
         return self.book_repo.get_by_keyword(keyword)
 
-    def get_books_by_genre(self, genre_id: int) -> List[Book]:
-        """Get books from specific genre."""
-        logger.info(f"Getting books for genre ID: {genre_id}")
-        return self.book_repo.get_by_genre_id(genre_id)
+    def get_books_by_genre(
+        self,
+        genre_id: int,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get books from specific genre, optionally ordered and limited."""
+        logger.info("Getting books for genre ID: %s (sort=%s, limit=%s)", genre_id, sort, limit)
+        return self.book_repo.get_by_genre_id(genre_id, sort, limit)
+
+    def query_books(
+        self,
+        criteria: BookCriteria,
+        sort: Optional[BookSort] = None,
+        limit: Optional[int] = None
+    ) -> List[Book]:
+        """Get the books matching every filter of the criteria, optionally ordered and limited."""
+        logger.info("Querying books with %s (sort=%s, limit=%s)", criteria, sort, limit)
+        return self.book_repo.get_by_criteria(criteria, sort, limit)
 
     def calculate_average_price_all(self) -> Dict[str, Any]:
         """
@@ -45,61 +130,43 @@ class BookService(IBookService):
         """
         logger.info("Calculating average price for all books")
 
-        all_books = self.book_repo.get_all()
-        books_with_price = [book for book in all_books if book.has_valid_price()]
-
-        if not books_with_price:
-            return {
-                "total_books": len(all_books),
-                "books_with_price": 0,
-                "average_price": 0.0,
-            }
-
-        # Business logic: calculate average
-        total_price = sum(float(book.price_taxed) for book in books_with_price)
-        average = round(total_price / len(books_with_price), 2)
+        if self.analytics:
+            summary = self.analytics.price_summary()
+        else:
+            summary = price_summary(self.book_repo.get_all())
 
-        logger.info(f"Average calculated on {len(books_with_price)} valid books out of {len(all_books)}")
+        logger.info(
+            "Average calculated on %s valid books out of %s", summary["books_with_price"], summary["total_books"]
+        )
 
         return {
-            "total_books": len(all_books),
-            "books_with_price": len(books_with_price),
-            "average_price": average,
+            "total_books": summary["total_books"],
+            "books_with_price": summary["books_with_price"],
+            "average_price": summary["average_price"],
         }
 
     def calculate_average_price_by_genre(self, genre_id: int) -> Dict[str, Any]:
         """
         Calculate average price for books in specific genre.
         """
-        logger.info(f"Calculating average price for genre ID: {genre_id}")
+        logger.info("Calculating average price for genre ID: %s", genre_id)
 
         # Get genre info
         genre = self.genre_repo.get_by_id(genre_id)
         if not genre:
-            raise ValueError("Genre not found")
-
-        # Get books for this genre
-        books = self.book_repo.get_by_genre_id(genre_id)
-        books_with_price = [book for book in books if book.has_valid_price()]
+            raise GenreNotFoundError(genre_id)
 
-        if not books_with_price:
-            average = 0.0
-            sample_prices = []
+        if self.analytics:
+            summary = self.analytics.price_summary(genre_id)
         else:
-            total_price = sum(float(book.price_taxed) for book in books_with_price)
-            average = round(total_price / len(books_with_price), 2)
-            sample_prices = [float(book.price_taxed) for book in books_with_price[:10]]
+            summary = price_summary(self.book_repo.get_by_genre_id(genre_id))
 
-        logger.info(f"Genre {genre.name} ({genre_id}) → {len(books_with_price)} valid prices out of {len(books)} books")
+        logger.info(
+            "Genre %s (%s) → %s valid prices out of %s books",
+            genre.name, genre_id, summary["books_with_price"], summary["total_books"]
+        )
 
-        return {
-            "genre_id": genre_id,
-            "genre_name": genre.name,
-            "total_books": len(books),
-            "books_with_price": len(books_with_price),
-            "average_price": average,
-            "sample_prices": sample_prices
-        }
+        return {"genre_id": genre_id, "genre_name": genre.name, **summary}
 
     def calculate_average_stock_all(self) -> Dict[str, Any]:
         """
@@ -107,57 +174,117 @@ class BookService(IBookService):
         """
         logger.info("Calculating average stock for all books")
 
-        all_books = self.book_repo.get_all()
-        books_with_stock = [book for book in all_books if book.stock_number is not None]
-
-        if not books_with_stock:
-            return {
-                "total_books": len(all_books),
-                "books_with_stock": 0,
-                "average_stock": 0,
-            }
-
-        total_stock = sum(book.stock_number for book in books_with_stock)
-        average = round(total_stock / len(books_with_stock), 0)
+        if self.analytics:
+            summary = self.analytics.stock_summary()
+        else:
+            summary = stock_summary(self.book_repo.get_all())
 
-        logger.info(f"Average calculated on {len(books_with_stock)} valid stocks out of {len(all_books)}")
+        logger.info(
+            "Average calculated on %s valid stocks out of %s", summary["books_with_stock"], summary["total_books"]
+        )
 
         return {
-            "total_books": len(all_books),
-            "books_with_stock": len(books_with_stock),
-            "average_stock": int(average),
+            "total_books": summary["total_books"],
+            "books_with_stock": summary["books_with_stock"],
+            "average_stock": summary["average_stock"],
         }
 
     def calculate_average_stock_by_genre(self, genre_id: int) -> Dict[str, Any]:
         """
         Calculate average stock for books in specific genre.
         """
-        logger.info(f"Calculating average stock for genre ID: {genre_id}")
+        logger.info("Calculating average stock for genre ID: %s", genre_id)
 
         # Get genre info
         genre = self.genre_repo.get_by_id(genre_id)
         if not genre:
-            raise ValueError("Genre not found")
+            raise GenreNotFoundError(genre_id)
+
+        if self.analytics:
+            summary = self.analytics.stock_summary(genre_id)
+        else:
+            summary = stock_summary(self.book_repo.get_by_genre_id(genre_id))
+
+        logger.info(
+            "Genre %s (%s) → %s valid stocks out of %s books",
+            genre.name, genre_id, summary["books_with_stock"], summary["total_books"]
+        )
+
+        return {"genre_id": genre_id, "genre_name": genre.name, **summary}
 
-        # Get books for this genre
-        books = self.book_repo.get_by_genre_id(genre_id)
-        books_with_stock = [book for book in books if book.stock_number is not None]
+    def calculate_histogram(self, column: str, bins: int = 10, genre_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Distribution of a numeric column, for all books or one genre.
+        Books without a value for the column are left out.
+        """
+        logger.info("Calculating %s-bin histogram of %s for genre ID: %s", bins, column, genre_id)
+
+        if column not in ANALYTICS_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+        if genre_id is not None and not self.genre_repo.get_by_id(genre_id):
+            raise GenreNotFoundError(genre_id)
 
-        if not books_with_stock:
-            average = 0
-            sample_stocks = []
+        if self.analytics:
+            result = self.analytics.histogram(column, bins, genre_id)
         else:
-            total_stock = sum(book.stock_number for book in books_with_stock)
-            average = round(total_stock / len(books_with_stock), 0)
-            sample_stocks = [book.stock_number for book in books_with_stock[:10]]
+            books = self.book_repo.get_all() if genre_id is None else self.book_repo.get_by_genre_id(genre_id)
+            values = [float(getattr(book, column)) for book in books if getattr(book, column) is not None]
+            result = histogram(values, bins)
+
+        return {"column": column, "genre_id": genre_id, **result}
+
+    def calculate_percentiles(
+        self,
+        column: str,
+        percents: Sequence[float],
+        genre_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Percentiles (0-100) of a numeric column, for all books or one genre.
+        Books without a value for the column are left out.
+        """
+        logger.info("Calculating percentiles %s of %s for genre ID: %s", list(percents), column, genre_id)
 
-        logger.info(f"Genre {genre.name} ({genre_id}) → {len(books_with_stock)} valid stocks out of {len(books)} books")
+        if column not in ANALYTICS_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+        if not percents or any(not 0 <= percent <= 100 for percent in percents):
+            raise ValueError("Percentiles must be between 0 and 100")
+        if genre_id is not None and not self.genre_repo.get_by_id(genre_id):
+            raise GenreNotFoundError(genre_id)
+
+        if self.analytics:
+            result = self.analytics.percentiles(column, percents, genre_id)
+        else:
+            books = self.book_repo.get_all() if genre_id is None else self.book_repo.get_by_genre_id(genre_id)
+            values = [float(getattr(book, column)) for book in books if getattr(book, column) is not None]
+            result = percentiles(values, percents)
 
         return {
+            "column": column,
             "genre_id": genre_id,
-            "genre_name": genre.name,
-            "total_books": len(books),
-            "books_with_stock": len(books_with_stock),
-            "average_stock": int(average),
-            "sample_stocks": sample_stocks
-        }
\ No newline at end of file
+            "count": result["count"],
+            "percentiles": {f"p{percent:g}": value for percent, value in zip(percents, result["values"])},
+        }
+
+    def calculate_genre_summary(self) -> List[Dict[str, Any]]:
+        """Book count, average price and average stock of every genre (a GROUP BY genre)."""
+        logger.info("Calculating per-genre summary")
+
+        if self.analytics:
+            summaries = self.analytics.genre_summary()
+        else:
+            summaries = genre_summary(self.book_repo.get_all())
+
+        names = {genre.id: genre.name for genre in self.genre_repo.get_all()}
+        return [{"genre_name": names.get(summary["genre_id"]), **summary} for summary in summaries]
+
+    def count_books(self, criteria: BookCriteria) -> int:
+        """Count the books matching every filter of the criteria."""
+        logger.info("Counting books matching %s", criteria)
+
+        if self.analytics:
+            return self.analytics.count(criteria)
+
+        genre_id = criteria.genre_id
+        books = self.book_repo.get_all() if genre_id is None else self.book_repo.get_by_genre_id(genre_id)
+        return sum(1 for book in books if matches_filters(book, criteria))
@@ -0,0 +1,139 @@
+"""
+Statistics over lists of books.
+Pure functions shared by the sync and async book services.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence
+
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_criteria import BookCriteria
+
+SAMPLE_SIZE = 10
+
+
+def price_summary(books: List[Book]) -> Dict[str, Any]:
+    """
+    Average taxed price of the books that have a valid price.
+    Business logic: only count books with valid prices.
+    """
+    books_with_price = [book for book in books if book.has_valid_price()]
+
+    if not books_with_price:
+        return {
+            "total_books": len(books),
+            "books_with_price": 0,
+            "average_price": 0.0,
+            "sample_prices": [],
+        }
+
+    total_price = sum(float(book.price_taxed) for book in books_with_price)
+    return {
+        "total_books": len(books),
+        "books_with_price": len(books_with_price),
+        "average_price": round(total_price / len(books_with_price), 2),
+        "sample_prices": [float(book.price_taxed) for book in books_with_price[:SAMPLE_SIZE]],
+    }
+
+
+def stock_summary(books: List[Book]) -> Dict[str, Any]:
+    """Average stock of the books that have a stock number."""
+    books_with_stock = [book for book in books if book.stock_number is not None]
+
+    if not books_with_stock:
+        return {
+            "total_books": len(books),
+            "books_with_stock": 0,
+            "average_stock": 0,
+            "sample_stocks": [],
+        }
+
+    total_stock = sum(book.stock_number for book in books_with_stock)
+    return {
+        "total_books": len(books),
+        "books_with_stock": len(books_with_stock),
+        "average_stock": int(round(total_stock / len(books_with_stock), 0)),
+        "sample_stocks": [book.stock_number for book in books_with_stock[:SAMPLE_SIZE]],
+    }
+
+
+def histogram(values: List[float], bins: int = 10) -> Dict[str, Any]:
+    """
+    Equal-width histogram, same bin edges as `numpy.histogram`.
+    The last bin includes its right edge.
+    """
+    if values:
+        low, high = min(values), max(values)
+    else:
+        low, high = 0.0, 1.0
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+
+    width = (high - low) / bins
+    counts = [0] * bins
+    for value in values:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+
+    return {
+        "edges": [low + i * width for i in range(bins)] + [high],
+        "counts": counts,
+    }
+
+
+def percentiles(values: List[float], percents: Sequence[float]) -> Dict[str, Any]:
+    """
+    Percentiles with linear interpolation between the closest ranks,
+    as `numpy.percentile` and DuckDB's `quantile_cont` compute them.
+    """
+    ordered = sorted(values)
+    results = []
+    for percent in percents:
+        if not ordered:
+            results.append(None)
+            continue
+        position = (len(ordered) - 1) * percent / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        results.append(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower))
+    return {"count": len(ordered), "values": results}
+
+
+def genre_summary(books: List[Book]) -> List[Dict[str, Any]]:
+    """Price and stock summary of each genre, ordered by genre ID. Books without a genre are left out."""
+    by_genre: Dict[int, List[Book]] = defaultdict(list)
+    for book in books:
+        if book.genre_id is not None:
+            by_genre[book.genre_id].append(book)
+
+    summaries = []
+    for genre_id in sorted(by_genre):
+        prices = price_summary(by_genre[genre_id])
+        stocks = stock_summary(by_genre[genre_id])
+        summaries.append({
+            "genre_id": genre_id,
+            "total_books": prices["total_books"],
+            "books_with_price": prices["books_with_price"],
+            "average_price": prices["average_price"],
+            "books_with_stock": stocks["books_with_stock"],
+            "average_stock": stocks["average_stock"],
+        })
+    return summaries
+
+
+def matches_filters(book: Book, criteria: BookCriteria) -> bool:
+    """Whether a book passes every filter of the criteria, as the SQL and analytics backends apply them."""
+    if criteria.genre_id is not None and book.genre_id != criteria.genre_id:
+        return False
+    if criteria.min_price is not None or criteria.max_price is not None:
+        if not book.has_valid_price():
+            return False
+        if criteria.min_price is not None and book.price_taxed < criteria.min_price:
+            return False
+        if criteria.max_price is not None and book.price_taxed > criteria.max_price:
+            return False
+    if criteria.min_rating is not None and (book.note is None or book.note < criteria.min_rating):
+        return False
+    if criteria.in_stock is not None and book.is_in_stock() != criteria.in_stock:
+        return False
+    if criteria.min_reviews is not None and (book.review_number is None or book.review_number < criteria.min_reviews):
+        return False
+    return True
@@ -0,0 +1,35 @@
+"""
+Ordering and top-k selection over books already in memory.
+Same order as the repositories' ORDER BY ... LIMIT, for lists that are already loaded (e.g. cached).
+"""
+import heapq
+from typing import List, Optional
+
+from book_api.domain.entities.book import Book
+from book_api.domain.value_objects.book_sort import BookSort
+
+
+def rank_books(books: List[Book], sort: Optional[BookSort] = None, limit: Optional[int] = None) -> List[Book]:
+    """
+    Order books by `sort` (by ID when None) and keep the first `limit`.
+    With a limit, a heap keeps only k candidates: O(n log k) instead of sorting the whole list.
+    """
+    if sort is None:
+        candidates = books
+        key = _by_id
+        descending = False
+    else:
+        attribute = sort.attribute
+        candidates = [book for book in books if getattr(book, attribute) is not None]
+        key = lambda book: (getattr(book, attribute), book.id)  # noqa: E731
+        descending = sort.descending
+
+    if limit is None:
+        return sorted(candidates, key=key, reverse=descending)
+    if descending:
+        return heapq.nlargest(limit, candidates, key=key)
+    return heapq.nsmallest(limit, candidates, key=key)
+
+
+def _by_id(book: Book) -> int:
+    return book.id
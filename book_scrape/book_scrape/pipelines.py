@@ -13,6 +13,11 @@ class SQLitePipeline:
         self.conn = sqlite3.connect('books.db')
         self.cursor = self.conn.cursor()
 
+        # WAL : l'API peut continuer à lire pendant que le crawl écrit
+        self.cursor.execute('PRAGMA journal_mode = WAL')
+        self.cursor.execute('PRAGMA synchronous = NORMAL')
+        self.cursor.execute('PRAGMA busy_timeout = 5000')
+
         # Table des genres (unique)
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS books_genres (
@@ -40,6 +45,15 @@ class SQLitePipeline:
             )
         ''')
 
+        # Version du jeu de données, lue par l'API pour invalider ses caches
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dataset_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL,
+                updated_at TEXT
+            )
+        ''')
+
     def process_item(self, item, spider):
         # Insérer le genre s’il n’existe pas
         self.cursor.execute('''
@@ -73,4 +87,13 @@ class SQLitePipeline:
         return item
 
     def close_spider(self, spider):
-        self
\ No newline at end of file
+        # Publier une nouvelle version du jeu de données à la fin du crawl
+        self.cursor.execute('''
+            INSERT INTO dataset_version (id, version, updated_at)
+            VALUES (1, 1, datetime('now'))
+            ON CONFLICT(id) DO UPDATE SET
+                version = version + 1,
+                updated_at = excluded.updated_at
+        ''')
+        self.conn.commit()
+        self.conn.close()
@@ -1,5 +1,20 @@
-import uvicorn
+"""
+Launch the API.
+
+    python run_api.py                     # one process, auto-reload (development)
+    python run_api.py --workers 4         # one process per core, no reload
+
+With several workers the NumPy analytics snapshot is published to a directory and
+memory-mapped by every worker, so the catalog is held once in the page cache
+instead of once per process, and the per-worker cache stops keeping lists of books.
+BOOK_API_ANALYTICS_BACKEND / BOOK_API_SNAPSHOT_DIR / BOOK_API_CACHE_BOOK_LISTS
+still win when they are set.
+"""
+import argparse
 import logging
+import os
+
+import uvicorn
 
 # Configuration du logger
 logging.basicConfig(
@@ -7,11 +22,43 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-if __name__ == "__main__":
+DEFAULT_SNAPSHOT_DIR = "./book_api/app/snapshots"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes, 0 = one per core")
+    parser.add_argument("--no-reload", action="store_true", help="disable auto-reload of the single worker")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    if workers == 1:
+        uvicorn.run(
+            "book_api.main:create_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            reload=not args.no_reload,
+            log_level="info"
+        )
+        return
+
+    # Inherited by the workers: each one builds its app once from create_app and maps the shared snapshot
+    os.environ.setdefault("BOOK_API_ANALYTICS_BACKEND", "numpy")
+    os.environ.setdefault("BOOK_API_SNAPSHOT_DIR", DEFAULT_SNAPSHOT_DIR)
+    os.environ.setdefault("BOOK_API_CACHE_BOOK_LISTS", "0")
+    logging.info("Starting %s workers, catalog snapshot in %s", workers, os.environ["BOOK_API_SNAPSHOT_DIR"])
     uvicorn.run(
-        "book_api.main:app",
-        host="0.0.0.0",
-        port=8010,
-        reload=True,
+        "book_api.main:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=workers,
         log_level="info"
-    )
\ No newline at end of file
+    )
+
+
+if __name__ == "__main__":
+    main()